@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Barrido de Parámetros de la Simulación de Propagación de Enfermedad
+===================================================================
+
+Explora una grilla de valores (infection_prob, recovery_prob, initial_infected,
+grid_size) sin editar las variables globales de `simulacion_enfermedad.py`.
+
+- Las realizaciones se ejecutan en paralelo en un pool de procesos.
+- El historial S/I/R de cada realización se guarda en una caché en disco indexada
+  por parámetros y semilla: al ampliar un barrido solo se calculan las celdas nuevas.
+- Se generan tablas de diagrama de fases con el pico de infección, el paso del
+  pico y la tasa de ataque final.
+
+Uso:
+    python barrido_parametros.py --infection-probs 0.1,0.2,0.3,0.5 \\
+        --recovery-probs 0.05,0.1,0.2 --runs 20 --output-dir barrido
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import simulacion_enfermedad as sim
+
+DEFAULT_CACHE_DIR = "cache_barrido"
+
+# Versión del motor incluida en las claves de caché: incrementarla cuando un cambio
+# en `simulacion_enfermedad.py` altere los resultados invalida las entradas viejas
+CACHE_VERSION = 1
+
+# Métricas de los diagramas de fases: (clave, descripción)
+PHASE_METRICS = (
+    ("peak_infection", "Pico de infección (fracción de la población)"),
+    ("time_to_peak", "Paso del pico de infección"),
+    ("final_attack_rate", "Tasa de ataque final"),
+)
+
+def build_sweep_grid(infection_probs, recovery_probs, initial_infected_values, grid_sizes):
+    """
+    Construye todas las combinaciones de parámetros del barrido
+
+    Returns:
+        Lista de diccionarios con infection_prob, recovery_prob, initial_infected y grid_size
+    """
+    return [
+        {"infection_prob": float(p_inf), "recovery_prob": float(p_rec),
+         "initial_infected": int(n_inf), "grid_size": int(size)}
+        for p_inf, p_rec, n_inf, size in itertools.product(
+            infection_probs, recovery_probs, initial_infected_values, grid_sizes)
+    ]
+
+def cache_key(params, seed):
+    """
+    Clave de caché de una realización: hash de los parámetros (ordenados), la
+    semilla y `CACHE_VERSION`
+
+    Args:
+        params: Diccionario de parámetros (incluye steps y engine)
+        seed: Semilla entera de la realización
+
+    Returns:
+        Cadena hexadecimal
+    """
+    payload = json.dumps({"params": params, "seed": int(seed), "version": CACHE_VERSION},
+                         sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def cache_path(cache_dir, key):
+    """Ruta del archivo de caché de una clave (subdirectorios por prefijo)"""
+    return os.path.join(cache_dir, key[:2], key + ".npy")
+
+def load_cached_history(cache_dir, key):
+    """Devuelve el historial guardado en caché, o None si no existe"""
+    path = cache_path(cache_dir, key)
+    if os.path.exists(path):
+        return np.load(path)
+    return None
+
+def store_cached_history(cache_dir, key, history):
+    """Guarda un historial en la caché (escritura atómica)"""
+    path = cache_path(cache_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, history.astype(np.int32))
+    os.replace(tmp_path, path)
+
+def _run_cell(task):
+    """
+    Ejecuta una realización del barrido dentro de un proceso trabajador
+
+    Args:
+        task: Tupla (clave, parámetros, semilla)
+
+    Returns:
+        (clave, historial (3, pasos ejecutados))
+    """
+    key, params, seed = task
+    return key, sim.run_simulation(seed=seed, **params)
+
+def summarize_histories(histories, grid_size):
+    """
+    Calcula las métricas de fase promediadas sobre las realizaciones de una celda
+
+    Args:
+        histories: Lista de historiales (3, n)
+        grid_size: Tamaño de la grilla de la celda
+
+    Returns:
+        Diccionario {métrica: valor medio}
+    """
+    total_population = grid_size ** 2
+    peaks = [h[1].max() / total_population for h in histories]
+    times = [int(h[1].argmax()) for h in histories]
+    attack = [(total_population - h[0, -1]) / total_population for h in histories]
+    return {
+        "peak_infection": float(np.mean(peaks)),
+        "time_to_peak": float(np.mean(times)),
+        "final_attack_rate": float(np.mean(attack)),
+    }
+
+def run_sweep(cells, runs_per_cell=10, steps=None, seed=0, engine="vectorized",
+              workers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Ejecuta el barrido completo reutilizando la caché en disco
+
+    La semilla de la réplica r de cualquier celda es `seed + r`, de modo que ampliar
+    la grilla de parámetros o el número de réplicas no invalida lo ya calculado.
+
+    Args:
+        cells: Lista de parámetros (ver `build_sweep_grid`)
+        runs_per_cell: Réplicas por celda
+        steps: Pasos máximos de simulación (por defecto `sim.steps`)
+        seed: Semilla base
+        engine: Motor de actualización
+        workers: Número de procesos (None = todos los núcleos, 1 = sin pool)
+        cache_dir: Directorio de la caché
+
+    Returns:
+        Lista de diccionarios (parámetros de la celda + métricas de fase)
+    """
+    steps = sim.steps if steps is None else steps
+    histories = {}
+    pending = []
+
+    for cell in cells:
+        params = dict(cell, steps=steps, engine=engine)
+        for replica in range(runs_per_cell):
+            key = cache_key(params, seed + replica)
+            if key in histories:
+                continue
+            cached = load_cached_history(cache_dir, key)
+            if cached is not None:
+                histories[key] = cached
+            else:
+                histories[key] = None
+                pending.append((key, params, seed + replica))
+
+    print(f"🗂️  {len(histories) - len(pending)} realizaciones en caché, {len(pending)} por calcular")
+
+    if pending:
+        if workers == 1:
+            for task in pending:
+                key, history = _run_cell(task)
+                store_cached_history(cache_dir, key, history)
+                histories[key] = history
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_run_cell, task) for task in pending]
+                for done, future in enumerate(as_completed(futures), 1):
+                    key, history = future.result()
+                    store_cached_history(cache_dir, key, history)
+                    histories[key] = history
+                    if done % 50 == 0:
+                        print(f"   {done}/{len(pending)} realizaciones completadas")
+
+    results = []
+    for cell in cells:
+        params = dict(cell, steps=steps, engine=engine)
+        cell_histories = [histories[cache_key(params, seed + r)] for r in range(runs_per_cell)]
+        results.append(dict(cell, **summarize_histories(cell_histories, cell["grid_size"])))
+    return results
+
+def phase_tables(results, metric):
+    """
+    Organiza una métrica como tablas de fase infection_prob x recovery_prob
+
+    Se genera una tabla por cada combinación (initial_infected, grid_size).
+
+    Args:
+        results: Salida de `run_sweep`
+        metric: Nombre de la métrica (ver `PHASE_METRICS`)
+
+    Returns:
+        Diccionario {(initial_infected, grid_size): (infection_probs, recovery_probs, tabla)}
+    """
+    tables = {}
+    groups = sorted({(r["initial_infected"], r["grid_size"]) for r in results})
+    for group in groups:
+        rows = [r for r in results if (r["initial_infected"], r["grid_size"]) == group]
+        infection_probs = sorted({r["infection_prob"] for r in rows})
+        recovery_probs = sorted({r["recovery_prob"] for r in rows})
+        table = np.full((len(infection_probs), len(recovery_probs)), np.nan)
+        for r in rows:
+            table[infection_probs.index(r["infection_prob"]),
+                  recovery_probs.index(r["recovery_prob"])] = r[metric]
+        tables[group] = (infection_probs, recovery_probs, table)
+    return tables
+
+def print_phase_tables(results):
+    """Muestra en consola las tablas de fase de todas las métricas"""
+    for metric, description in PHASE_METRICS:
+        for (n_inf, size), (p_infs, p_recs, table) in phase_tables(results, metric).items():
+            print(f"\n📋 {description} — initial_infected={n_inf}, grid_size={size}")
+            print("p_inf \\ p_rec " + "".join(f"{p:>10.3f}" for p in p_recs))
+            for p_inf, row in zip(p_infs, table):
+                print(f"{p_inf:>13.3f} " + "".join(f"{v:>10.3f}" for v in row))
+
+def save_phase_tables(results, output_dir):
+    """
+    Guarda una tabla CSV por métrica y grupo, más un CSV largo con todas las celdas
+
+    Args:
+        results: Salida de `run_sweep`
+        output_dir: Directorio de salida
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    columns = ["infection_prob", "recovery_prob", "initial_infected", "grid_size"] + \
+              [metric for metric, _ in PHASE_METRICS]
+    with open(os.path.join(output_dir, "barrido.csv"), "w", encoding="utf-8") as f:
+        f.write(",".join(columns) + "\n")
+        for r in results:
+            f.write(",".join(str(r[c]) for c in columns) + "\n")
+
+    for metric, _ in PHASE_METRICS:
+        for (n_inf, size), (p_infs, p_recs, table) in phase_tables(results, metric).items():
+            path = os.path.join(output_dir, f"fase_{metric}_i{n_inf}_g{size}.csv")
+            data = np.column_stack([p_infs, table])
+            header = "infection_prob," + ",".join(f"rec_{p}" for p in p_recs)
+            np.savetxt(path, data, delimiter=",", header=header, comments="", fmt="%.6g")
+
+    print(f"\n💾 Tablas de fase guardadas en {output_dir}")
+
+def _parse_values(text, cast):
+    """Convierte '0.1,0.2,0.3' en una lista de valores"""
+    return [cast(value) for value in text.split(",") if value.strip()]
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Barrido de parámetros de la simulación SIR")
+    parser.add_argument("--infection-probs", default="0.1,0.2,0.3,0.5,0.7")
+    parser.add_argument("--recovery-probs", default="0.05,0.1,0.2,0.3")
+    parser.add_argument("--initial-infected", default=str(sim.initial_infected))
+    parser.add_argument("--grid-sizes", default=str(sim.grid_size))
+    parser.add_argument("--runs", type=int, default=10, help="Réplicas por celda")
+    parser.add_argument("--steps", type=int, default=sim.steps)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", choices=sim.ENGINE_NAMES, default="vectorized")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--output-dir", help="Directorio donde guardar las tablas CSV")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    args = build_parser().parse_args(argv)
+
+    print("=" * 80)
+    print("🦠 BARRIDO DE PARÁMETROS - PROPAGACIÓN DE ENFERMEDAD")
+    print("=" * 80)
+
+    cells = build_sweep_grid(_parse_values(args.infection_probs, float),
+                             _parse_values(args.recovery_probs, float),
+                             _parse_values(args.initial_infected, int),
+                             _parse_values(args.grid_sizes, int))
+    print(f"📊 {len(cells)} celdas x {args.runs} réplicas")
+
+    results = run_sweep(cells, runs_per_cell=args.runs, steps=args.steps, seed=args.seed,
+                        engine=args.engine, workers=args.workers, cache_dir=args.cache_dir)
+    print_phase_tables(results)
+
+    if args.output_dir:
+        save_phase_tables(results, args.output_dir)
+
+if __name__ == "__main__":
+    main()
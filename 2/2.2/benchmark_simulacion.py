@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de los Motores del Autómata Celular SIR
+=================================================
+
+Mide, para cada motor de `simulacion_enfermedad.ENGINE_NAMES`, cuántos pasos por
+segundo logra y cuánta memoria pico usa en función del tamaño de la grilla
+(50 a 4000) y de la prevalencia (fracción de infectados). Cada paso medido
+incluye la actualización y el conteo S/I/R, igual que `run_simulation`.
+
+El resultado se guarda como JSON; con `--compare` se contrasta con un reporte
+anterior y se marcan las regresiones del camino crítico.
+
+Uso:
+    python benchmark_simulacion.py --output benchmark.json
+    python benchmark_simulacion.py --output nuevo.json --compare benchmark.json
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+import simulacion_enfermedad as sim
+
+DEFAULT_SIZES = (50, 100, 250, 500, 1000, 2000, 4000)
+DEFAULT_PREVALENCES = (0.001, 0.01, 0.1)
+
+def make_benchmark_grid(size, prevalence, rng):
+    """
+    Grilla de prueba con una fracción `prevalence` de infectados y 10% de recuperados
+
+    Args:
+        size: Tamaño de la grilla
+        prevalence: Fracción de celdas infectadas
+        rng: Generador (`np.random.Generator`)
+
+    Returns:
+        Grilla uint8
+    """
+    uniform = rng.random((size, size))
+    grid = np.full((size, size), sim.SUSCEPTIBLE, dtype=np.uint8)
+    grid[uniform < prevalence] = sim.INFECTED
+    grid[(uniform >= prevalence) & (uniform < prevalence + 0.1)] = sim.RECOVERED
+    return grid
+
+def _time_window(engine, base_grid, window, rng):
+    """
+    Cronometra `window` pasos (actualización + conteo, como en `run_simulation`)
+    partiendo de una copia de la grilla base
+
+    La construcción del motor queda fuera de la medición.
+
+    Returns:
+        (segundos, conteos al final de la ventana)
+    """
+    grid = base_grid.copy()
+    step_function, count_states = sim.create_engine(engine, grid)
+    start = time.perf_counter()
+    for _ in range(window):
+        grid = step_function(grid, sim.infection_prob, sim.recovery_prob, rng=rng)
+        counts = count_states(grid)
+    return time.perf_counter() - start, counts
+
+def benchmark_case(engine, size, prevalence, window=3, min_time=0.5, seed=0):
+    """
+    Mide un caso (motor, tamaño, prevalencia)
+
+    La epidemia crece rápidamente, así que se cronometran ventanas cortas de
+    `window` pasos que siempre parten de la misma grilla base; de este modo la
+    prevalencia medida se mantiene cerca de la nominal. El tiempo se mide sin
+    trazado de memoria; la memoria pico se mide aparte con `tracemalloc`
+    durante una ventana (incluye la construcción del motor).
+
+    Args:
+        engine: Nombre del motor
+        size: Tamaño de la grilla
+        prevalence: Fracción inicial de infectados
+        window: Pasos por ventana cronometrada
+        min_time: Tiempo mínimo de medición en segundos
+        seed: Semilla
+
+    Returns:
+        Diccionario con steps_per_second, cells_per_second y peak_memory_mb
+    """
+    rng = np.random.default_rng(seed)
+    base_grid = make_benchmark_grid(size, prevalence, rng)
+
+    # Calentamiento
+    _time_window(engine, base_grid, 1, rng)
+
+    elapsed, num_steps, infected = 0.0, 0, []
+    while elapsed < min_time or num_steps == 0:
+        seconds, counts = _time_window(engine, base_grid, window, rng)
+        elapsed += seconds
+        num_steps += window
+        infected.append(counts[1])
+
+    tracemalloc.start()
+    _time_window(engine, base_grid, window, rng)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    steps_per_second = num_steps / elapsed
+    return {
+        "engine": engine,
+        "size": size,
+        "prevalence": prevalence,
+        "measured_prevalence": float(np.mean(infected)) / (size * size),
+        "steps": num_steps,
+        "seconds": elapsed,
+        "steps_per_second": steps_per_second,
+        "cells_per_second": steps_per_second * size * size,
+        "peak_memory_mb": (peak + base_grid.nbytes) / 2 ** 20,
+    }
+
+def run_benchmark(engines=None, sizes=DEFAULT_SIZES, prevalences=DEFAULT_PREVALENCES,
+                  max_loop_size=100, min_time=0.5, seed=0):
+    """
+    Ejecuta todos los casos del benchmark
+
+    Args:
+        engines: Motores a medir (por defecto todos)
+        sizes: Tamaños de grilla
+        prevalences: Fracciones de infectados
+        max_loop_size: Tamaño máximo para el motor "loop" (celda por celda)
+        min_time: Tiempo mínimo de medición por caso
+        seed: Semilla
+
+    Returns:
+        Reporte (diccionario serializable a JSON)
+    """
+    engines = sim.ENGINE_NAMES if engines is None else engines
+    results = []
+    for engine in engines:
+        for size in sizes:
+            if engine == "loop" and size > max_loop_size:
+                continue
+            for prevalence in prevalences:
+                case = benchmark_case(engine, size, prevalence, min_time=min_time, seed=seed)
+                results.append(case)
+                print(f"{engine:>10s} {size:5d}x{size:<5d} prev={prevalence:<6g} "
+                      f"{case['steps_per_second']:10.2f} pasos/s "
+                      f"{case['cells_per_second'] / 1e6:9.2f} Mceldas/s "
+                      f"{case['peak_memory_mb']:9.1f} MB")
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "results": results,
+    }
+
+def compare_reports(current, previous, threshold=0.10):
+    """
+    Compara dos reportes y lista los casos más lentos que el anterior
+
+    Args:
+        current: Reporte nuevo
+        previous: Reporte de referencia
+        threshold: Pérdida relativa de pasos/s que se considera regresión
+
+    Returns:
+        Lista de regresiones (diccionarios con el caso y la razón nuevo/anterior)
+    """
+    key = lambda r: (r["engine"], r["size"], r["prevalence"])
+    reference = {key(r): r for r in previous["results"]}
+    regressions = []
+
+    print("\n📊 Comparación con el reporte anterior (pasos/s nuevo / anterior):")
+    for result in current["results"]:
+        old = reference.get(key(result))
+        if old is None:
+            continue
+        ratio = result["steps_per_second"] / old["steps_per_second"]
+        flag = ""
+        if ratio < 1 - threshold:
+            flag = "  ⚠️ regresión"
+            regressions.append({"engine": result["engine"], "size": result["size"],
+                                "prevalence": result["prevalence"], "ratio": ratio})
+        print(f"{result['engine']:>10s} {result['size']:5d} prev={result['prevalence']:<6g} "
+              f"x{ratio:5.2f}{flag}")
+    return regressions
+
+def _parse_values(text, cast):
+    """Convierte '50,100,250' en una lista de valores"""
+    return [cast(value) for value in text.split(",") if value.strip()]
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmark de los motores del autómata SIR")
+    parser.add_argument("--engines", default=",".join(sim.ENGINE_NAMES))
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--prevalences", default=",".join(map(str, DEFAULT_PREVALENCES)))
+    parser.add_argument("--max-loop-size", type=int, default=100,
+                        help="Tamaño máximo para el motor de referencia 'loop'")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Segundos mínimos por caso")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_simulacion.json")
+    parser.add_argument("--compare", help="Reporte JSON anterior para detectar regresiones")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Pérdida relativa de pasos/s considerada regresión")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    args = build_parser().parse_args(argv)
+
+    print("=" * 80)
+    print("⏱️  BENCHMARK - MOTORES DEL AUTÓMATA CELULAR SIR")
+    print("=" * 80)
+
+    report = run_benchmark(engines=_parse_values(args.engines, str),
+                           sizes=_parse_values(args.sizes, int),
+                           prevalences=_parse_values(args.prevalences, float),
+                           max_loop_size=args.max_loop_size, min_time=args.min_time,
+                           seed=args.seed)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        report["regressions"] = compare_reports(report, previous, args.threshold)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Reporte guardado en {args.output}")
+
+    if report.get("regressions"):
+        print(f"⚠️  {len(report['regressions'])} casos con regresión")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
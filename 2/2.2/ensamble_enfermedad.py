@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Ensamble de Simulaciones de Propagación de Enfermedad
+=====================================================
+
+Ejecuta cientos de realizaciones independientes (con semillas reproducibles)
+del autómata celular de `simulacion_enfermedad.py` repartidas en un pool de
+procesos, y resume los historiales S/I/R en curvas media y bandas de percentiles.
+
+Cada proceso trabajador recibe los parámetros de forma explícita y devuelve solo
+su historial de conteos (3 x pasos), nunca la grilla completa.
+
+Uso:
+    python ensamble_enfermedad.py --runs 200 --infection-prob 0.3 --recovery-prob 0.1
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import simulacion_enfermedad as sim
+
+STATE_NAMES = ("S", "I", "R")
+
+def pad_history(history, steps):
+    """
+    Extiende un historial terminado antes de tiempo hasta `steps` pasos
+
+    Cuando ya no quedan infectados el estado no cambia, así que se repite el
+    último conteo.
+
+    Args:
+        history: Arreglo (3, n) con los conteos S, I, R
+        steps: Longitud deseada
+
+    Returns:
+        Arreglo (3, steps)
+    """
+    if history.shape[1] >= steps:
+        return history[:, :steps]
+    padding = np.repeat(history[:, -1:], steps - history.shape[1], axis=1)
+    return np.concatenate([history, padding], axis=1)
+
+def _run_member(task):
+    """
+    Ejecuta una realización del ensamble dentro de un proceso trabajador
+
+    Args:
+        task: Tupla (índice, parámetros, semilla)
+
+    Returns:
+        (índice, historial compacto de tamaño (3, steps) en int32)
+    """
+    index, params, seed = task
+    history = sim.run_simulation(seed=seed, **params)
+    return index, pad_history(history, params["steps"]).astype(np.int32)
+
+def run_ensemble(num_runs, grid_size=None, infection_prob=None, recovery_prob=None,
+                 initial_infected=None, steps=None, seed=0, engine="vectorized",
+                 workers=None, percentiles=(5, 50, 95)):
+    """
+    Ejecuta un ensamble de realizaciones en paralelo y calcula bandas de confianza
+
+    Los parámetros que no se indiquen toman el valor global de `simulacion_enfermedad`.
+    Las semillas de cada realización se derivan de `seed` con `np.random.SeedSequence`,
+    por lo que el resultado no depende del número de procesos.
+
+    Args:
+        num_runs: Número de realizaciones
+        grid_size, infection_prob, recovery_prob, initial_infected, steps: Parámetros del modelo
+        seed: Semilla base del ensamble
+        engine: Motor de actualización (ver `sim.ENGINE_NAMES`)
+        workers: Número de procesos (None = todos los núcleos, 1 = sin pool)
+        percentiles: Percentiles a calcular para las bandas
+
+    Returns:
+        Diccionario con los parámetros, `mean` y `std` (3, steps), `percentiles`
+        ({p: (3, steps)}), y por realización `peak_infected`, `time_to_peak`
+        y `final_attack_rate`
+    """
+    params = {
+        "grid_size": sim.grid_size if grid_size is None else grid_size,
+        "infection_prob": sim.infection_prob if infection_prob is None else infection_prob,
+        "recovery_prob": sim.recovery_prob if recovery_prob is None else recovery_prob,
+        "initial_infected": sim.initial_infected if initial_infected is None else initial_infected,
+        "steps": sim.steps if steps is None else steps,
+        "engine": engine,
+    }
+    seeds = np.random.SeedSequence(seed).spawn(num_runs)
+    tasks = [(k, params, seeds[k]) for k in range(num_runs)]
+
+    # Solo se guardan los conteos compactos de cada realización
+    histories = np.empty((num_runs, 3, params["steps"]), dtype=np.int32)
+
+    if workers == 1:
+        results = map(_run_member, tasks)
+        for index, history in results:
+            histories[index] = history
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, num_runs // (4 * (workers or os.cpu_count() or 1)))
+            for index, history in executor.map(_run_member, tasks, chunksize=chunksize):
+                histories[index] = history
+
+    return summarize_ensemble(histories, params, percentiles)
+
+def summarize_ensemble(histories, params, percentiles=(5, 50, 95)):
+    """
+    Reduce los historiales de un ensamble a curvas media y bandas de percentiles
+
+    Args:
+        histories: Arreglo (realizaciones, 3, pasos) de conteos
+        params: Parámetros del modelo usados
+        percentiles: Percentiles a calcular
+
+    Returns:
+        Diccionario de resultados (ver `run_ensemble`)
+    """
+    total_population = params["grid_size"] ** 2
+    infected = histories[:, 1, :]
+
+    return {
+        "params": dict(params),
+        "num_runs": histories.shape[0],
+        "mean": histories.mean(axis=0),
+        "std": histories.std(axis=0),
+        "percentiles": {p: np.percentile(histories, p, axis=0) for p in percentiles},
+        "peak_infected": infected.max(axis=1),
+        "time_to_peak": infected.argmax(axis=1),
+        "final_attack_rate": (total_population - histories[:, 0, -1]) / total_population,
+    }
+
+def print_ensemble_summary(result):
+    """Muestra un resumen del ensamble en consola"""
+    params = result["params"]
+    print(f"\n📊 Ensamble de {result['num_runs']} realizaciones "
+          f"({params['grid_size']}x{params['grid_size']}, "
+          f"p_inf={params['infection_prob']}, p_rec={params['recovery_prob']})")
+
+    for name, values in (("Pico de infectados", result["peak_infected"]),
+                         ("Paso del pico", result["time_to_peak"]),
+                         ("Tasa de ataque final", result["final_attack_rate"])):
+        low, median, high = np.percentile(values, [5, 50, 95])
+        print(f"   • {name}: media={np.mean(values):.3f}, "
+              f"mediana={median:.3f}, P5-P95=[{low:.3f}, {high:.3f}]")
+
+def save_ensemble(result, path):
+    """
+    Guarda las curvas del ensamble en un archivo .npz (o .csv con la media y las bandas)
+
+    Args:
+        result: Resultado de `run_ensemble`
+        path: Ruta de salida
+    """
+    if path.endswith(".csv"):
+        columns = [f"mean_{n}" for n in STATE_NAMES]
+        data = [result["mean"]]
+        for p, band in result["percentiles"].items():
+            columns += [f"p{p}_{n}" for n in STATE_NAMES]
+            data.append(band)
+        table = np.vstack(data).T
+        table = np.column_stack([np.arange(table.shape[0]), table])
+        np.savetxt(path, table, delimiter=",", header=",".join(["step"] + columns),
+                   comments="", fmt=["%d"] + ["%.4f"] * len(columns))
+    else:
+        arrays = {f"p{p}": band for p, band in result["percentiles"].items()}
+        np.savez_compressed(path, mean=result["mean"], std=result["std"],
+                            peak_infected=result["peak_infected"],
+                            time_to_peak=result["time_to_peak"],
+                            final_attack_rate=result["final_attack_rate"], **arrays)
+    print(f"💾 Resultados guardados en {path}")
+
+def plot_ensemble(result, path):
+    """
+    Grafica la media y la banda de percentiles extremos de cada estado y la guarda en `path`
+
+    Args:
+        result: Resultado de `run_ensemble`
+        path: Ruta de la imagen
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    low_p, high_p = min(result["percentiles"]), max(result["percentiles"])
+    low, high = result["percentiles"][low_p], result["percentiles"][high_p]
+    steps_axis = np.arange(result["mean"].shape[1])
+
+    plt.figure(figsize=(12, 6))
+    for k, (label, color) in enumerate((("🟦 Susceptible", "blue"),
+                                        ("🟥 Infected", "red"),
+                                        ("🟩 Recovered", "green"))):
+        plt.plot(steps_axis, result["mean"][k], label=label, color=color, linewidth=2)
+        plt.fill_between(steps_axis, low[k], high[k], color=color, alpha=0.2)
+    plt.xlabel("Paso de tiempo")
+    plt.ylabel("Número de individuos")
+    plt.title(f"Ensamble de {result['num_runs']} realizaciones (banda P{low_p}-P{high_p})")
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(path, dpi=150)
+    plt.close()
+    print(f"🖼️  Gráfico guardado en {path}")
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Ensamble de simulaciones SIR en paralelo")
+    parser.add_argument("--runs", type=int, default=100, help="Número de realizaciones")
+    parser.add_argument("--grid-size", type=int, default=sim.grid_size)
+    parser.add_argument("--infection-prob", type=float, default=sim.infection_prob)
+    parser.add_argument("--recovery-prob", type=float, default=sim.recovery_prob)
+    parser.add_argument("--initial-infected", type=int, default=sim.initial_infected)
+    parser.add_argument("--steps", type=int, default=sim.steps)
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base del ensamble")
+    parser.add_argument("--engine", choices=sim.ENGINE_NAMES, default="vectorized")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos (por defecto todos los núcleos)")
+    parser.add_argument("--output", help="Archivo de salida (.npz o .csv)")
+    parser.add_argument("--plot", help="Imagen de salida con las bandas de confianza")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    args = build_parser().parse_args(argv)
+
+    print("=" * 80)
+    print("🦠 ENSAMBLE DE SIMULACIONES DE PROPAGACIÓN DE ENFERMEDAD")
+    print("=" * 80)
+
+    result = run_ensemble(args.runs, grid_size=args.grid_size, infection_prob=args.infection_prob,
+                          recovery_prob=args.recovery_prob, initial_infected=args.initial_infected,
+                          steps=args.steps, seed=args.seed, engine=args.engine, workers=args.workers)
+    print_ensemble_summary(result)
+
+    if args.output:
+        save_ensemble(result, args.output)
+    if args.plot:
+        plot_ensemble(result, args.plot)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+Modelo de Metapoblaciones: Muchas Grillas Regionales Acopladas por Migración
+===========================================================================
+
+Cada región (por ejemplo una ciudad) es una grilla SIR como la de
+`simulacion_enfermedad.py`. Las N grillas se guardan en un único arreglo 3-D
+(regiones x tamaño x tamaño) y se actualizan juntas en cada paso; después, una
+matriz de migración mueve individuos infectados entre regiones.
+
+Migración: `migration_matrix[r, s]` es la probabilidad por paso de que un
+infectado de la región r viaje a la región s. Cada viajero deja su celda como
+susceptible y ocupa una celda susceptible al azar en el destino, de modo que la
+población de cada grilla se mantiene constante.
+
+Con `workers > 1` las regiones se reparten en fragmentos entre procesos que
+comparten el arreglo 3-D mediante memoria compartida (`multiprocessing.shared_memory`):
+cada proceso actualiza sus regiones en el lugar y solo devuelve los conteos.
+
+Uso:
+    python metapoblacion.py --regions 100 --grid-size 100 --migration-rate 0.01 --workers 4
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from simulacion_enfermedad import SUSCEPTIBLE, INFECTED, RECOVERED
+
+def uniform_migration_matrix(num_regions, rate):
+    """
+    Matriz de migración todos-con-todos
+
+    Args:
+        num_regions: Número de regiones
+        rate: Probabilidad total por paso de que un infectado salga de su región
+
+    Returns:
+        Matriz (regiones x regiones) con diagonal cero
+    """
+    if num_regions == 1:
+        return np.zeros((1, 1))
+    matrix = np.full((num_regions, num_regions), rate / (num_regions - 1))
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+def initialize_regions(num_regions, size, infected_per_region, rng):
+    """
+    Crea el arreglo 3-D de regiones con infectados iniciales aleatorios
+
+    Args:
+        num_regions: Número de regiones
+        size: Tamaño de cada grilla (size x size)
+        infected_per_region: Entero o arreglo con los infectados iniciales de cada región
+        rng: Generador (`np.random.Generator`)
+
+    Returns:
+        Arreglo uint8 (regiones, size, size)
+    """
+    grids = np.zeros((num_regions, size, size), dtype=np.uint8)
+    infected_per_region = np.broadcast_to(infected_per_region, (num_regions,))
+    for region, count in enumerate(infected_per_region):
+        cells = rng.choice(size * size, int(count), replace=False)
+        grids[region].flat[cells] = INFECTED
+    return grids
+
+def update_regions(grids, infection_prob, recovery_prob, rng):
+    """
+    Actualiza todas las regiones de un arreglo 3-D en un solo paso vectorizado
+
+    Mismas reglas y bordes periódicos (dentro de cada región) que `update_grid`.
+    Modifica `grids` en el lugar.
+
+    Args:
+        grids: Arreglo (regiones, size, size)
+        infection_prob, recovery_prob: Escalares o arreglos con un valor por región
+        rng: Generador (`np.random.Generator`)
+
+    Returns:
+        Conteos (regiones, 3) de S, I, R después del paso
+    """
+    infection_prob = np.reshape(infection_prob, (-1, 1, 1))
+    recovery_prob = np.reshape(recovery_prob, (-1, 1, 1))
+
+    infected = grids == INFECTED
+    exposed = (np.roll(infected, 1, axis=1) | np.roll(infected, -1, axis=1) |
+               np.roll(infected, 1, axis=2) | np.roll(infected, -1, axis=2))
+    uniform = rng.random(grids.shape, dtype=np.float32)
+
+    new_infected = (grids == SUSCEPTIBLE) & exposed & (uniform < infection_prob)
+    grids[infected & (uniform < recovery_prob)] = RECOVERED
+    grids[new_infected] = INFECTED
+    return region_counts(grids)
+
+def region_counts(grids):
+    """Conteos (regiones, 3) de S, I, R de cada región"""
+    infected = np.count_nonzero(grids == INFECTED, axis=(1, 2))
+    recovered = np.count_nonzero(grids == RECOVERED, axis=(1, 2))
+    population = grids.shape[1] * grids.shape[2]
+    return np.stack([population - infected - recovered, infected, recovered], axis=1)
+
+def migrate(grids, migration_matrix, counts, rng):
+    """
+    Mueve infectados entre regiones según la matriz de migración
+
+    Los viajeros de todas las parejas (r, s) se sortean a la vez con una
+    multinomial por región de origen. Si un destino no tiene suficientes
+    susceptibles para recibir a todos, se conserva al azar (hipergeométrica
+    multivariada) solo la parte de viajeros de cada origen que cabe, antes de
+    sacarlos del origen: toda salida tiene su llegada. En cada origen, los que
+    salen dejan su celda como susceptible; en cada destino, los que llegan ocupan
+    celdas susceptibles elegidas al azar. Modifica `grids` y `counts` en el lugar.
+
+    Args:
+        grids: Arreglo (regiones, size, size)
+        migration_matrix: Probabilidades (regiones x regiones) por paso
+        counts: Conteos (regiones, 3) actuales
+        rng: Generador (`np.random.Generator`)
+
+    Returns:
+        Número total de infectados que migraron
+    """
+    num_regions = grids.shape[0]
+    flat = grids.reshape(num_regions, -1)
+
+    stay = np.clip(1.0 - migration_matrix.sum(axis=1, keepdims=True), 0.0, 1.0)
+    probabilities = np.hstack([migration_matrix, stay])
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    travellers = rng.multinomial(counts[:, 1], probabilities)[:, :-1]
+
+    # Limitar por pareja (origen, destino) a los susceptibles del destino
+    capacity = counts[:, 0]
+    for region in np.flatnonzero(travellers.sum(axis=0) > capacity):
+        travellers[:, region] = rng.multivariate_hypergeometric(travellers[:, region], capacity[region])
+
+    leaving = travellers.sum(axis=1)
+    arriving = travellers.sum(axis=0)
+    if not leaving.any():
+        return 0
+
+    # Solo se recorren las regiones con salidas o llegadas
+    for region in np.flatnonzero(leaving | arriving):
+        cells = flat[region]
+        if leaving[region]:
+            infected_cells = np.flatnonzero(cells == INFECTED)
+            cells[rng.choice(infected_cells, leaving[region], replace=False)] = SUSCEPTIBLE
+        if arriving[region]:
+            susceptible_cells = np.flatnonzero(cells == SUSCEPTIBLE)
+            cells[rng.choice(susceptible_cells, arriving[region], replace=False)] = INFECTED
+
+    counts[:, 0] += leaving - arriving
+    counts[:, 1] += arriving - leaving
+    return int(arriving.sum())
+
+# --- Ejecución por fragmentos en procesos con memoria compartida ---
+
+_SHARED = {}
+
+def _attach_shared(name, shape):
+    """Inicializador de cada proceso: se conecta al arreglo 3-D compartido"""
+    shm = shared_memory.SharedMemory(name=name)
+    _SHARED["shm"] = shm
+    _SHARED["grids"] = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+def _step_shard(task):
+    """
+    Actualiza en el lugar las regiones [r0, r1) del arreglo compartido
+
+    Args:
+        task: (r0, r1, infection_prob, recovery_prob, semilla)
+
+    Returns:
+        (r0, conteos de las regiones del fragmento)
+    """
+    r0, r1, infection_prob, recovery_prob, seed = task
+    rng = np.random.default_rng(seed)
+    return r0, update_regions(_SHARED["grids"][r0:r1], infection_prob, recovery_prob, rng)
+
+def run_metapopulation(num_regions, grid_size, infection_prob, recovery_prob, migration_matrix,
+                       steps, initial_infected=None, seed=0, workers=1, verbose=False):
+    """
+    Simula N regiones acopladas por migración
+
+    Con `workers=1` todo el arreglo 3-D se actualiza con un solo lote de números
+    aleatorios. Con `workers > 1` cada fragmento de regiones usa un generador
+    derivado de (semilla, paso, fragmento), así que el resultado es reproducible
+    para un mismo número de procesos.
+
+    Args:
+        num_regions: Número de regiones
+        grid_size: Tamaño de cada grilla
+        infection_prob, recovery_prob: Escalares o arreglos con un valor por región
+        migration_matrix: Probabilidades (regiones x regiones) de migración por paso
+        steps: Número de pasos
+        initial_infected: Infectados iniciales por región (por defecto 10 en la región 0)
+        seed: Semilla
+        workers: Número de procesos
+        verbose: Si es True, muestra el progreso cada 20 pasos
+
+    Returns:
+        grids: Arreglo final (regiones, size, size)
+        history: Arreglo (pasos, regiones, 3) con los conteos S, I, R
+    """
+    rng = np.random.default_rng(seed)
+    if initial_infected is None:
+        initial_infected = np.zeros(num_regions, dtype=int)
+        initial_infected[0] = 10
+    infection_prob = np.broadcast_to(np.asarray(infection_prob, dtype=float), (num_regions,))
+    recovery_prob = np.broadcast_to(np.asarray(recovery_prob, dtype=float), (num_regions,))
+    migration_matrix = np.asarray(migration_matrix, dtype=float)
+
+    history = np.zeros((steps, num_regions, 3), dtype=np.int64)
+    shape = (num_regions, grid_size, grid_size)
+    workers = max(1, min(workers or os.cpu_count() or 1, num_regions))
+
+    shm = executor = None
+    try:
+        if workers == 1:
+            grids = initialize_regions(num_regions, grid_size, initial_infected, rng)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            grids = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            grids[:] = initialize_regions(num_regions, grid_size, initial_infected, rng)
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared,
+                                           initargs=(shm.name, shape))
+            bounds = np.linspace(0, num_regions, workers + 1).astype(int)
+            shards = [(r0, r1) for r0, r1 in zip(bounds[:-1], bounds[1:]) if r1 > r0]
+
+        for step in range(steps):
+            if executor is None:
+                counts = update_regions(grids, infection_prob, recovery_prob, rng)
+            else:
+                counts = np.empty((num_regions, 3), dtype=np.int64)
+                tasks = [(r0, r1, infection_prob[r0:r1], recovery_prob[r0:r1], (seed, step, k))
+                         for k, (r0, r1) in enumerate(shards)]
+                for r0, shard_counts in executor.map(_step_shard, tasks):
+                    counts[r0:r0 + len(shard_counts)] = shard_counts
+
+            migrate(grids, migration_matrix, counts, rng)
+            history[step] = counts
+
+            if verbose and step % 20 == 0:
+                total = counts.sum(axis=0)
+                active = np.count_nonzero(counts[:, 1])
+                print(f"Paso {step:4d}: S={total[0]:9d}, I={total[1]:9d}, R={total[2]:9d}, "
+                      f"regiones con infectados={active}")
+
+            if not counts[:, 1].any():
+                history = history[:step + 1]
+                break
+
+        return grids.copy(), history
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if shm is not None:
+            del grids
+            shm.close()
+            shm.unlink()
+
+def arrival_times(history):
+    """Primer paso con infectados en cada región (-1 si nunca llegó la epidemia)"""
+    reached = history[:, :, 1] > 0
+    return np.where(reached.any(axis=0), reached.argmax(axis=0), -1)
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Metapoblaciones SIR acopladas por migración")
+    parser.add_argument("--regions", type=int, default=20)
+    parser.add_argument("--grid-size", type=int, default=50)
+    parser.add_argument("--infection-prob", type=float, default=0.3)
+    parser.add_argument("--recovery-prob", type=float, default=0.1)
+    parser.add_argument("--initial-infected", type=int, default=10,
+                        help="Infectados iniciales en la región 0")
+    parser.add_argument("--migration-rate", type=float, default=0.01,
+                        help="Probabilidad por paso de que un infectado salga de su región")
+    parser.add_argument("--migration-file", help="CSV con la matriz de migración (regiones x regiones)")
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--output", help="Archivo .npz con el historial por región")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    args = build_parser().parse_args(argv)
+
+    print("=" * 80)
+    print("🌍 METAPOBLACIONES - PROPAGACIÓN ENTRE REGIONES")
+    print("=" * 80)
+
+    if args.migration_file:
+        migration_matrix = np.loadtxt(args.migration_file, delimiter=",")
+    else:
+        migration_matrix = uniform_migration_matrix(args.regions, args.migration_rate)
+
+    initial_infected = np.zeros(args.regions, dtype=int)
+    initial_infected[0] = args.initial_infected
+
+    start = time.perf_counter()
+    grids, history = run_metapopulation(args.regions, args.grid_size, args.infection_prob,
+                                        args.recovery_prob, migration_matrix, args.steps,
+                                        initial_infected=initial_infected, seed=args.seed,
+                                        workers=args.workers, verbose=True)
+    elapsed = time.perf_counter() - start
+
+    arrivals = arrival_times(history)
+    population = args.grid_size ** 2
+    attack = (population - history[-1, :, 0]) / population
+    print(f"\n⏱️  {history.shape[0]} pasos en {elapsed:.2f} s "
+          f"({history.shape[0] / elapsed:.1f} pasos/s, {args.regions} regiones)")
+    print(f"📍 Regiones alcanzadas: {np.count_nonzero(arrivals >= 0)}/{args.regions}")
+    if (arrivals >= 0).any():
+        print(f"   • Llegada media: paso {arrivals[arrivals >= 0].mean():.1f}")
+    print(f"   • Tasa de ataque final media: {attack.mean():.3f}")
+
+    if args.output:
+        np.savez_compressed(args.output, history=history, arrival_times=arrivals,
+                            migration_matrix=migration_matrix)
+        print(f"💾 Historial guardado en {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Renderizado sin Pantalla e Incremental de la Simulación de Enfermedad
+=====================================================================
+
+Convierte la grilla S/I/R en cuadros de imagen mientras la simulación avanza y
+los escribe desde un hilo de fondo, de modo que el renderizado nunca detiene el
+ciclo de pasos. Sirve en servidores sin pantalla (backend Agg).
+
+Salidas:
+- Directorio: secuencia de PNG (`frame_000000.png`, ...)
+- `.gif`: animación con `PillowWriter` de matplotlib
+- `.mp4`: animación con `FFMpegWriter` (requiere ffmpeg instalado)
+
+Para grillas enormes, `tile=k` dibuja solo mosaicos reducidos de k x k celdas
+cuyo color mezcla las fracciones S/I/R de cada mosaico.
+
+Uso:
+    python render_simulacion.py --grid-size 400 --steps 200 --output animacion.gif \\
+        --every 2 --tile 2 --plot curvas.png
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import os
+import queue
+import threading
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib import animation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import matplotlib.image as mpimg
+
+# Colores RGB de cada estado: 🟦 S, 🟥 I, 🟩 R
+PALETTE = np.array([
+    [40, 100, 220],
+    [220, 40, 40],
+    [40, 170, 70],
+], dtype=np.uint8)
+
+def grid_to_rgb(grid, tile=None):
+    """
+    Convierte una grilla de estados en una imagen RGB
+
+    Args:
+        grid: Grilla con estados 0, 1, 2
+        tile: Lado del mosaico para reducir la imagen (None = una celda por píxel)
+
+    Returns:
+        Arreglo uint8 (alto, ancho, 3)
+    """
+    if not tile or tile <= 1:
+        return PALETTE[grid]
+
+    rows, cols = grid.shape[0] // tile, grid.shape[1] // tile
+    blocks = grid[:rows * tile, :cols * tile].reshape(rows, tile, cols, tile)
+    fractions = np.stack([(blocks == state).mean(axis=(1, 3)) for state in range(3)], axis=-1)
+    return (fractions @ PALETTE.astype(float)).astype(np.uint8)
+
+class FrameRenderer:
+    """
+    Renderizador de cuadros en un hilo de fondo
+
+    `write(step, grid)` solo copia la grilla (o, con `tile`, la imagen ya reducida)
+    y la encola; si la cola está llena el cuadro se descarta (y se cuenta) en
+    lugar de bloquear la simulación, salvo que se pida `drop_frames=False`.
+    """
+
+    def __init__(self, output, every=1, tile=None, fps=10, dpi=100, max_queue=8, drop_frames=True):
+        """
+        Args:
+            output: Directorio (secuencia PNG) o archivo `.gif` / `.mp4`
+            every: Renderizar un cuadro cada `every` pasos
+            tile: Lado de los mosaicos reducidos (None = resolución completa)
+            fps: Cuadros por segundo de la animación
+            dpi: Resolución de la figura de la animación
+            max_queue: Cuadros pendientes máximos antes de descartar
+            drop_frames: Si es False, espera a que haya lugar en la cola
+        """
+        self.output = output
+        self.every = every
+        self.tile = tile
+        self.fps = fps
+        self.dpi = dpi
+        self.drop_frames = drop_frames
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._error = None
+        self._is_animation = os.path.splitext(output)[1].lower() in (".gif", ".mp4")
+        if not self._is_animation:
+            os.makedirs(output, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, step, grid):
+        """Encola la grilla del paso `step` si corresponde según `every`"""
+        if step % self.every:
+            return
+        if self.drop_frames and self._queue.full():
+            self.frames_dropped += 1
+            return
+        # Con mosaicos se encola la imagen reducida: nunca se copia la grilla completa
+        frame = grid_to_rgb(grid, self.tile) if self.tile and self.tile > 1 else grid.copy()
+        try:
+            self._queue.put((step, frame), block=not self.drop_frames)
+        except queue.Full:
+            self.frames_dropped += 1
+
+    def flush(self):
+        """Espera a que se rendericen los cuadros encolados"""
+        self._queue.join()
+
+    def close(self):
+        """Termina el hilo de renderizado y cierra el archivo de salida"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        print(f"🎞️  {self.frames_written} cuadros escritos en {self.output}"
+              + (f" ({self.frames_dropped} descartados)" if self.frames_dropped else ""))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open_animation(self, first_frame):
+        """Prepara la figura y el escritor de animación con el tamaño del primer cuadro"""
+        height, width = first_frame.shape[:2]
+        fig = Figure(figsize=(width / self.dpi, height / self.dpi), dpi=self.dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.set_axis_off()
+        image = ax.imshow(first_frame, interpolation="nearest")
+
+        if self.output.lower().endswith(".gif"):
+            writer = animation.PillowWriter(fps=self.fps)
+        else:
+            writer = animation.FFMpegWriter(fps=self.fps)
+        writer.setup(fig, self.output, dpi=self.dpi)
+        return writer, image
+
+    def _run(self):
+        writer = image = None
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    if writer is not None:
+                        writer.finish()
+                    return
+                if self._error is not None:
+                    continue
+
+                step, frame = item
+                if frame.ndim == 2:
+                    frame = grid_to_rgb(frame)
+                if self._is_animation:
+                    if writer is None:
+                        writer, image = self._open_animation(frame)
+                    image.set_data(frame)
+                    writer.grab_frame()
+                else:
+                    mpimg.imsave(os.path.join(self.output, f"frame_{step:06d}.png"), frame)
+                self.frames_written += 1
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    import simulacion_enfermedad as sim
+
+    parser = argparse.ArgumentParser(description="Simulación SIR con renderizado sin pantalla")
+    parser.add_argument("--grid-size", type=int, default=sim.grid_size)
+    parser.add_argument("--infection-prob", type=float, default=sim.infection_prob)
+    parser.add_argument("--recovery-prob", type=float, default=sim.recovery_prob)
+    parser.add_argument("--initial-infected", type=int, default=sim.initial_infected)
+    parser.add_argument("--steps", type=int, default=sim.steps)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", choices=sim.ENGINE_NAMES, default="vectorized")
+    parser.add_argument("--output", default="animacion.gif",
+                        help="Directorio (secuencia PNG) o archivo .gif / .mp4")
+    parser.add_argument("--every", type=int, default=1, help="Renderizar cada N pasos")
+    parser.add_argument("--tile", type=int, default=None, help="Lado de los mosaicos reducidos")
+    parser.add_argument("--fps", type=int, default=10)
+    parser.add_argument("--keep-all-frames", action="store_true",
+                        help="Esperar al renderizador en lugar de descartar cuadros")
+    parser.add_argument("--plot", help="Guardar también las curvas S/I/R en esta imagen")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    import simulacion_enfermedad as sim
+
+    args = build_parser().parse_args(argv)
+
+    renderer = FrameRenderer(args.output, every=args.every, tile=args.tile, fps=args.fps,
+                             drop_frames=not args.keep_all_frames)
+    try:
+        history = sim.run_simulation(args.grid_size, args.infection_prob, args.recovery_prob,
+                                     args.initial_infected, args.steps, seed=args.seed,
+                                     engine=args.engine, verbose=True, renderer=renderer)
+    finally:
+        renderer.close()
+
+    if args.plot:
+        sim.plot_results(*history, output_path=args.plot, total_population=args.grid_size ** 2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Salida en Streaming y Puntos de Control para Simulaciones Largas
+================================================================
+
+- `SnapshotWriter`: guarda cada N pasos una instantánea de la grilla en un formato
+  de arreglos por fragmentos (un `.npz` comprimido por cada `chunk_size`
+  instantáneas más un `metadata.json`). La compresión y escritura ocurren en un
+  hilo de fondo mientras la simulación sigue avanzando.
+- `save_checkpoint` / `load_checkpoint`: guardan la grilla, el estado del
+  generador aleatorio, el paso y el historial, de modo que una corrida detenida
+  continúa exactamente donde quedó (ver `run_simulation(..., resume=True)`).
+
+Uso:
+    python salida_simulacion.py --steps 10000 --checkpoint corrida.npz \\
+        --checkpoint-every 500 --snapshots instantaneas --snapshot-every 50 --resume
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import glob
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+def save_checkpoint(path, grid, rng, step, history):
+    """
+    Guarda un punto de control de la simulación (escritura atómica)
+
+    Args:
+        path: Archivo `.npz` de destino
+        grid: Grilla después del paso `step`, o None si la grilla tiene su propio
+            punto de control en disco (`CompactGrid.checkpoint`)
+        rng: Generador (`np.random.Generator`) usado por la simulación
+        step: Último paso completado
+        history: Historial (3, step + 1) de conteos S, I, R
+    """
+    arrays = {"history": history, "step": step, "rng_state": json.dumps(rng.bit_generator.state)}
+    if grid is not None:
+        arrays["grid"] = grid
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(tmp_path, path)
+
+def load_checkpoint(path):
+    """
+    Carga un punto de control guardado con `save_checkpoint`
+
+    Returns:
+        Diccionario con `grid` (None si no se guardó), `history`, `step` y `rng_state`
+    """
+    with np.load(path) as data:
+        return {
+            "grid": data["grid"] if "grid" in data.files else None,
+            "history": data["history"],
+            "step": int(data["step"]),
+            "rng_state": json.loads(str(data["rng_state"])),
+        }
+
+class SnapshotWriter:
+    """
+    Escritor en streaming de instantáneas de la grilla por fragmentos comprimidos
+
+    Cada fragmento `chunk_XXXXX.npz` contiene `snapshots` (k, n, n) y `steps` (k).
+    Solo hay un fragmento en escritura a la vez, así que la memoria usada está
+    acotada por dos fragmentos.
+    """
+
+    def __init__(self, directory, every=10, chunk_size=16, append=False, resume_step=None):
+        """
+        Args:
+            directory: Directorio de salida
+            every: Guardar una instantánea cada `every` pasos
+            chunk_size: Instantáneas por fragmento
+            append: Si es True, continúa un directorio existente
+            resume_step: Al continuar, descarta los fragmentos posteriores a este paso
+        """
+        self.directory = directory
+        self.every = every
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self._buffer = []
+        self._steps = []
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        os.makedirs(directory, exist_ok=True)
+
+        metadata_path = os.path.join(directory, "metadata.json")
+        if append and os.path.exists(metadata_path):
+            with open(metadata_path, encoding="utf-8") as f:
+                self.chunks = json.load(f)["chunks"]
+            if resume_step is not None:
+                # Los fragmentos escritos después del punto de control se regeneran
+                stale = [c for c in self.chunks if c["first_step"] > resume_step]
+                for chunk in stale:
+                    stale_path = os.path.join(directory, chunk["file"])
+                    if os.path.exists(stale_path):
+                        os.remove(stale_path)
+                self.chunks = [c for c in self.chunks if c["first_step"] <= resume_step]
+        else:
+            for old_file in glob.glob(os.path.join(directory, "chunk_*.npz")):
+                os.remove(old_file)
+
+    def write(self, step, grid):
+        """Registra la grilla del paso `step` si corresponde según `every`"""
+        if step % self.every:
+            return
+        self._buffer.append(grid.copy())
+        self._steps.append(step)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush(wait=False)
+
+    def _write_chunk(self, path, snapshots, steps, chunks):
+        # Se ejecuta en el hilo de fondo: primero el fragmento, luego los metadatos
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, snapshots=snapshots, steps=steps)
+        os.replace(tmp_path, path)
+        self._write_metadata(snapshots.shape[1:], snapshots.dtype, chunks)
+
+    def flush(self, wait=True):
+        """
+        Envía las instantáneas pendientes a un nuevo fragmento
+
+        Args:
+            wait: Si es True, espera a que el fragmento quede en disco
+        """
+        if self._buffer:
+            if self._pending is not None:
+                self._pending.result()
+            name = f"chunk_{len(self.chunks):05d}.npz"
+            snapshots = np.stack(self._buffer)
+            steps = np.array(self._steps)
+            self.chunks.append({"file": name, "first_step": int(steps[0]),
+                                "last_step": int(steps[-1]), "count": len(steps)})
+            self._pending = self._executor.submit(
+                self._write_chunk, os.path.join(self.directory, name), snapshots, steps,
+                list(self.chunks))
+            self._buffer, self._steps = [], []
+        if wait and self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def _write_metadata(self, shape, dtype, chunks):
+        metadata = {"shape": list(shape), "dtype": str(dtype), "every": self.every,
+                    "chunk_size": self.chunk_size, "chunks": chunks}
+        path = os.path.join(self.directory, "metadata.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """Escribe lo pendiente y detiene el hilo de escritura"""
+        self.flush(wait=True)
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def iter_snapshots(directory):
+    """
+    Recorre las instantáneas guardadas por `SnapshotWriter` fragmento a fragmento
+
+    Yields:
+        (paso, grilla)
+    """
+    with open(os.path.join(directory, "metadata.json"), encoding="utf-8") as f:
+        chunks = json.load(f)["chunks"]
+    for chunk in chunks:
+        with np.load(os.path.join(directory, chunk["file"])) as data:
+            for step, snapshot in zip(data["steps"], data["snapshots"]):
+                yield int(step), snapshot
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    import simulacion_enfermedad as sim
+
+    parser = argparse.ArgumentParser(description="Simulación SIR larga con instantáneas y puntos de control")
+    parser.add_argument("--grid-size", type=int, default=sim.grid_size)
+    parser.add_argument("--infection-prob", type=float, default=sim.infection_prob)
+    parser.add_argument("--recovery-prob", type=float, default=sim.recovery_prob)
+    parser.add_argument("--initial-infected", type=int, default=sim.initial_infected)
+    parser.add_argument("--steps", type=int, default=sim.steps)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", choices=sim.ENGINE_NAMES, default="vectorized")
+    parser.add_argument("--snapshots", help="Directorio de instantáneas")
+    parser.add_argument("--snapshot-every", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--checkpoint", help="Archivo .npz del punto de control")
+    parser.add_argument("--checkpoint-every", type=int, default=500)
+    parser.add_argument("--resume", action="store_true", help="Continuar desde el punto de control")
+    parser.add_argument("--grid-file", help="Archivo .npy donde el motor compact mapea la grilla en disco")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    import simulacion_enfermedad as sim
+
+    args = build_parser().parse_args(argv)
+
+    resume_step = None
+    if args.resume and args.checkpoint and os.path.exists(args.checkpoint):
+        resume_step = load_checkpoint(args.checkpoint)["step"]
+        print(f"🔁 Continuando desde el paso {resume_step}")
+
+    writer = None
+    if args.snapshots:
+        writer = SnapshotWriter(args.snapshots, every=args.snapshot_every, chunk_size=args.chunk_size,
+                                append=resume_step is not None, resume_step=resume_step)
+    try:
+        history = sim.run_simulation(args.grid_size, args.infection_prob, args.recovery_prob,
+                                     args.initial_infected, args.steps, seed=args.seed,
+                                     engine=args.engine, verbose=True, snapshot_writer=writer,
+                                     checkpoint_path=args.checkpoint,
+                                     checkpoint_every=args.checkpoint_every, resume=args.resume,
+                                     grid_path=args.grid_file)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    print(f"\n✅ Simulación completada: {history.shape[1]} pasos, S={history[0, -1]}, "
+          f"I={history[1, -1]}, R={history[2, -1]}")
+
+if __name__ == "__main__":
+    main()
@@ -15,37 +15,47 @@ Autor: Estudiante IA
 Fecha: Julio 2025
 """
 
+import functools
+import json
+import os
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+from salida_simulacion import save_checkpoint, load_checkpoint
+
 # Parámetros del modelo
 grid_size = 50          # Tamaño de la cuadrícula
 infection_prob = 0.3    # Probabilidad de infección
 recovery_prob = 0.1     # Probabilidad de recuperación
 initial_infected = 10   # Número de infectados al inicio
 steps = 100             # Número de pasos de simulación
+update_engine = "vectorized"  # Motor de actualización (ver ENGINE_NAMES)
 
 # Estados
 SUSCEPTIBLE = 0
 INFECTED = 1
 RECOVERED = 2
 
-def initialize_grid(size, num_infected):
+def initialize_grid(size, num_infected, rng=None, dtype=int):
     """
     Inicializa la grilla con individuos susceptibles y algunos infectados aleatorios
     
     Args:
         size: Tamaño de la grilla (size x size)
         num_infected: Número inicial de infectados
+        rng: Generador opcional (`np.random.Generator`); por defecto se usa `np.random`
+        dtype: Tipo de dato de las celdas (`np.uint8` usa 1 byte por celda)
     
     Returns:
         grid: Grilla inicializada
     """
-    grid = np.zeros((size, size), dtype=int)
+    grid = np.zeros((size, size), dtype=dtype)
+    randint = np.random.randint if rng is None else rng.integers
     
     # Colocar infectados iniciales en posiciones aleatorias
     for _ in range(num_infected):
-        x, y = np.random.randint(0, size, 2)
+        x, y = randint(0, size, 2)
         grid[x, y] = INFECTED
     
     return grid
@@ -70,94 +80,792 @@ def count_infected_neighbors(x, y, grid):
     ]
     return sum(grid[nx, ny] == INFECTED for nx, ny in neighbors)
 
-def update_grid(grid, infection_prob, recovery_prob):
+def update_grid(grid, infection_prob, recovery_prob, random_field=None, rng=None):
     """
     Actualiza la grilla aplicando las reglas del autómata celular
     
+    Implementación de referencia celda por celda. Si se entrega `random_field`
+    se usa ese número aleatorio para cada celda en lugar de `np.random.rand()`,
+    lo que permite comparar exactamente contra `update_grid_vectorized`.
+    
     Args:
         grid: Grilla actual
         infection_prob: Probabilidad de infección
         recovery_prob: Probabilidad de recuperación
+        random_field: Arreglo opcional (size x size) de números uniformes en [0, 1)
+        rng: Generador opcional (`np.random.Generator`); por defecto se usa `np.random`
     
     Returns:
         Nueva grilla actualizada
     """
     size = grid.shape[0]
     new_grid = grid.copy()
+    rand = np.random.rand if rng is None else rng.random
     
     for i in range(size):
         for j in range(size):
             if grid[i, j] == SUSCEPTIBLE:
                 # Regla: Un susceptible se infecta si tiene vecinos infectados
                 if count_infected_neighbors(i, j, grid) > 0:
-                    if np.random.rand() < infection_prob:
+                    u = rand() if random_field is None else random_field[i, j]
+                    if u < infection_prob:
                         new_grid[i, j] = INFECTED
             
             elif grid[i, j] == INFECTED:
                 # Regla: Un infectado se recupera con cierta probabilidad
-                if np.random.rand() < recovery_prob:
+                u = rand() if random_field is None else random_field[i, j]
+                if u < recovery_prob:
                     new_grid[i, j] = RECOVERED
     
     return new_grid
 
-def simulate_disease_spread():
+def count_infected_neighbors_grid(grid):
     """
-    Ejecuta la simulación completa de propagación de enfermedad
+    Cuenta los vecinos infectados de todas las celdas a la vez
+    (4-conectividad con bordes periódicos, usando vistas desplazadas)
+    
+    Args:
+        grid: Grilla actual
     
     Returns:
-        history_s, history_i, history_r: Listas con el historial de cada estado
+        Arreglo (size x size) con el número de vecinos infectados de cada celda
     """
-    # Inicializar
-    grid = initialize_grid(grid_size, initial_infected)
+    infected = (grid == INFECTED).astype(np.uint8)
+    return (np.roll(infected, 1, axis=0) + np.roll(infected, -1, axis=0) +
+            np.roll(infected, 1, axis=1) + np.roll(infected, -1, axis=1))
+
+def update_grid_vectorized(grid, infection_prob, recovery_prob, random_field=None, rng=None):
+    """
+    Actualiza la grilla completa con operaciones de arreglos (mismas reglas que `update_grid`)
     
-    # Historial para graficar
-    history_s = []
-    history_i = []
-    history_r = []
+    Todos los números aleatorios del paso se generan en un solo lote. Como cada
+    celda solo usa su número para una transición (S→I o I→R), un único campo
+    aleatorio basta para las dos reglas.
     
-    print("🦠 Iniciando simulación de propagación de enfermedad...")
-    print(f"📊 Parámetros:")
-    print(f"   • Tamaño de grilla: {grid_size}x{grid_size}")
-    print(f"   • Probabilidad de infección: {infection_prob}")
-    print(f"   • Probabilidad de recuperación: {recovery_prob}")
-    print(f"   • Infectados iniciales: {initial_infected}")
-    print(f"   • Pasos de simulación: {steps}")
-    print()
+    Args:
+        grid: Grilla actual
+        infection_prob: Probabilidad de infección
+        recovery_prob: Probabilidad de recuperación
+        random_field: Arreglo opcional (size x size) de números uniformes en [0, 1)
+        rng: Generador opcional (`np.random.Generator`); por defecto se usa `np.random`
     
-    # Simulación
-    for step in range(steps):
+    Returns:
+        Nueva grilla actualizada
+    """
+    if random_field is None:
+        random_field = (np.random if rng is None else rng).random(grid.shape)
+    
+    new_grid = grid.copy()
+    
+    # Regla: Un susceptible con al menos un vecino infectado se infecta con probabilidad infection_prob
+    exposed = (grid == SUSCEPTIBLE) & (count_infected_neighbors_grid(grid) > 0)
+    new_grid[exposed & (random_field < infection_prob)] = INFECTED
+    
+    # Regla: Un infectado se recupera con probabilidad recovery_prob
+    new_grid[(grid == INFECTED) & (random_field < recovery_prob)] = RECOVERED
+    
+    return new_grid
+
+# Modos de borde: periódico, reflejante (flujo nulo, la celda del borde se refleja) y absorbente
+BOUNDARY_MODES = {
+    "periodic": "wrap",
+    "reflecting": "symmetric",
+    "absorbing": "constant",
+}
+
+def _fft_length(n):
+    """Menor longitud >= n cuyos únicos factores primos son 2, 3 y 5 (FFT rápida)"""
+    while True:
+        m = n
+        for p in (2, 3, 5):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return n
+        n += 1
+
+class NeighborhoodKernel:
+    """
+    Núcleo de vecindario con pesos de contacto y condición de borde
+    
+    La presión de infección de una celda es la suma de los pesos de sus vecinos
+    infectados. Los núcleos pequeños se aplican como suma de vistas desplazadas;
+    los grandes (por ejemplo radio 10) con una convolución por FFT, de modo que el
+    costo por paso casi no depende del radio.
+    """
+    
+    # Número de pesos no nulos a partir del cual se usa la FFT
+    FFT_THRESHOLD = 32
+    
+    def __init__(self, weights, boundary="periodic", name="custom"):
+        weights = np.asarray(weights, dtype=float)
+        if weights.ndim != 2 or weights.shape[0] != weights.shape[1] or weights.shape[0] % 2 == 0:
+            raise ValueError("Los pesos deben ser una matriz cuadrada de lado impar")
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"Borde desconocido: {boundary} (opciones: {list(BOUNDARY_MODES)})")
+        self.weights = weights
+        self.radius = weights.shape[0] // 2
+        self.boundary = boundary
+        self.name = name
+        self.offsets = [(dx - self.radius, dy - self.radius, weights[dx, dy])
+                        for dx, dy in zip(*np.nonzero(weights))]
+        self._fft_cache = {}
+    
+    @classmethod
+    def von_neumann(cls, boundary="periodic"):
+        """4-conectividad (arriba, abajo, izquierda, derecha): la regla original"""
+        weights = np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]])
+        return cls(weights, boundary, "von_neumann")
+    
+    @classmethod
+    def moore(cls, boundary="periodic"):
+        """8-conectividad (incluye diagonales)"""
+        weights = np.ones((3, 3))
+        weights[1, 1] = 0
+        return cls(weights, boundary, "moore")
+    
+    @classmethod
+    def disk(cls, radius, boundary="periodic"):
+        """Todos los vecinos a distancia euclidiana <= radius, con peso 1"""
+        dx, dy = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+        weights = (dx ** 2 + dy ** 2 <= radius ** 2).astype(float)
+        weights[radius, radius] = 0
+        return cls(weights, boundary, f"disk_r{radius}")
+    
+    @classmethod
+    def distance_weighted(cls, radius, exponent=2.0, boundary="periodic"):
+        """Vecinos dentro de `radius` con peso 1 / distancia^exponent (1 para los adyacentes)"""
+        dx, dy = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+        distance = np.sqrt(dx ** 2 + dy ** 2)
+        weights = np.zeros_like(distance)
+        inside = (distance > 0) & (distance <= radius)
+        weights[inside] = distance[inside] ** -exponent
+        return cls(weights, boundary, f"distance_r{radius}")
+    
+    def _kernel_fft(self, shape):
+        """FFT del núcleo (invertido, para obtener una correlación) embebido en `shape`"""
+        if shape not in self._fft_cache:
+            embedded = np.zeros(shape)
+            size = self.weights.shape[0]
+            embedded[:size, :size] = self.weights[::-1, ::-1]
+            embedded = np.roll(embedded, (-self.radius, -self.radius), axis=(0, 1))
+            self._fft_cache[shape] = np.fft.rfft2(embedded)
+        return self._fft_cache[shape]
+    
+    def pressure(self, infected):
+        """
+        Calcula la presión de infección de toda la grilla
+        
+        Args:
+            infected: Máscara (o arreglo 0/1) de celdas infectadas
+        
+        Returns:
+            Arreglo float con la suma de pesos de los vecinos infectados de cada celda
+        """
+        r = self.radius
+        rows, cols = np.shape(infected)
+        
+        if len(self.offsets) <= self.FFT_THRESHOLD:
+            padded = np.pad(np.asarray(infected, dtype=np.float32), r,
+                            mode=BOUNDARY_MODES[self.boundary])
+            result = np.zeros((rows, cols), dtype=np.float32)
+            for dx, dy, weight in self.offsets:
+                result += np.float32(weight) * padded[r + dx:r + dx + rows, r + dy:r + dy + cols]
+            return result
+        
+        infected = np.asarray(infected, dtype=float)
+        if self.boundary == "periodic":
+            # La convolución circular de la FFT ya implementa los bordes periódicos
+            return np.fft.irfft2(np.fft.rfft2(infected) * self._kernel_fft(infected.shape),
+                                 s=infected.shape)
+        
+        # Con relleno de `r` celdas (más ceros hasta un tamaño rápido para la FFT)
+        # el efecto circular queda fuera del recorte
+        padded = np.pad(infected, r, mode=BOUNDARY_MODES[self.boundary])
+        shape = (_fft_length(rows + 2 * r), _fft_length(cols + 2 * r))
+        full = np.fft.irfft2(np.fft.rfft2(padded, s=shape) * self._kernel_fft(shape), s=shape)
+        return full[r:r + rows, r:r + cols]
+
+def update_grid_kernel(grid, infection_prob, recovery_prob, kernel=None, infection_rule="any",
+                       random_field=None, rng=None):
+    """
+    Actualiza la grilla usando un núcleo de vecindario configurable
+    
+    Reglas de infección:
+    - "any": un susceptible con presión > 0 se infecta con probabilidad infection_prob
+      (con el núcleo de von Neumann reproduce exactamente `update_grid`)
+    - "pressure": cada unidad de peso es un contacto independiente, así que la
+      probabilidad de infección es 1 - (1 - infection_prob)^presión
+    
+    Args:
+        grid: Grilla actual
+        infection_prob: Probabilidad de infección
+        recovery_prob: Probabilidad de recuperación
+        kernel: `NeighborhoodKernel` (por defecto von Neumann periódico)
+        infection_rule: "any" o "pressure"
+        random_field: Arreglo opcional (size x size) de números uniformes en [0, 1)
+        rng: Generador opcional (`np.random.Generator`); por defecto se usa `np.random`
+    
+    Returns:
+        Nueva grilla actualizada
+    """
+    kernel = DEFAULT_KERNEL if kernel is None else kernel
+    if random_field is None:
+        random_field = (np.random if rng is None else rng).random(grid.shape)
+    
+    pressure = kernel.pressure(grid == INFECTED)
+    if infection_rule == "any":
+        # Tolerancia para el ruido numérico de la FFT
+        probability = np.where(pressure > 1e-9, infection_prob, 0.0)
+    elif infection_rule == "pressure":
+        probability = 1.0 - (1.0 - infection_prob) ** np.maximum(pressure, 0.0)
+    else:
+        raise ValueError(f"Regla de infección desconocida: {infection_rule}")
+    
+    new_grid = grid.copy()
+    new_grid[(grid == SUSCEPTIBLE) & (random_field < probability)] = INFECTED
+    new_grid[(grid == INFECTED) & (random_field < recovery_prob)] = RECOVERED
+    return new_grid
+
+DEFAULT_KERNEL = NeighborhoodKernel.von_neumann()
+
+# Motores de actualización disponibles
+UPDATE_ENGINES = {
+    "loop": update_grid,
+    "vectorized": update_grid_vectorized,
+    "kernel": update_grid_kernel,
+}
+
+class FrontierEngine:
+    """
+    Motor de frontera activa para epidemias de baja prevalencia
+    
+    Mantiene los índices (planos) de las celdas infectadas y los contadores S/I/R.
+    En cada paso solo visita los infectados y sus vecinos susceptibles, por lo que
+    el costo escala con el tamaño del brote y no con el área de la grilla. Aplica
+    las mismas reglas que `update_grid` y modifica la grilla en el lugar.
+    """
+    
+    def __init__(self, grid):
+        self.size = grid.shape[0]
+        self.infected = np.flatnonzero(grid == INFECTED)
+        self.counts = np.bincount(grid.ravel(), minlength=3)[:3].astype(np.int64)
+    
+    def susceptible_frontier(self, flat_grid):
+        """Índices de los susceptibles con al menos un vecino infectado (4-conectividad periódica)"""
+        size = self.size
+        rows, cols = np.divmod(self.infected, size)
+        neighbors = np.concatenate([
+            ((rows - 1) % size) * size + cols,     # Arriba
+            ((rows + 1) % size) * size + cols,     # Abajo
+            rows * size + (cols - 1) % size,       # Izquierda
+            rows * size + (cols + 1) % size,       # Derecha
+        ])
+        # Eliminar duplicados ordenando (más rápido que np.unique con hash para enteros)
+        neighbors.sort()
+        distinct = np.empty(neighbors.size, dtype=bool)
+        distinct[:1] = True
+        np.not_equal(neighbors[1:], neighbors[:-1], out=distinct[1:])
+        neighbors = neighbors[distinct]
+        return neighbors[flat_grid[neighbors] == SUSCEPTIBLE]
+    
+    def step(self, grid, infection_prob, recovery_prob, rng=None):
+        """
+        Avanza un paso actualizando solo la frontera activa
+        
+        Args:
+            grid: Grilla actual (se modifica en el lugar)
+            infection_prob: Probabilidad de infección
+            recovery_prob: Probabilidad de recuperación
+            rng: Generador opcional (`np.random.Generator`); por defecto se usa `np.random`
+        
+        Returns:
+            La misma grilla, actualizada
+        """
+        flat_grid = grid.reshape(-1)
+        frontier = self.susceptible_frontier(flat_grid)
+        
+        # Un único lote de números aleatorios para infecciones y recuperaciones
+        draws = (np.random if rng is None else rng).random(frontier.size + self.infected.size)
+        new_infected = frontier[draws[:frontier.size] < infection_prob]
+        recovering = draws[frontier.size:] < recovery_prob
+        
+        flat_grid[self.infected[recovering]] = RECOVERED
+        flat_grid[new_infected] = INFECTED
+        # Índices ordenados: el estado depende solo de la grilla (reanudación exacta)
+        self.infected = np.sort(np.concatenate([self.infected[~recovering], new_infected]))
+        
+        # Contadores incrementales
+        num_recovered = np.count_nonzero(recovering)
+        self.counts += (-new_infected.size, new_infected.size - num_recovered, num_recovered)
+        return grid
+
+def pack_grid(grid):
+    """
+    Empaqueta una grilla en 2 bits por celda (4 celdas por byte)
+    
+    Args:
+        grid: Grilla con estados 0, 1 o 2
+    
+    Returns:
+        Arreglo uint8 de ceil(celdas / 4) bytes
+    """
+    flat = grid.reshape(-1).astype(np.uint8)
+    padding = (-flat.size) % 4
+    if padding:
+        flat = np.concatenate([flat, np.zeros(padding, dtype=np.uint8)])
+    quads = flat.reshape(-1, 4)
+    return quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+
+def unpack_grid(packed, shape):
+    """
+    Reconstruye una grilla uint8 empaquetada con `pack_grid`
+    
+    Args:
+        packed: Arreglo uint8 empaquetado
+        shape: Forma de la grilla original
+    
+    Returns:
+        Grilla uint8 con la forma indicada
+    """
+    quads = np.empty((packed.size, 4), dtype=np.uint8)
+    for k in range(4):
+        quads[:, k] = (packed >> (2 * k)) & 3
+    return quads.reshape(-1)[:int(np.prod(shape))].reshape(shape)
+
+class CompactGrid:
+    """
+    Grilla compacta de doble búfer para retículas muy grandes
+    
+    Guarda los estados en uint8 (1 byte por celda en lugar de 8) en dos búferes
+    que se alternan en cada paso, por lo que no se reserva una grilla nueva por
+    paso. La actualización se hace por bloques de filas (con una fila de halo
+    periódica arriba y abajo), de modo que los temporales ocupan solo
+    `block_rows` filas. Opcionalmente los búferes viven en un archivo `.npy`
+    mapeado en memoria, lo que permite avanzar y guardar grillas más grandes
+    que la RAM. Aplica las mismas reglas que `update_grid`.
+    """
+    
+    def __init__(self, buffers, current=0, step_count=0, block_rows=256, path=None):
+        self.buffers = buffers
+        self.size = buffers.shape[1]
+        self.current = current
+        self.step_count = step_count
+        self.block_rows = block_rows
+        self.path = path
+        self.rng_state = None
+        self._views = [buffers[0], buffers[1]]
+        self.counts = self.count_states(self.grid)
+    
+    @staticmethod
+    def _allocate(size, path):
+        if path is None:
+            return np.zeros((2, size, size), dtype=np.uint8)
+        return np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(2, size, size))
+    
+    @classmethod
+    def from_grid(cls, grid, path=None, block_rows=256):
+        """Crea la grilla compacta copiando una grilla existente"""
+        buffers = cls._allocate(grid.shape[0], path)
+        buffers[0] = grid
+        return cls(buffers, block_rows=block_rows, path=path)
+    
+    @classmethod
+    def create(cls, size, num_infected, rng=None, path=None, block_rows=256):
+        """
+        Crea una grilla compacta sin pasar por una grilla densa intermedia
+        
+        Args:
+            size: Tamaño de la grilla (size x size)
+            num_infected: Número inicial de infectados
+            rng: Generador opcional (`np.random.Generator`)
+            path: Archivo `.npy` opcional para mapear los búferes en disco
+            block_rows: Filas por bloque de actualización
+        """
+        buffers = cls._allocate(size, path)
+        randint = np.random.randint if rng is None else rng.integers
+        for _ in range(num_infected):
+            x, y = randint(0, size, 2)
+            buffers[0, x, y] = INFECTED
+        return cls(buffers, block_rows=block_rows, path=path)
+    
+    @classmethod
+    def open(cls, path, block_rows=256):
+        """
+        Reabre una grilla mapeada en disco desde su último punto de control
+        
+        La grilla del punto de control se restaura desde `<path>.ckpt` al búfer
+        actual, por lo que los pasos dados después de guardarlo se descartan. El
+        estado del generador guardado (si lo hay) queda en `rng_state`.
+        """
+        buffers = np.lib.format.open_memmap(path, mode="r+")
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        snapshot = np.lib.format.open_memmap(path + ".ckpt", mode="r")
+        for r0 in range(0, buffers.shape[1], block_rows):
+            buffers[meta["current"], r0:r0 + block_rows] = snapshot[r0:r0 + block_rows]
+        del snapshot
+        compact = cls(buffers, meta["current"], meta["step"], block_rows, path)
+        compact.rng_state = meta.get("rng_state")
+        return compact
+    
+    @property
+    def grid(self):
+        """Vista de la grilla del paso actual"""
+        return self._views[self.current]
+    
+    def count_states(self, grid):
+        """Cuenta S, I, R por bloques de filas"""
+        counts = np.zeros(3, dtype=np.int64)
+        for r0 in range(0, self.size, self.block_rows):
+            counts += np.bincount(grid[r0:r0 + self.block_rows].ravel(), minlength=3)[:3]
+        return counts
+    
+    def step(self, grid, infection_prob, recovery_prob, rng=None):
+        """
+        Avanza un paso escribiendo en el búfer inactivo y luego alternándolos
+        
+        Args:
+            grid: Grilla actual (se ignora: el estado vive en los búferes; se
+                acepta por compatibilidad con los demás motores)
+            infection_prob: Probabilidad de infección
+            recovery_prob: Probabilidad de recuperación
+            rng: Generador opcional (`np.random.Generator`); por defecto se usa `np.random`
+        
+        Returns:
+            Vista de la nueva grilla actual
+        """
+        src = self._views[self.current]
+        dst = self._views[1 - self.current]
+        size = self.size
+        counts = np.zeros(3, dtype=np.int64)
+        
+        for r0 in range(0, size, self.block_rows):
+            r1 = min(r0 + self.block_rows, size)
+            block = src[r0:r1]
+            infected = block == INFECTED
+            
+            # Vecinos infectados: filas de halo periódicas arriba y abajo
+            exposed = np.roll(infected, 1, axis=1)
+            exposed |= np.roll(infected, -1, axis=1)
+            exposed[1:] |= infected[:-1]
+            exposed[:-1] |= infected[1:]
+            exposed[0] |= src[(r0 - 1) % size] == INFECTED
+            exposed[-1] |= src[r1 % size] == INFECTED
+            
+            if rng is None:
+                uniform = np.random.random(block.shape)
+            else:
+                uniform = rng.random(block.shape, dtype=np.float32)
+            
+            out = dst[r0:r1]
+            np.copyto(out, block)
+            out[(block == SUSCEPTIBLE) & exposed & (uniform < infection_prob)] = INFECTED
+            out[infected & (uniform < recovery_prob)] = RECOVERED
+            counts += np.bincount(out.ravel(), minlength=3)[:3]
+        
+        self.current = 1 - self.current
+        self.step_count += 1
+        self.counts = counts
+        return self.grid
+    
+    def checkpoint(self, rng=None):
+        """
+        Guarda el punto de control de una grilla mapeada en disco
+        
+        Copia por bloques la grilla actual a `<path>.ckpt` (los pasos siguientes
+        reescriben ambos búferes) y escribe en `<path>.json` el búfer actual, el
+        paso y (opcionalmente) el estado del generador.
+        """
+        if self.path is None:
+            raise ValueError("checkpoint() requiere una grilla mapeada en disco (path)")
+        self.buffers.flush()
+        snapshot_tmp = self.path + ".ckpt.tmp"
+        snapshot = np.lib.format.open_memmap(snapshot_tmp, mode="w+", dtype=np.uint8,
+                                             shape=(self.size, self.size))
+        for r0 in range(0, self.size, self.block_rows):
+            snapshot[r0:r0 + self.block_rows] = self.grid[r0:r0 + self.block_rows]
+        snapshot.flush()
+        del snapshot
+        meta = {"current": self.current, "step": self.step_count, "size": self.size}
+        if rng is not None:
+            meta["rng_state"] = rng.bit_generator.state
+        tmp_path = self.path + ".json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(snapshot_tmp, self.path + ".ckpt")
+        os.replace(tmp_path, self.path + ".json")
+    
+    def save_packed(self, path):
+        """Guarda la grilla actual empaquetada a 2 bits por celda (archivo .npz)"""
+        np.savez(path, packed=pack_grid(self.grid), size=self.size, step=self.step_count)
+    
+    @classmethod
+    def load_packed(cls, path, block_rows=256):
+        """Carga una grilla guardada con `save_packed`"""
+        data = np.load(path)
+        size = int(data["size"])
+        compact = cls.from_grid(unpack_grid(data["packed"], (size, size)), block_rows=block_rows)
+        compact.step_count = int(data["step"])
+        return compact
+
+# Motores con estado propio (se construyen a partir de la grilla inicial)
+STATEFUL_ENGINES = {
+    "frontier": FrontierEngine,
+    "compact": CompactGrid.from_grid,
+}
+
+ENGINE_NAMES = tuple(UPDATE_ENGINES) + tuple(STATEFUL_ENGINES)
+
+def compare_update_engines(size=30, num_infected=20, num_steps=50, seed=0):
+    """
+    Verifica que el motor vectorizado reproduce exactamente la implementación de referencia
+    
+    Ambos motores reciben el mismo campo aleatorio en cada paso.
+    
+    Args:
+        size: Tamaño de la grilla de prueba
+        num_infected: Número inicial de infectados
+        num_steps: Número de pasos a comparar
+        seed: Semilla para la comparación
+    
+    Returns:
+        True si las grillas coinciden en todos los pasos
+    """
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size), dtype=int)
+    grid.flat[rng.choice(size * size, num_infected, replace=False)] = INFECTED
+    grid_ref = grid.copy()
+    
+    for step in range(num_steps):
+        random_field = rng.random((size, size))
+        grid_ref = update_grid(grid_ref, infection_prob, recovery_prob, random_field)
+        grid = update_grid_vectorized(grid, infection_prob, recovery_prob, random_field)
+        if not np.array_equal(grid, grid_ref):
+            print(f"❌ Los motores difieren en el paso {step}")
+            return False
+    
+    print(f"✅ Motores equivalentes en {num_steps} pasos ({size}x{size})")
+    return True
+
+def compare_engines_statistically(engine_a="vectorized", engine_b="frontier", runs=200,
+                                  size=40, num_infected=5, num_steps=100, seed=0):
+    """
+    Compara dos motores mediante el promedio de muchas realizaciones
+    
+    Los motores que no comparten la secuencia de números aleatorios no pueden
+    compararse paso a paso; en cambio se verifica que el pico de infectados y la
+    tasa de ataque final medios coincidan dentro de 4 errores estándar.
+    
+    Args:
+        engine_a, engine_b: Nombres de los motores (ver `ENGINE_NAMES`)
+        runs: Realizaciones por motor
+        size, num_infected, num_steps: Parámetros de las realizaciones
+        seed: Semilla base
+    
+    Returns:
+        True si las métricas son estadísticamente compatibles
+    """
+    metrics = {}
+    for engine in (engine_a, engine_b):
+        peaks, attack = [], []
+        for run in range(runs):
+            history = run_simulation(size, infection_prob, recovery_prob, num_infected, num_steps,
+                                     seed=(seed, run), engine=engine)
+            peaks.append(history[1].max())
+            attack.append(size * size - history[0, -1])
+        metrics[engine] = {"pico": np.array(peaks), "ataque": np.array(attack)}
+    
+    compatible = True
+    for name in ("pico", "ataque"):
+        a, b = metrics[engine_a][name], metrics[engine_b][name]
+        standard_error = np.sqrt(a.var(ddof=1) / a.size + b.var(ddof=1) / b.size)
+        z = abs(a.mean() - b.mean()) / standard_error if standard_error > 0 else 0.0
+        ok = z < 4
+        compatible &= ok
+        print(f"{'✅' if ok else '❌'} {name}: {engine_a}={a.mean():.1f}, {engine_b}={b.mean():.1f} (z={z:.2f})")
+    return bool(compatible)
+
+def create_engine(engine, grid, kernel=None, infection_rule="any", grid_path=None):
+    """
+    Prepara un motor de actualización para una grilla inicial
+    
+    Args:
+        engine: Nombre del motor (ver `ENGINE_NAMES`)
+        grid: Grilla inicial; para el motor "compact" también puede ser una
+            `CompactGrid` ya creada, que se usa tal cual
+        kernel: `NeighborhoodKernel` del motor "kernel"
+        infection_rule: Regla de infección del motor "kernel"
+        grid_path: Archivo `.npy` donde mapear los búferes del motor "compact"
+    
+    Returns:
+        step_function: Función (grid, infection_prob, recovery_prob, rng=...) -> grilla nueva
+        count_states: Función (grid) -> conteos S, I, R (los motores con estado
+            devuelven sus contadores incrementales sin recorrer la grilla)
+    """
+    if isinstance(grid, CompactGrid):
+        stepper = grid
+    elif engine == "compact":
+        stepper = CompactGrid.from_grid(grid, path=grid_path)
+    elif engine in STATEFUL_ENGINES:
+        stepper = STATEFUL_ENGINES[engine](grid)
+    if engine in STATEFUL_ENGINES:
+        return stepper.step, lambda grid: stepper.counts
+    
+    if engine == "kernel":
+        step_function = functools.partial(update_grid_kernel, kernel=kernel,
+                                          infection_rule=infection_rule)
+    else:
+        step_function = UPDATE_ENGINES[engine]
+    return step_function, lambda grid: np.bincount(grid.ravel(), minlength=3)[:3]
+
+def run_simulation(grid_size, infection_prob, recovery_prob, initial_infected, steps,
+                   seed=None, engine="vectorized", verbose=False, snapshot_writer=None,
+                   checkpoint_path=None, checkpoint_every=0, resume=False,
+                   kernel=None, infection_rule="any", renderer=None, grid_path=None):
+    """
+    Ejecuta una realización de la simulación con parámetros explícitos
+    
+    No depende de las variables globales del módulo, por lo que puede ejecutarse
+    en procesos trabajadores (ver `ensamble_enfermedad.py`).
+    
+    Args:
+        grid_size: Tamaño de la grilla (grid_size x grid_size)
+        infection_prob: Probabilidad de infección
+        recovery_prob: Probabilidad de recuperación
+        initial_infected: Número de infectados al inicio
+        steps: Número máximo de pasos de simulación
+        seed: Semilla (entero o `np.random.SeedSequence`) del generador de la realización
+        engine: Nombre del motor de actualización (ver `ENGINE_NAMES`)
+        verbose: Si es True, muestra el progreso cada 20 pasos
+        snapshot_writer: Objeto opcional con `write(step, grid)` y `flush()`
+            (ver `salida_simulacion.SnapshotWriter`)
+        checkpoint_path: Archivo `.npz` para los puntos de control
+        checkpoint_every: Guardar un punto de control cada N pasos (0 = nunca)
+        resume: Si es True y existe `checkpoint_path`, continúa desde ese punto
+        kernel: `NeighborhoodKernel` del motor "kernel" (por defecto von Neumann)
+        infection_rule: Regla de infección del motor "kernel" ("any" o "pressure")
+        renderer: Objeto opcional con `write(step, grid)` que recibe cada grilla
+            (ver `render_simulacion.FrameRenderer`)
+        grid_path: Archivo `.npy` opcional donde el motor "compact" mapea sus
+            búferes, para grillas más grandes que la RAM; los puntos de control
+            y la reanudación usan entonces `CompactGrid.checkpoint` / `CompactGrid.open`
+    
+    Returns:
+        history: Arreglo (3, pasos ejecutados) con los conteos S, I, R de cada paso
+    """
+    rng = np.random.default_rng(seed)
+    history = np.zeros((3, steps), dtype=np.int64)
+    start_step = 0
+    
+    # Con el motor "compact" en disco la grilla no pasa por la RAM: sus puntos de
+    # control son los de `CompactGrid` y el `.npz` guarda solo generador e historial
+    on_disk = engine == "compact" and grid_path is not None
+    
+    if resume and checkpoint_path and os.path.exists(checkpoint_path):
+        # Restaurar grilla, generador e historial: la corrida sigue exactamente igual
+        checkpoint = load_checkpoint(checkpoint_path)
+        if on_disk:
+            grid = CompactGrid.open(grid_path)
+            if grid.step_count != checkpoint["step"] + 1:
+                raise ValueError(f"El punto de control de {grid_path} (paso {grid.step_count - 1}) "
+                                 f"no coincide con {checkpoint_path} (paso {checkpoint['step']})")
+        else:
+            grid = checkpoint["grid"]
+        rng.bit_generator.state = checkpoint["rng_state"]
+        start_step = checkpoint["step"] + 1
+        history[:, :start_step] = checkpoint["history"][:, :steps]
+        if start_step >= steps or checkpoint["history"][1, -1] == 0:
+            return checkpoint["history"][:, :steps]
+    elif engine == "compact":
+        # Los búferes se crean directamente (en RAM o en disco), sin grilla densa intermedia
+        grid = CompactGrid.create(grid_size, initial_infected, rng, path=grid_path)
+    else:
+        grid = initialize_grid(grid_size, initial_infected, rng, dtype=np.uint8)
+    
+    disk_grid = grid if on_disk else None
+    step_function, count_states = create_engine(engine, grid, kernel, infection_rule, grid_path)
+    
+    for step in range(start_step, steps):
         # Actualizar grilla
-        grid = update_grid(grid, infection_prob, recovery_prob)
+        grid = step_function(grid, infection_prob, recovery_prob, rng=rng)
         
         # Registrar estadísticas
-        susceptible_count = np.sum(grid == SUSCEPTIBLE)
-        infected_count = np.sum(grid == INFECTED)
-        recovered_count = np.sum(grid == RECOVERED)
+        counts = count_states(grid)
+        susceptible_count, infected_count, recovered_count = (int(c) for c in counts[:3])
+        history[:, step] = susceptible_count, infected_count, recovered_count
+        
+        if snapshot_writer is not None:
+            snapshot_writer.write(step, grid)
+        if renderer is not None:
+            renderer.write(step, grid)
         
-        history_s.append(susceptible_count)
-        history_i.append(infected_count)
-        history_r.append(recovered_count)
+        if checkpoint_path and checkpoint_every and (step + 1) % checkpoint_every == 0:
+            # Las instantáneas hasta este paso quedan en disco antes del punto de control
+            if snapshot_writer is not None:
+                snapshot_writer.flush()
+            if disk_grid is not None:
+                disk_grid.checkpoint(rng)
+                save_checkpoint(checkpoint_path, None, rng, step, history[:, :step + 1])
+            else:
+                save_checkpoint(checkpoint_path, grid, rng, step, history[:, :step + 1])
         
         # Mostrar progreso cada 20 pasos
-        if step % 20 == 0:
+        if verbose and step % 20 == 0:
             print(f"Paso {step:3d}: S={susceptible_count:4d}, I={infected_count:4d}, R={recovered_count:4d}")
         
         # Terminar si no hay más infectados
         if infected_count == 0:
-            print(f"\n🎯 Simulación terminó en el paso {step} (no hay más infectados)")
-            break
+            if verbose:
+                print(f"\n🎯 Simulación terminó en el paso {step} (no hay más infectados)")
+            return history[:, :step + 1]
+    
+    return history
+
+def simulate_disease_spread(engine=None, seed=None):
+    """
+    Ejecuta la simulación completa de propagación de enfermedad
+    
+    Args:
+        engine: Nombre del motor de actualización (ver `UPDATE_ENGINES`);
+            por defecto se usa `update_engine`
+        seed: Semilla opcional del generador aleatorio
+    
+    Returns:
+        history_s, history_i, history_r: Listas con el historial de cada estado
+    """
+    engine = update_engine if engine is None else engine
+    
+    print("🦠 Iniciando simulación de propagación de enfermedad...")
+    print(f"📊 Parámetros:")
+    print(f"   • Tamaño de grilla: {grid_size}x{grid_size}")
+    print(f"   • Probabilidad de infección: {infection_prob}")
+    print(f"   • Probabilidad de recuperación: {recovery_prob}")
+    print(f"   • Infectados iniciales: {initial_infected}")
+    print(f"   • Pasos de simulación: {steps}")
+    print(f"   • Motor de actualización: {engine}")
+    print()
+    
+    # Simulación
+    history = run_simulation(grid_size, infection_prob, recovery_prob, initial_infected, steps,
+                             seed=seed, engine=engine, verbose=True)
+    history_s, history_i, history_r = (row.tolist() for row in history)
     
     print(f"\n✅ Simulación completada!")
     return history_s, history_i, history_r
 
-def plot_results(history_s, history_i, history_r):
+def plot_results(history_s, history_i, history_r, output_path=None, total_population=None, dpi=150):
     """
     Crea gráficos de los resultados de la simulación
     
     Args:
         history_s, history_i, history_r: Historiales de cada estado
+        output_path: Si se indica, guarda la figura en este archivo en lugar de
+            mostrarla (modo sin pantalla, no bloquea)
+        total_population: Población total (por defecto grid_size * grid_size)
+        dpi: Resolución de la imagen guardada
     """
-    plt.figure(figsize=(12, 8))
+    fig = plt.figure(figsize=(12, 8))
     
     # Gráfico principal
     plt.subplot(2, 1, 1)
@@ -172,10 +880,12 @@ def plot_results(history_s, history_i, history_r):
     
     # Gráfico de porcentajes
     plt.subplot(2, 1, 2)
-    total_population = grid_size * grid_size
-    plt.plot([s/total_population*100 for s in history_s], label='% Susceptible', color='blue', linewidth=2)
-    plt.plot([i/total_population*100 for i in history_i], label='% Infected', color='red', linewidth=2)
-    plt.plot([r/total_population*100 for r in history_r], label='% Recovered', color='green', linewidth=2)
+    if total_population is None:
+        total_population = grid_size * grid_size
+    percentages = np.array([history_s, history_i, history_r], dtype=float) * (100.0 / total_population)
+    plt.plot(percentages[0], label='% Susceptible', color='blue', linewidth=2)
+    plt.plot(percentages[1], label='% Infected', color='red', linewidth=2)
+    plt.plot(percentages[2], label='% Recovered', color='green', linewidth=2)
     plt.xlabel("Paso de tiempo")
     plt.ylabel("Porcentaje de población")
     plt.title("Distribución Porcentual de Estados")
@@ -183,7 +893,12 @@ def plot_results(history_s, history_i, history_r):
     plt.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    if output_path is None:
+        plt.show()
+    else:
+        fig.savefig(output_path, dpi=dpi)
+        plt.close(fig)
+        print(f"🖼️  Gráfico guardado en {output_path}")
     
     # Estadísticas finales
     print(f"\n📈 Estadísticas finales:")
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Comparación Paralela de los Métodos de Maximización
+===================================================
+
+Ejecuta cada método de `maximizacion_funcion.METODOS` en su propio proceso
+trabajador. El `Objetivo` cuenta cada evaluación de f y de f', así que por
+corrida se registran las evaluaciones reales, el tiempo de pared y el error
+respecto del máximo conocido (`Objetivo.valor_optimo`). Los métodos
+estocásticos se repiten con varias semillas.
+
+La tabla final resume cada método y señala el más barato (menos evaluaciones)
+que alcanza la tolerancia pedida en todas sus corridas.
+
+Uso:
+    python comparacion_metodos.py --semillas 10 --tolerancia 1e-8 --workers 4 \\
+        --output comparacion.csv
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+import contextlib
+import csv
+import inspect
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import maximizacion_funcion as mf
+
+def _es_estocastico(metodo):
+    """Los métodos estocásticos reciben una `semilla`"""
+    return "semilla" in inspect.signature(metodo).parameters
+
+def _ejecutar_corrida(nombre_metodo, nombre_objetivo, semilla, modulos):
+    """
+    Ejecuta un método una vez en el proceso trabajador
+
+    Los contadores del objetivo se reinician antes de la corrida (el proceso
+    puede haber ejecutado otras tareas) y la salida por consola del método se
+    descarta.
+
+    Returns:
+        Diccionario con x*, f(x*), evaluaciones, evaluaciones de f' y tiempo
+    """
+    for ruta in modulos:
+        mf.cargar_objetivos(ruta)
+    objetivo = mf.obtener_objetivo(nombre_objetivo)
+    objetivo.evaluaciones = objetivo.evaluaciones_derivada = 0
+    metodo = mf.METODOS[nombre_metodo]
+    argumentos = {"semilla": semilla} if _es_estocastico(metodo) else {}
+
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        x_opt, f_opt = metodo(objetivo, **argumentos)
+    tiempo = time.perf_counter() - inicio
+
+    return {
+        "metodo": nombre_metodo,
+        "semilla": semilla if argumentos else None,
+        "x": None if x_opt is None else np.atleast_1d(x_opt).tolist(),
+        "f": None if f_opt is None else float(f_opt),
+        "evaluaciones": objetivo.evaluaciones,
+        "evaluaciones_derivada": objetivo.evaluaciones_derivada,
+        "tiempo": tiempo,
+    }
+
+def ejecutar_comparacion(objetivo=None, metodos=None, semillas=range(5), workers=None, modulos=()):
+    """
+    Ejecuta todas las corridas (método, semilla) en un pool de procesos
+
+    Args:
+        objetivo: Nombre del objetivo registrado (por defecto f(x))
+        metodos: Nombres de métodos (por defecto todos los aplicables)
+        semillas: Semillas para los métodos estocásticos; los deterministas
+            se ejecutan una sola vez
+        workers: Procesos trabajadores (None = todos los núcleos)
+        modulos: Archivos de objetivos de usuario a registrar en cada trabajador
+
+    Returns:
+        Lista de corridas (diccionarios de `_ejecutar_corrida`)
+    """
+    instancia = mf.obtener_objetivo(objetivo)
+    if metodos is None:
+        metodos = [nombre for nombre, _ in mf.metodos_aplicables(instancia)]
+
+    tareas = []
+    for nombre in metodos:
+        for semilla in (semillas if _es_estocastico(mf.METODOS[nombre]) else [None]):
+            tareas.append((nombre, instancia.nombre, semilla, list(modulos)))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futuros = [executor.submit(_ejecutar_corrida, *tarea) for tarea in tareas]
+        return [futuro.result() for futuro in futuros]
+
+def resumir_comparacion(corridas, valor_optimo=None, tolerancia=1e-6):
+    """
+    Resume las corridas por método
+
+    Args:
+        corridas: Resultado de `ejecutar_comparacion`
+        valor_optimo: Máximo global de referencia; si es None se usa el mejor
+            valor encontrado entre todas las corridas
+        tolerancia: Error máximo f* - f(x*) aceptado
+
+    Returns:
+        Lista de filas (diccionarios) ordenadas por evaluaciones medias
+    """
+    if valor_optimo is None:
+        valor_optimo = max(c["f"] for c in corridas if c["f"] is not None)
+
+    filas = []
+    for metodo in dict.fromkeys(c["metodo"] for c in corridas):
+        propias = [c for c in corridas if c["metodo"] == metodo]
+        errores = np.array([np.inf if c["f"] is None else valor_optimo - c["f"] for c in propias])
+        filas.append({
+            "metodo": metodo,
+            "corridas": len(propias),
+            "evaluaciones": float(np.mean([c["evaluaciones"] for c in propias])),
+            "evaluaciones_derivada": float(np.mean([c["evaluaciones_derivada"] for c in propias])),
+            "tiempo_ms": 1000 * float(np.mean([c["tiempo"] for c in propias])),
+            "error_medio": float(np.mean(errores)),
+            "error_maximo": float(np.max(errores)),
+            "exito": float(np.mean(errores <= tolerancia)),
+        })
+    filas.sort(key=lambda fila: fila["evaluaciones"] + fila["evaluaciones_derivada"])
+    return filas
+
+def metodo_mas_barato(filas):
+    """
+    Método con menos evaluaciones (f + f') que cumple la tolerancia en todas sus corridas
+
+    Returns:
+        Fila del método o None si ninguno la cumple
+    """
+    validas = [fila for fila in filas if fila["exito"] == 1.0]
+    if not validas:
+        return None
+    return min(validas, key=lambda fila: (fila["evaluaciones"] + fila["evaluaciones_derivada"],
+                                          fila["tiempo_ms"]))
+
+def imprimir_tabla(filas, tolerancia):
+    """Imprime la tabla de resultados y el método recomendado"""
+    print(f"\n📈 RESULTADOS (tolerancia f* - f(x*) <= {tolerancia:g}):")
+    print(f"{'Método':<22} {'Corridas':>8} {'Eval. f':>10} {'Eval. df':>9} "
+          f"{'Tiempo ms':>10} {'Error medio':>12} {'Error máx':>12} {'Éxito':>7}")
+    print("-" * 98)
+    for fila in filas:
+        print(f"{fila['metodo']:<22} {fila['corridas']:>8d} {fila['evaluaciones']:>10.0f} "
+              f"{fila['evaluaciones_derivada']:>9.0f} {fila['tiempo_ms']:>10.2f} "
+              f"{fila['error_medio']:>12.3e} {fila['error_maximo']:>12.3e} {fila['exito']:>7.0%}")
+
+    mejor = metodo_mas_barato(filas)
+    if mejor is None:
+        print("\n⚠️  Ningún método cumple la tolerancia en todas sus corridas")
+    else:
+        print(f"\n🏆 Método más barato que cumple la tolerancia: {mejor['metodo']} "
+              f"({mejor['evaluaciones']:.0f} evaluaciones de f, "
+              f"{mejor['evaluaciones_derivada']:.0f} de f')")
+
+def guardar_resultados(ruta, filas):
+    """Guarda la tabla de resultados en CSV"""
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.DictWriter(f, fieldnames=list(filas[0]))
+        escritor.writeheader()
+        escritor.writerows(filas)
+    print(f"💾 Resultados guardados en {ruta}")
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Comparación paralela de métodos de maximización")
+    parser.add_argument("--objetivo", default=mf.OBJETIVO_POR_DEFECTO)
+    parser.add_argument("--modulo", action="append", default=[],
+                        help="Archivo .py con una lista OBJETIVOS a registrar (repetible)")
+    parser.add_argument("--metodos", help="Métodos separados por comas (por defecto todos)")
+    parser.add_argument("--semillas", type=int, default=5,
+                        help="Repeticiones de los métodos estocásticos")
+    parser.add_argument("--tolerancia", type=float, default=1e-6)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="Archivo CSV con la tabla de resultados")
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    args = build_parser().parse_args(argv)
+    for ruta in args.modulo:
+        mf.cargar_objetivos(ruta)
+    objetivo = mf.obtener_objetivo(args.objetivo)
+    metodos = args.metodos.split(",") if args.metodos else None
+
+    print("=" * 60)
+    print(f"📊 COMPARACIÓN PARALELA DE MÉTODOS - {objetivo.descripcion}")
+    print("=" * 60)
+
+    corridas = ejecutar_comparacion(objetivo.nombre, metodos, range(args.semillas),
+                                    workers=args.workers, modulos=args.modulo)
+    if objetivo.valor_optimo is None:
+        print("⚠️  Sin máximo conocido: el error se mide contra el mejor valor encontrado")
+    filas = resumir_comparacion(corridas, objetivo.valor_optimo, args.tolerancia)
+    imprimir_tabla(filas, args.tolerancia)
+
+    if args.output:
+        guardar_resultados(args.output, filas)
+
+if __name__ == "__main__":
+    main()
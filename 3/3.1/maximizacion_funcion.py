@@ -9,13 +9,27 @@ de la función f(x) = x * sin(10πx) + 1 en el intervalo [0,1].
 La función tiene múltiples máximos locales debido al término sinusoidal,
 lo que la convierte en un problema interesante de optimización global.
 
+Todos los métodos trabajan sobre un `Objetivo` registrado (ver `OBJETIVOS`):
+cada función declara sus límites y su dimensión y se evalúa por lotes con
+`Objetivo.evaluar(X)`. Para optimizar otra función sin editar este script:
+
+    python maximizacion_funcion.py --modulo mis_funciones.py --objetivo mi_funcion
+
 Autor: Estudiante IA
 Fecha: Julio 2025
 """
 
+import argparse
+import importlib.util
+import os
+import queue
+import threading
+from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from scipy.optimize import minimize_scalar, differential_evolution, brute
+from scipy.stats import qmc
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -57,57 +71,479 @@ def derivada_funcion(x):
     """
     return np.sin(10 * np.pi * x) + 10 * np.pi * x * np.cos(10 * np.pi * x)
 
-def analizar_funcion():
+class CacheEvaluaciones:
     """
-    Analiza las características de la función y genera gráfico
+    Caché LRU de evaluaciones indexada por x cuantizado
+
+    Dos puntos cuyas coordenadas redondeadas a múltiplos de `tolerancia`
+    coinciden comparten la entrada. La clave son los bytes `float64` de x
+    redondeado (no un entero), así que no hay desbordamiento para |x| grande.
+    Los puntos ausentes de un lote (sin repetidos) se evalúan juntos en una
+    sola llamada. Al superar `capacidad` entradas se descartan las usadas hace
+    más tiempo.
     """
-    print("🔍 ANÁLISIS DE LA FUNCIÓN f(x) = x·sin(10πx) + 1")
-    print("=" * 60)
-    
-    # Generar puntos para el gráfico
-    x = np.linspace(0, 1, 1000)
-    y = funcion_objetivo(x)
-    dy = derivada_funcion(x)
-    
-    # Crear gráfico
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+
+    def __init__(self, tolerancia=1e-12, capacidad=10 ** 6, ruta=None):
+        """
+        Args:
+            tolerancia: Paso de cuantización de x
+            capacidad: Máximo de entradas en memoria
+            ruta: Archivo `.npz` para persistir la caché (se carga si existe)
+        """
+        self.tolerancia = tolerancia
+        self.capacidad = capacidad
+        self.ruta = ruta
+        self.aciertos = 0
+        self.fallos = 0
+        self.nombre = None
+        self._datos = OrderedDict()
+        if ruta is not None and os.path.exists(ruta):
+            self._cargar(ruta)
+
+    def _claves(self, X):
+        """Una clave `bytes` por fila de X cuantizado"""
+        with np.errstate(over="ignore"):
+            cuantizado = np.round(X / self.tolerancia) * self.tolerancia
+        # Si X / tolerancia desborda se usa x tal cual; + 0.0 unifica -0.0 y 0.0
+        cuantizado = np.ascontiguousarray(np.where(np.isfinite(cuantizado), cuantizado, X) + 0.0,
+                                          dtype=np.float64)
+        return cuantizado.view(np.dtype((np.void, 8 * X.shape[1]))).ravel().tolist()
+
+    def evaluar(self, X, funcion):
+        """
+        Devuelve f(X) usando la caché; `funcion` solo recibe los puntos nuevos
+
+        Args:
+            X: Matriz (n, d)
+            funcion: Evaluación por lotes sin caché
+
+        Returns:
+            Arreglo (n,) con los valores
+        """
+        valores = np.empty(len(X))
+        faltantes = {}
+        for i, clave in enumerate(self._claves(X)):
+            valor = self._datos.get(clave)
+            if valor is not None:
+                self._datos.move_to_end(clave)
+                valores[i] = valor
+                self.aciertos += 1
+            else:
+                faltantes.setdefault(clave, []).append(i)
+
+        if faltantes:
+            posiciones = list(faltantes.values())
+            nuevos = funcion(X[[indices[0] for indices in posiciones]])
+            for (clave, indices), valor in zip(faltantes.items(), nuevos):
+                valores[indices] = valor
+                self._datos[clave] = float(valor)
+            self.fallos += len(faltantes)
+            self.aciertos += sum(len(indices) - 1 for indices in posiciones)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+        return valores
+
+    def estadisticas(self):
+        """Diccionario con aciertos, fallos, tasa de aciertos y entradas"""
+        consultas = self.aciertos + self.fallos
+        return {"aciertos": self.aciertos, "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+                "entradas": len(self._datos)}
+
+    def guardar(self, ruta=None):
+        """Persiste la caché en un `.npz` (escritura atómica)"""
+        ruta = ruta or self.ruta
+        claves = b"".join(self._datos.keys())
+        with open(ruta + ".tmp", "wb") as f:
+            np.savez_compressed(f, claves=np.frombuffer(claves, dtype=np.float64),
+                                valores=np.fromiter(self._datos.values(), float, len(self._datos)),
+                                tolerancia=self.tolerancia,
+                                nombre="" if self.nombre is None else str(self.nombre))
+        os.replace(ruta + ".tmp", ruta)
+
+    def _cargar(self, ruta):
+        with np.load(ruta) as datos:
+            if float(datos["tolerancia"]) != self.tolerancia:
+                raise ValueError(f"La caché {ruta} usa otra tolerancia ({float(datos['tolerancia'])})")
+            if datos["claves"].dtype != np.float64:
+                raise ValueError(f"La caché {ruta} usa un formato de claves anterior; bórrela")
+            self.nombre = str(datos["nombre"]) or None
+            claves = datos["claves"].reshape(len(datos["valores"]), -1) if len(datos["valores"]) else []
+            for clave, valor in zip(claves, datos["valores"]):
+                self._datos[clave.tobytes()] = float(valor)
+
+class Objetivo:
+    """
+    Función objetivo con límites, dimensión y evaluación por lotes
+
+    `funcion` recibe un lote de puntos: un arreglo (n,) si la dimensión es 1
+    o una matriz (n, d) en otro caso, y devuelve los n valores. Si la función
+    solo acepta un punto a la vez, usar `vectorizada=False` y el lote se
+    recorre punto por punto.
+    """
+
+    def __init__(self, nombre, funcion, limites, derivada=None, vectorizada=True,
+                 descripcion=None, tamano_lote=100000, valor_optimo=None):
+        """
+        Args:
+            nombre: Nombre con el que se registra
+            funcion: Función a maximizar
+            limites: Lista de pares (mínimo, máximo), uno por dimensión
+            derivada: Derivada analítica (solo 1-D, opcional)
+            vectorizada: Si `funcion` acepta lotes de puntos
+            descripcion: Texto para títulos y reportes (por defecto el nombre)
+            tamano_lote: Máximo de puntos por llamada a `funcion`
+            valor_optimo: Máximo global conocido (para medir la precisión)
+        """
+        self.nombre = nombre
+        self.funcion = funcion
+        self.limites = np.asarray(limites, dtype=float).reshape(-1, 2)
+        self.dimension = len(self.limites)
+        self.derivada = derivada
+        self.vectorizada = vectorizada
+        self.descripcion = descripcion or nombre
+        self.tamano_lote = tamano_lote
+        self.valor_optimo = valor_optimo
+        self.evaluaciones = 0
+        self.evaluaciones_derivada = 0
+        self.cache = None
+
+    def como_matriz(self, X):
+        """Convierte un punto o lote de puntos en una matriz (n, dimensión)"""
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 0 or (X.ndim == 1 and self.dimension > 1):
+            return X.reshape(1, -1)
+        return X.reshape(len(X), -1)
+
+    def usar_cache(self, cache):
+        """
+        Comparte una `CacheEvaluaciones` entre todos los métodos que usen este objetivo
+
+        Args:
+            cache: Caché a usar (None la desactiva)
+        """
+        if cache is not None:
+            if cache.nombre not in (None, self.nombre):
+                raise ValueError(f"La caché pertenece al objetivo {cache.nombre!r}")
+            cache.nombre = self.nombre
+        self.cache = cache
+
+    def evaluar(self, X):
+        """
+        Evalúa la función en un lote de puntos
+
+        Con caché activa solo se evalúan los puntos nuevos; `evaluaciones`
+        cuenta siempre las llamadas reales a la función.
+
+        Args:
+            X: Matriz (n, dimensión); en 1-D también se acepta un arreglo (n,)
+
+        Returns:
+            Arreglo (n,) con los valores
+        """
+        X = self.como_matriz(X)
+        if self.cache is not None:
+            return self.cache.evaluar(X, self._evaluar_sin_cache)
+        return self._evaluar_sin_cache(X)
+
+    def _evaluar_sin_cache(self, X):
+        self.evaluaciones += len(X)
+        valores = np.empty(len(X))
+        for inicio in range(0, len(X), self.tamano_lote):
+            bloque = X[inicio:inicio + self.tamano_lote]
+            puntos = bloque[:, 0] if self.dimension == 1 else bloque
+            if self.vectorizada:
+                valores[inicio:inicio + len(bloque)] = self.funcion(puntos)
+            else:
+                valores[inicio:inicio + len(bloque)] = [self.funcion(p) for p in puntos]
+        return valores
+
+    def derivar(self, x):
+        """
+        Derivada analítica en un lote de puntos (solo objetivos 1-D)
+
+        Args:
+            x: Arreglo de puntos
+
+        Returns:
+            Arreglo con f'(x), de la misma forma que `x`
+        """
+        x = np.asarray(x, dtype=float)
+        self.evaluaciones_derivada += x.size
+        return self.derivada(x)
+
+    def negativa(self, x):
+        """-f(x) en un solo punto, para minimizadores escalares"""
+        return -self.evaluar(x)[0]
+
+    def negativa_por_lotes(self, X):
+        """-f en los puntos de las columnas de X (d, S), convención `vectorized` de SciPy"""
+        return -self.evaluar(np.asarray(X).T)
+
+OBJETIVOS = {}
+
+OBJETIVO_POR_DEFECTO = "x_sin_10pi_x"
+
+def registrar_objetivo(objetivo):
+    """
+    Registra un objetivo en `OBJETIVOS` (reemplaza uno con el mismo nombre)
+
+    Returns:
+        El mismo objetivo
+    """
+    OBJETIVOS[objetivo.nombre] = objetivo
+    return objetivo
+
+def obtener_objetivo(objetivo=None):
+    """
+    Resuelve un objetivo por nombre
+
+    Args:
+        objetivo: Nombre registrado, instancia de `Objetivo` o None (por defecto)
+
+    Returns:
+        Instancia de `Objetivo`
+    """
+    if isinstance(objetivo, Objetivo):
+        return objetivo
+    nombre = OBJETIVO_POR_DEFECTO if objetivo is None else objetivo
+    if nombre not in OBJETIVOS:
+        raise ValueError(f"Objetivo desconocido: {nombre!r} (disponibles: {', '.join(OBJETIVOS)})")
+    return OBJETIVOS[nombre]
+
+def cargar_objetivos(ruta):
+    """
+    Registra los objetivos definidos en un archivo de Python externo
+
+    El archivo debe definir una lista `OBJETIVOS` de diccionarios con los
+    argumentos de `Objetivo`, por ejemplo:
+
+        OBJETIVOS = [dict(nombre="parabola", funcion=lambda x: -(x - 0.3) ** 2,
+                          limites=[(0, 1)])]
+
+    Returns:
+        Lista de nombres registrados
+    """
+    spec = importlib.util.spec_from_file_location("objetivos_usuario", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return [registrar_objetivo(Objetivo(**definicion)).nombre for definicion in modulo.OBJETIVOS]
+
+registrar_objetivo(Objetivo(OBJETIVO_POR_DEFECTO, funcion_objetivo, [(0, 1)],
+                            derivada=derivada_funcion, descripcion="f(x) = x·sin(10πx) + 1",
+                            valor_optimo=1.8505952429626031))
+
+def crear_rastrigin(dimension):
+    """
+    Función de Rastrigin negada (para maximizar) en [-5.12, 5.12]^d
+
+    f(x) = -(10d + Σ x_i² - 10 cos(2π x_i)); máximo global 0 en x = 0,
+    rodeado de ~10^d máximos locales.
+    """
+    def rastrigin(X):
+        return -(10 * dimension + np.sum(X ** 2 - 10 * np.cos(2 * np.pi * X), axis=1))
+    return Objetivo(f"rastrigin_{dimension}d", rastrigin, [(-5.12, 5.12)] * dimension,
+                    descripcion=f"-Rastrigin ({dimension}-D)", valor_optimo=0.0)
+
+def crear_ackley(dimension):
+    """
+    Función de Ackley negada (para maximizar) en [-32.768, 32.768]^d
+
+    Máximo global 0 en x = 0 dentro de una meseta casi plana con muchos
+    máximos locales.
+    """
+    def ackley(X):
+        radio = np.sqrt(np.mean(X ** 2, axis=1))
+        oscilacion = np.mean(np.cos(2 * np.pi * X), axis=1)
+        return -(-20 * np.exp(-0.2 * radio) - np.exp(oscilacion) + 20 + np.e)
+    return Objetivo(f"ackley_{dimension}d", ackley, [(-32.768, 32.768)] * dimension,
+                    descripcion=f"-Ackley ({dimension}-D)", valor_optimo=0.0)
+
+for _dimension in (2, 6):
+    registrar_objetivo(crear_rastrigin(_dimension))
+    registrar_objetivo(crear_ackley(_dimension))
+
+def puntos_por_eje_por_defecto(dimension, presupuesto=10 ** 6):
+    """Puntos por eje de una grilla de ~`presupuesto` puntos (10000 en 1-D)"""
+    if dimension == 1:
+        return 10000
+    return max(2, int(round(presupuesto ** (1 / dimension))))
+
+def barrido_grilla(objetivo, puntos_por_eje, tamano_bloque=2 ** 16):
+    """
+    Recorre una grilla regular de N dimensiones por bloques de memoria acotada
+
+    La grilla nunca se materializa: cada bloque convierte un rango de índices
+    planos en coordenadas (`np.unravel_index`) y se evalúa en un solo lote,
+    así que una grilla 6-D de miles de millones de puntos usa la memoria de
+    un bloque.
+
+    Args:
+        objetivo: Objetivo
+        puntos_por_eje: Entero o lista con los puntos de cada eje
+        tamano_bloque: Puntos por bloque
+
+    Returns:
+        (mejor x como arreglo (d,), mejor f, puntos evaluados)
+    """
+    forma = tuple(np.broadcast_to(puntos_por_eje, objetivo.dimension).astype(int))
+    ejes = [np.linspace(bajo, alto, n) for (bajo, alto), n in zip(objetivo.limites, forma)]
+    total = int(np.prod(forma, dtype=np.int64))
+
+    mejor_x, mejor_f = None, -np.inf
+    for inicio in range(0, total, tamano_bloque):
+        indices = np.unravel_index(np.arange(inicio, min(inicio + tamano_bloque, total)), forma)
+        X = np.column_stack([eje[i] for eje, i in zip(ejes, indices)])
+        valores = objetivo.evaluar(X)
+        k = np.argmax(valores)
+        if valores[k] > mejor_f:
+            mejor_x, mejor_f = X[k], valores[k]
+    return mejor_x, mejor_f, total
+
+def _requiere_1d(objetivo, metodo):
+    """Valida que el objetivo sea de una variable para los métodos 1-D"""
+    if objetivo.dimension != 1:
+        raise ValueError(f"{metodo} solo admite objetivos de una variable "
+                         f"({objetivo.nombre} tiene dimensión {objetivo.dimension})")
+
+class EscritorGraficos:
+    """
+    Guarda figuras en un directorio desde un hilo de fondo, sin pantalla
+
+    Las figuras se dibujan con la API orientada a objetos de matplotlib
+    (`Figure` + `FigureCanvasAgg`), que no depende de un backend gráfico ni
+    del estado global de `pyplot`, así que sirve en nodos sin pantalla. Los
+    datos se calculan en el hilo principal; el hilo de fondo solo dibuja y
+    escribe el PNG.
+    """
+
+    def __init__(self, directorio=".", dpi=150, max_pendientes=8):
+        """
+        Args:
+            directorio: Directorio de salida (se crea si no existe)
+            dpi: Resolución de las imágenes
+            max_pendientes: Figuras en cola antes de bloquear al que encola
+        """
+        self.directorio = directorio
+        self.dpi = dpi
+        self.archivos = []
+        self._cola = queue.Queue(maxsize=max_pendientes)
+        self._error = None
+        os.makedirs(directorio, exist_ok=True)
+        self._hilo = threading.Thread(target=self._ejecutar, daemon=True)
+        self._hilo.start()
+
+    def guardar(self, nombre, dibujar, *args, figsize=(12, 8)):
+        """
+        Encola una figura
+
+        Args:
+            nombre: Nombre del archivo dentro del directorio
+            dibujar: Función `dibujar(fig, *args)` que dibuja sobre una `Figure`
+            *args: Datos ya calculados para `dibujar`
+            figsize: Tamaño de la figura en pulgadas
+        """
+        self._cola.put((nombre, dibujar, args, figsize))
+
+    def cerrar(self):
+        """Espera a que se escriban las figuras pendientes y detiene el hilo"""
+        self._cola.put(None)
+        self._hilo.join()
+        if self._error is not None:
+            raise self._error
+        for ruta in self.archivos:
+            print(f"💾 Gráfico guardado en {ruta}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cerrar()
+
+    def _ejecutar(self):
+        while True:
+            item = self._cola.get()
+            if item is None:
+                return
+            if self._error is not None:
+                continue
+            nombre, dibujar, args, figsize = item
+            try:
+                fig = Figure(figsize=figsize)
+                FigureCanvasAgg(fig)
+                dibujar(fig, *args)
+                fig.tight_layout()
+                ruta = os.path.join(self.directorio, nombre)
+                fig.savefig(ruta, dpi=self.dpi, bbox_inches='tight')
+                self.archivos.append(ruta)
+            except Exception as error:
+                self._error = error
+
+def _dibujar_analisis(fig, descripcion, x, y, dy, maximos_locales):
+    """Dibuja la función, sus máximos locales y (si existe) su derivada"""
+    if dy is not None:
+        ax1, ax2 = fig.subplots(2, 1)
+    else:
+        ax1 = fig.subplots(1, 1)
     
     # Gráfico de la función
-    ax1.plot(x, y, 'b-', linewidth=2, label='f(x) = x·sin(10πx) + 1')
+    ax1.plot(x, y, 'b-', linewidth=2, label=descripcion)
     ax1.set_xlabel('x')
     ax1.set_ylabel('f(x)')
     ax1.set_title('Función Objetivo a Maximizar')
     ax1.grid(True, alpha=0.3)
-    ax1.legend()
-    
-    # Encontrar aproximadamente los máximos locales
-    maximos_locales = []
-    for i in range(1, len(y)-1):
-        if y[i] > y[i-1] and y[i] > y[i+1]:
-            maximos_locales.append((x[i], y[i]))
     
     # Marcar máximos locales
     if maximos_locales:
         max_x, max_y = zip(*maximos_locales)
         ax1.plot(max_x, max_y, 'ro', markersize=6, label=f'Máximos locales ({len(maximos_locales)})')
-        ax1.legend()
+    ax1.legend()
     
     # Gráfico de la derivada
-    ax2.plot(x, dy, 'r-', linewidth=2, label="f'(x)")
-    ax2.axhline(y=0, color='k', linestyle='--', alpha=0.5, label='f\'(x) = 0')
-    ax2.set_xlabel('x')
-    ax2.set_ylabel("f'(x)")
-    ax2.set_title('Derivada de la Función')
-    ax2.grid(True, alpha=0.3)
-    ax2.legend()
+    if dy is not None:
+        ax2.plot(x, dy, 'r-', linewidth=2, label="f'(x)")
+        ax2.axhline(y=0, color='k', linestyle='--', alpha=0.5, label='f\'(x) = 0')
+        ax2.set_xlabel('x')
+        ax2.set_ylabel("f'(x)")
+        ax2.set_title('Derivada de la Función')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+
+def analizar_funcion(objetivo=None, graficos=None):
+    """
+    Analiza las características de la función y genera gráfico
+
+    Args:
+        objetivo: Objetivo de una variable (nombre o instancia, por defecto f(x))
+        graficos: `EscritorGraficos` para `analisis_funcion.png` (None = sin gráfico)
+
+    Returns:
+        Lista de máximos locales aproximados (x, f(x))
+    """
+    objetivo = obtener_objetivo(objetivo)
+    _requiere_1d(objetivo, "analizar_funcion")
+    (x_min, x_max), = objetivo.limites
+
+    print(f"🔍 ANÁLISIS DE LA FUNCIÓN {objetivo.descripcion}")
+    print("=" * 60)
+    
+    # Generar puntos para el gráfico
+    x = np.linspace(x_min, x_max, 1000)
+    y = objetivo.evaluar(x)
+    
+    # Encontrar aproximadamente los máximos locales
+    es_maximo = (y[1:-1] > y[:-2]) & (y[1:-1] > y[2:])
+    maximos_locales = list(zip(x[1:-1][es_maximo], y[1:-1][es_maximo]))
     
-    plt.tight_layout()
-    plt.savefig('c:/Users/santi/OneDrive/Documentos/Tareas IA y mini robots/3/3.1/analisis_funcion.png', 
-                dpi=300, bbox_inches='tight')
-    plt.show()
+    # Crear gráfico en segundo plano
+    if graficos is not None:
+        dy = objetivo.derivar(x) if objetivo.derivada is not None else None
+        graficos.guardar('analisis_funcion.png', _dibujar_analisis, objetivo.descripcion,
+                         x, y, dy, maximos_locales,
+                         figsize=(12, 10) if dy is not None else (12, 5))
     
     # Estadísticas básicas
-    print(f"📊 Estadísticas de la función en [0,1]:")
+    print(f"📊 Estadísticas de la función en [{x_min:g},{x_max:g}]:")
     print(f"   • Valor mínimo: {np.min(y):.6f}")
     print(f"   • Valor máximo: {np.max(y):.6f}")
     print(f"   • Número de máximos locales aproximados: {len(maximos_locales)}")
@@ -115,59 +551,92 @@ def analizar_funcion():
     
     return maximos_locales
 
-def metodo_fuerza_bruta():
+def metodo_fuerza_bruta(objetivo=None, puntos_por_eje=None, tamano_bloque=2 ** 16):
     """
     Método de fuerza bruta: evaluar en una grilla fina
+
+    En N dimensiones la grilla se recorre por bloques (`barrido_grilla`).
+
+    Args:
+        objetivo: Objetivo (nombre o instancia, por defecto f(x))
+        puntos_por_eje: Puntos por eje (por defecto 10000 en 1-D y ~10^6 en total en N-D)
+        tamano_bloque: Puntos evaluados por bloque
     """
     print("\n🔨 MÉTODO 1: FUERZA BRUTA")
     print("-" * 40)
+
+    objetivo = obtener_objetivo(objetivo)
+    if puntos_por_eje is None:
+        puntos_por_eje = puntos_por_eje_por_defecto(objetivo.dimension)
     
-    # Crear grilla muy fina
-    x_grid = np.linspace(0, 1, 10000)
-    y_grid = funcion_objetivo(x_grid)
-    
-    # Encontrar máximo
-    idx_max = np.argmax(y_grid)
-    x_max = x_grid[idx_max]
-    f_max = y_grid[idx_max]
+    # Recorrer la grilla fina y quedarse con el máximo
+    x_max, f_max, evaluaciones = barrido_grilla(objetivo, puntos_por_eje, tamano_bloque)
+    x_max = x_max[0] if objetivo.dimension == 1 else x_max
     
     print(f"   🎯 Resultado:")
-    print(f"      x* = {x_max:.8f}")
+    print(f"      x* = {np.round(x_max, 8)}")
     print(f"      f(x*) = {f_max:.8f}")
-    print(f"      Evaluaciones: {len(x_grid)}")
+    print(f"      Evaluaciones: {evaluaciones}")
     
     return x_max, f_max
 
-def metodo_scipy_brute():
+def metodo_scipy_brute(objetivo=None):
     """
     Método scipy.optimize.brute (búsqueda en grilla)
+
+    La grilla completa se evalúa en un solo lote: `brute` recibe como
+    `workers` una función tipo `map` que entrega todos los puntos a
+    `Objetivo.evaluar`. El refinamiento final (`fmin`) es punto a punto.
+    `brute` materializa la grilla, así que en N-D se limita a ~10^6 puntos.
+
+    Args:
+        objetivo: Objetivo (nombre o instancia, por defecto f(x))
     """
     print("\n🔬 MÉTODO 2: SCIPY BRUTE FORCE")
     print("-" * 40)
+
+    objetivo = obtener_objetivo(objetivo)
+    evaluaciones_previas = objetivo.evaluaciones
+
+    def mapa_por_lotes(_, puntos):
+        return -objetivo.evaluar(np.asarray(puntos))
     
     # Usar scipy brute force
-    resultado = brute(funcion_negativa, ranges=[(0, 1)], Ns=1000, full_output=True)
+    Ns = 1000 if objetivo.dimension == 1 else puntos_por_eje_por_defecto(objetivo.dimension)
+    resultado = brute(objetivo.negativa, ranges=[tuple(l) for l in objetivo.limites], Ns=Ns,
+                      full_output=True, workers=mapa_por_lotes)
     
-    x_max = resultado[0][0]
+    x_max = np.atleast_1d(resultado[0])
+    x_max = x_max[0] if objetivo.dimension == 1 else x_max
     f_max = -resultado[1]  # Negativo porque minimizamos -f(x)
     
     print(f"   🎯 Resultado:")
-    print(f"      x* = {x_max:.8f}")
+    print(f"      x* = {np.round(x_max, 8)}")
     print(f"      f(x*) = {f_max:.8f}")
-    print(f"      Evaluaciones: ~1000")
+    print(f"      Evaluaciones: {objetivo.evaluaciones - evaluaciones_previas}")
     
     return x_max, f_max
 
-def metodo_golden_section():
+def metodo_golden_section(objetivo=None):
     """
     Método de sección dorada (para funciones unimodales)
     Nota: No funcionará bien aquí porque la función es multimodal
+
+    Es secuencial por naturaleza: cada evaluación depende de la anterior.
+    Se usa el método 'bounded' de SciPy (sección dorada con pasos parabólicos),
+    ya que 'golden' no admite límites y se sale del dominio.
+
+    Args:
+        objetivo: Objetivo de una variable (nombre o instancia, por defecto f(x))
     """
     print("\n🥇 MÉTODO 3: SECCIÓN DORADA")
     print("-" * 40)
     
     try:
-        resultado = minimize_scalar(funcion_negativa, bounds=(0, 1), method='golden')
+        objetivo = obtener_objetivo(objetivo)
+        _requiere_1d(objetivo, "metodo_golden_section")
+        resultado = minimize_scalar(objetivo.negativa, bounds=tuple(objetivo.limites[0]),
+                                    method='bounded')
         
         x_max = resultado.x
         f_max = -resultado.fun
@@ -184,109 +653,462 @@ def metodo_golden_section():
         print(f"   ❌ Error: {e}")
         return None, None
 
-def metodo_diferencial_evolution():
+def metodo_diferencial_evolution(objetivo=None, semilla=42, maxiter=100, popsize=15):
     """
     Algoritmo evolutivo diferencial (bueno para optimización global)
+
+    Con `vectorized=True` SciPy entrega cada generación completa en una
+    sola llamada a `Objetivo.evaluar`.
+
+    Args:
+        objetivo: Objetivo (nombre o instancia, por defecto f(x))
+        semilla: Semilla del algoritmo
+        maxiter: Generaciones máximas
+        popsize: Multiplicador del tamaño de población (popsize * dimensión)
     """
     print("\n🧬 MÉTODO 4: EVOLUCIÓN DIFERENCIAL")
     print("-" * 40)
+
+    objetivo = obtener_objetivo(objetivo)
+    evaluaciones_previas = objetivo.evaluaciones
     
     # Configurar evolución diferencial
-    bounds = [(0, 1)]
-    resultado = differential_evolution(funcion_negativa, bounds, 
-                                     seed=42, maxiter=100, popsize=15)
+    bounds = [tuple(l) for l in objetivo.limites]
+    resultado = differential_evolution(objetivo.negativa_por_lotes, bounds,
+                                     seed=semilla, maxiter=maxiter, popsize=popsize,
+                                     vectorized=True, updating='deferred')
     
-    x_max = resultado.x[0]
+    x_max = resultado.x[0] if objetivo.dimension == 1 else resultado.x
     f_max = -resultado.fun
     
     print(f"   🎯 Resultado:")
-    print(f"      x* = {x_max:.8f}")
+    print(f"      x* = {np.round(x_max, 8)}")
     print(f"      f(x*) = {f_max:.8f}")
-    print(f"      Evaluaciones: {resultado.nfev}")
+    print(f"      Evaluaciones: {objetivo.evaluaciones - evaluaciones_previas}")
     print(f"      Éxito: {'✅' if resultado.success else '❌'}")
     
     return x_max, f_max
 
-def metodo_busqueda_aleatoria():
+MUESTREADORES = ("uniforme", "sobol", "halton", "lhs")
+
+def crear_muestreador(modo, dimension, semilla=None):
+    """
+    Crea un generador de puntos en el hipercubo unitario [0, 1)^d
+
+    Modos: "uniforme" (i.i.d.), "sobol" y "halton" (cuasi-Monte Carlo con
+    aleatorización) y "lhs" (hipercubo latino: cada lote está estratificado
+    en todos los ejes).
+
+    Args:
+        modo: Uno de `MUESTREADORES`
+        dimension: Dimensión de los puntos
+        semilla: Semilla
+
+    Returns:
+        Función `muestrear(n)` que devuelve una matriz (n, dimension)
+    """
+    if modo == "uniforme":
+        rng = np.random.default_rng(semilla)
+        return lambda n: rng.random((n, dimension))
+    motores = {"sobol": qmc.Sobol, "halton": qmc.Halton, "lhs": qmc.LatinHypercube}
+    if modo not in motores:
+        raise ValueError(f"Muestreador desconocido: {modo!r} (disponibles: {', '.join(MUESTREADORES)})")
+    return motores[modo](dimension, scramble=True, seed=semilla).random
+
+def busqueda_por_muestreo(objetivo, modo="uniforme", semilla=42, n_puntos=50000,
+                          tamano_bloque=4096, paciencia=None, tolerancia=0.0,
+                          valor_objetivo=None):
+    """
+    Búsqueda por muestreo en streaming con parada temprana
+
+    Los puntos se generan y evalúan por lotes de `tamano_bloque`. Se detiene
+    al agotar `n_puntos`, cuando el mejor valor no mejora más de `tolerancia`
+    durante `paciencia` lotes seguidos, o al alcanzar `valor_objetivo`.
+
+    Args:
+        objetivo: Objetivo
+        modo: Muestreador (ver `crear_muestreador`)
+        semilla: Semilla
+        n_puntos: Máximo de puntos a evaluar
+        tamano_bloque: Puntos por lote (potencia de 2 para Sobol)
+        paciencia: Lotes sin mejora antes de parar (None = sin parada temprana)
+        tolerancia: Mejora mínima que reinicia la paciencia
+        valor_objetivo: Parar en cuanto f >= este valor
+
+    Returns:
+        Diccionario con `x`, `f`, `evaluaciones` (hasta el punto en que se
+        alcanzó `valor_objetivo`, si se alcanzó), `traza` (evaluaciones y mejor
+        valor tras cada lote) y `motivo` de la parada
+    """
+    muestrear = crear_muestreador(modo, objetivo.dimension, semilla)
+    bajo, alto = objetivo.limites[:, 0], objetivo.limites[:, 1]
+    x_max, f_max = None, -np.inf
+    evaluaciones, sin_mejora, traza, motivo = 0, 0, [], "presupuesto"
+    while evaluaciones < n_puntos:
+        X = bajo + muestrear(min(tamano_bloque, n_puntos - evaluaciones)) * (alto - bajo)
+        y = objetivo.evaluar(X)
+        k = np.argmax(y)
+        mejora = y[k] - f_max
+        if mejora > 0:
+            x_max, f_max = X[k], y[k]
+
+        if valor_objetivo is not None and f_max >= valor_objetivo:
+            # Primer punto del lote que alcanza el objetivo
+            evaluaciones += int(np.argmax(y >= valor_objetivo)) + 1
+            traza.append((evaluaciones, f_max))
+            motivo = "objetivo"
+            break
+        evaluaciones += len(X)
+        traza.append((evaluaciones, f_max))
+
+        sin_mejora = 0 if mejora > tolerancia else sin_mejora + 1
+        if paciencia is not None and sin_mejora >= paciencia:
+            motivo = "estancamiento"
+            break
+
+    return {"x": x_max, "f": f_max, "evaluaciones": evaluaciones,
+            "traza": np.array(traza), "motivo": motivo}
+
+def metodo_busqueda_aleatoria(objetivo=None, semilla=42, n_puntos=50000, tamano_bloque=4096,
+                              modo="uniforme", paciencia=None, tolerancia=0.0):
     """
     Búsqueda aleatoria Monte Carlo
+
+    Los puntos se generan y evalúan por lotes (`busqueda_por_muestreo`), así
+    que `n_puntos` puede superar la memoria disponible. Además del muestreo
+    uniforme admite Sobol, Halton e hipercubo latino y parada temprana.
+
+    Args:
+        objetivo: Objetivo (nombre o instancia, por defecto f(x))
+        semilla: Semilla del generador
+        n_puntos: Puntos a evaluar como máximo
+        tamano_bloque: Puntos generados y evaluados por lote
+        modo: "uniforme", "sobol", "halton" o "lhs"
+        paciencia: Lotes sin mejora antes de parar (None = evaluar todos)
+        tolerancia: Mejora mínima que cuenta como progreso
     """
-    print("\n🎲 MÉTODO 5: BÚSQUEDA ALEATORIA (MONTE CARLO)")
+    print(f"\n🎲 MÉTODO 5: BÚSQUEDA ALEATORIA (MONTE CARLO, {modo.upper()})")
     print("-" * 40)
-    
-    # Generar puntos aleatorios
-    np.random.seed(42)
-    n_puntos = 50000
-    x_random = np.random.uniform(0, 1, n_puntos)
-    y_random = funcion_objetivo(x_random)
-    
-    # Encontrar el mejor
-    idx_max = np.argmax(y_random)
-    x_max = x_random[idx_max]
-    f_max = y_random[idx_max]
+
+    objetivo = obtener_objetivo(objetivo)
+    resultado = busqueda_por_muestreo(objetivo, modo, semilla, n_puntos, tamano_bloque,
+                                      paciencia, tolerancia)
+    x_max = resultado["x"][0] if objetivo.dimension == 1 else resultado["x"]
+    f_max = resultado["f"]
     
     print(f"   🎯 Resultado:")
-    print(f"      x* = {x_max:.8f}")
+    print(f"      x* = {np.round(x_max, 8)}")
     print(f"      f(x*) = {f_max:.8f}")
-    print(f"      Evaluaciones: {n_puntos}")
+    print(f"      Evaluaciones: {resultado['evaluaciones']}")
+    if resultado["motivo"] == "estancamiento":
+        print(f"      Parada temprana: sin mejora en {paciencia} lotes")
     
     return x_max, f_max
 
-def metodo_analisis_derivada():
+def resolver_raices_por_lotes(funcion, a, b, tolerancia=0.0, max_iter=200, ga=None, gb=None):
+    """
+    Resuelve g(x) = 0 en muchos intervalos [a, b] con cambio de signo a la vez
+
+    Regula falsi con la modificación de Illinois (convergencia superlineal,
+    como la secante, sin perder el encierro de la raíz); si el punto de la
+    secante cae fuera del intervalo por redondeo se usa bisección. Cada
+    iteración es una sola llamada vectorizada a `funcion` con los intervalos
+    que aún no convergen.
+
+    Args:
+        funcion: g, recibe y devuelve arreglos
+        a, b: Arreglos con los extremos; g(a) y g(b) deben tener signos opuestos
+        tolerancia: Ancho final de los intervalos (0 = precisión de máquina)
+        max_iter: Iteraciones máximas
+        ga, gb: Valores de g en `a` y `b` si ya se calcularon (no se vuelven a evaluar)
+
+    Returns:
+        Arreglo con una raíz por intervalo
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    ga = funcion(a) if ga is None else np.array(ga, dtype=float)
+    gb = funcion(b) if gb is None else np.array(gb, dtype=float)
+    if np.any(np.sign(ga) * np.sign(gb) > 0):
+        raise ValueError("Cada intervalo debe contener un cambio de signo")
+
+    x = np.where(ga == 0, a, np.where(gb == 0, b, (a + b) / 2))
+    resuelta = (ga == 0) | (gb == 0)
+    lado_anterior = np.zeros(len(a), dtype=int)
+    for _ in range(max_iter):
+        limite = tolerancia + 4 * np.finfo(float).eps * np.maximum(np.abs(a), np.abs(b))
+        activos = np.flatnonzero(~resuelta & (b - a > limite))
+        if len(activos) == 0:
+            break
+        aa, bb, gaa, gbb = a[activos], b[activos], ga[activos], gb[activos]
+        xs = bb - gbb * (bb - aa) / (gbb - gaa)
+        fuera = ~((xs > aa) & (xs < bb))
+        xs[fuera] = (aa[fuera] + bb[fuera]) / 2
+        gx = funcion(xs)
+        x[activos] = xs
+
+        cero = gx == 0
+        resuelta[activos[cero]] = True
+        mueve_a = ~cero & (np.sign(gx) == np.sign(gaa))
+        mueve_b = ~cero & ~mueve_a
+        izquierda, derecha = activos[mueve_a], activos[mueve_b]
+        a[izquierda], ga[izquierda] = xs[mueve_a], gx[mueve_a]
+        b[derecha], gb[derecha] = xs[mueve_b], gx[mueve_b]
+
+        # Illinois: si el mismo extremo se mueve dos veces seguidas, el otro
+        # pesa la mitad para evitar la convergencia unilateral de regula falsi
+        gb[izquierda[lado_anterior[izquierda] == 1]] /= 2
+        ga[derecha[lado_anterior[derecha] == -1]] /= 2
+        lado_anterior[izquierda], lado_anterior[derecha] = 1, -1
+    return np.where(resuelta, x, (a + b) / 2)
+
+def _derivada_numerica(objetivo, paso=1e-6):
+    """Derivada por diferencias centrales que evalúa f en un solo lote de 2n puntos"""
+    def derivada(x):
+        x = np.asarray(x, dtype=float)
+        valores = objetivo.evaluar(np.concatenate((x + paso, x - paso)))
+        return (valores[:len(x)] - valores[len(x):]) / (2 * paso)
+    return derivada
+
+def encontrar_puntos_criticos(objetivo=None, n_grilla=10000, tolerancia=0.0):
+    """
+    Encuentra todos los puntos críticos de un objetivo 1-D
+
+    Los cambios de signo de f' sobre la grilla se detectan con operaciones de
+    arreglos y todas las raíces se refinan simultáneamente con
+    `resolver_raices_por_lotes`. Los bordes del dominio se agregan como
+    máximos locales cuando f' apunta hacia afuera.
+
+    Args:
+        objetivo: Objetivo de una variable (nombre o instancia, por defecto f(x))
+        n_grilla: Puntos de la grilla de detección
+        tolerancia: Ancho final de los intervalos (0 = precisión de máquina)
+
+    Returns:
+        Diccionario con `maximos` y `minimos` (x ordenados), `valores_maximos`
+        (f en los máximos) y `raices` (todas las raíces de f' en el interior)
+    """
+    objetivo = obtener_objetivo(objetivo)
+    _requiere_1d(objetivo, "encontrar_puntos_criticos")
+    x_min, x_max = objetivo.limites[0]
+
+    x_grid = np.linspace(x_min, x_max, n_grilla)
+    if objetivo.derivada is not None:
+        derivada = objetivo.derivar
+        dy = derivada(x_grid)
+    else:
+        derivada = _derivada_numerica(objetivo, paso=1e-6 * (x_max - x_min))
+        dy = np.gradient(objetivo.evaluar(x_grid), x_grid)
+    signo = np.sign(dy)
+
+    # Ceros exactos en la grilla y cambios de signo entre puntos consecutivos
+    exactos = np.flatnonzero(signo[1:-1] == 0) + 1
+    cruces = np.flatnonzero(signo[:-1] * signo[1:] < 0)
+    raices_cruces = resolver_raices_por_lotes(derivada, x_grid[cruces], x_grid[cruces + 1],
+                                              tolerancia) if len(cruces) else np.empty(0)
+
+    # Clasificación: en un máximo f' pasa de positiva a negativa
+    raices = np.concatenate((raices_cruces, x_grid[exactos]))
+    es_maximo = np.concatenate((signo[cruces] > 0,
+                                (signo[exactos - 1] > 0) & (signo[exactos + 1] < 0)))
+    es_minimo = np.concatenate((signo[cruces] < 0,
+                                (signo[exactos - 1] < 0) & (signo[exactos + 1] > 0)))
+    maximos = raices[es_maximo]
+    if signo[0] < 0:
+        maximos = np.append(maximos, x_min)
+    if signo[-1] > 0:
+        maximos = np.append(maximos, x_max)
+    maximos = np.sort(maximos)
+
+    return {
+        "raices": np.sort(raices),
+        "maximos": maximos,
+        "minimos": np.sort(raices[es_minimo]),
+        "valores_maximos": objetivo.evaluar(maximos),
+    }
+
+def metodo_analisis_derivada(objetivo=None):
     """
     Método basado en análisis de la derivada
+
+    Usa `encontrar_puntos_criticos`: las raíces de f' se refinan a precisión de
+    máquina y solo se evalúa f en los máximos locales. Si el objetivo no
+    declara derivada analítica se usan diferencias finitas.
+
+    Args:
+        objetivo: Objetivo de una variable (nombre o instancia, por defecto f(x))
     """
     print("\n📐 MÉTODO 6: ANÁLISIS DE DERIVADA")
     print("-" * 40)
+
+    objetivo = obtener_objetivo(objetivo)
+    evaluaciones_previas = objetivo.evaluaciones
+    derivadas_previas = objetivo.evaluaciones_derivada
+    criticos = encontrar_puntos_criticos(objetivo)
     
-    # Encontrar raíces de la derivada (puntos críticos)
-    x_test = np.linspace(0, 1, 10000)
-    dy_test = derivada_funcion(x_test)
-    
-    # Encontrar cambios de signo (aproximación de raíces)
-    puntos_criticos = []
-    for i in range(1, len(dy_test)):
-        if dy_test[i-1] * dy_test[i] < 0:  # Cambio de signo
-            x_critico = x_test[i]
-            puntos_criticos.append(x_critico)
-    
-    # Incluir extremos del intervalo
-    puntos_criticos.extend([0, 1])
-    
-    # Evaluar función en todos los puntos críticos
-    valores = [(x, funcion_objetivo(x)) for x in puntos_criticos]
-    
-    # Encontrar el máximo
-    x_max, f_max = max(valores, key=lambda item: item[1])
+    # Encontrar el máximo entre los máximos locales
+    mejor = np.argmax(criticos["valores_maximos"])
+    x_max = criticos["maximos"][mejor]
+    f_max = criticos["valores_maximos"][mejor]
     
     print(f"   🎯 Resultado:")
     print(f"      x* = {x_max:.8f}")
     print(f"      f(x*) = {f_max:.8f}")
-    print(f"      Puntos críticos encontrados: {len(puntos_criticos)}")
+    print(f"      Puntos críticos encontrados: {len(criticos['raices'])} "
+          f"({len(criticos['maximos'])} máximos locales)")
+    print(f"      Evaluaciones: {objetivo.evaluaciones - evaluaciones_previas} "
+          f"(+{objetivo.evaluaciones_derivada - derivadas_previas} de f')")
     
     return x_max, f_max
 
-def comparar_metodos():
+def _refinar_por_subdivision(objetivo, a, b, tolerancia, puntos_por_intervalo=4, max_iter=200):
+    """
+    Refina simultáneamente varios intervalos con un máximo local por subdivisión
+
+    En cada iteración se evalúan `puntos_por_intervalo` puntos interiores de
+    todos los intervalos activos en un solo lote y cada intervalo se reduce a
+    los vecinos del mejor punto (factor 2 / (puntos_por_intervalo + 1)).
+
+    Args:
+        objetivo: Objetivo de una variable
+        a, b: Arreglos con los extremos de los intervalos
+        tolerancia: Ancho final de los intervalos
+        puntos_por_intervalo: Puntos interiores evaluados por iteración
+        max_iter: Iteraciones máximas
+
+    Returns:
+        Arreglo con el centro de cada intervalo refinado
+    """
+    a, b = a.astype(float), b.astype(float)
+    fracciones = np.linspace(0, 1, puntos_por_intervalo + 2)[1:-1]
+    for _ in range(max_iter):
+        activos = np.flatnonzero(b - a > tolerancia)
+        if len(activos) == 0:
+            break
+        ancho = b[activos] - a[activos]
+        X = a[activos, None] + ancho[:, None] * fracciones
+        Y = objetivo.evaluar(X.ravel()).reshape(X.shape)
+        centro = X[np.arange(len(activos)), np.argmax(Y, axis=1)]
+        paso = ancho / (puntos_por_intervalo + 1)
+        a[activos] = np.maximum(a[activos], centro - paso)
+        b[activos] = np.minimum(b[activos], centro + paso)
+    return (a + b) / 2
+
+def metodo_multirresolucion(objetivo=None, n_grilla=200, top_k=3, tolerancia=1e-10):
+    """
+    Maximizador global adaptativo de multirresolución
+
+    1. Evalúa una grilla gruesa en un solo lote y encierra cada máximo local
+       entre sus dos vecinos de la grilla.
+    2. Conserva solo los `top_k` intervalos con mayor valor.
+    3. Refina todos esos intervalos a la vez: con la derivada analítica
+       (regula falsi/Illinois sobre f') cuando f' cambia de signo en el
+       intervalo, o por subdivisión recursiva en otro caso (máximos en el
+       borde del dominio u objetivos sin derivada).
+
+    La grilla debe ser lo bastante fina para separar los picos (para
+    sin(10πx) bastan unos 20 puntos por período). Sin derivada, la precisión
+    en x queda limitada a ~sqrt(épsilon de máquina) porque cerca del máximo
+    los valores de f dejan de distinguirse.
+
+    Args:
+        objetivo: Objetivo de una variable (nombre o instancia, por defecto f(x))
+        n_grilla: Puntos de la grilla gruesa
+        top_k: Intervalos que se refinan
+        tolerancia: Ancho final de los intervalos en x
+
+    Returns:
+        (x*, f(x*))
+    """
+    print("\n🔭 MÉTODO 7: MULTIRRESOLUCIÓN ADAPTATIVA")
+    print("-" * 40)
+
+    objetivo = obtener_objetivo(objetivo)
+    _requiere_1d(objetivo, "metodo_multirresolucion")
+    evaluaciones_previas = objetivo.evaluaciones
+    derivadas_previas = objetivo.evaluaciones_derivada
+    x_min, x_max_dominio = objetivo.limites[0]
+
+    # 1. Grilla gruesa y máximos locales (incluye los bordes del dominio)
+    x_grid = np.linspace(x_min, x_max_dominio, n_grilla)
+    y_grid = objetivo.evaluar(x_grid)
+    y_relleno = np.concatenate(([-np.inf], y_grid, [-np.inf]))
+    es_maximo = (y_grid >= y_relleno[:-2]) & (y_grid >= y_relleno[2:])
+    candidatos = np.flatnonzero(es_maximo)
+
+    # 2. Los top-k intervalos [x[i-1], x[i+1]]
+    candidatos = candidatos[np.argsort(y_grid[candidatos])[::-1][:top_k]]
+    a = x_grid[np.maximum(candidatos - 1, 0)]
+    b = x_grid[np.minimum(candidatos + 1, n_grilla - 1)]
+
+    # 3. Refinamiento simultáneo
+    x_refinados = np.empty(len(candidatos))
+    con_signo = np.zeros(len(candidatos), dtype=bool)
+    if objetivo.derivada is not None:
+        da, db = objetivo.derivar(a), objetivo.derivar(b)
+        con_signo = (da > 0) & (db < 0)
+        if con_signo.any():
+            x_refinados[con_signo] = resolver_raices_por_lotes(objetivo.derivar, a[con_signo],
+                                                               b[con_signo], tolerancia,
+                                                               ga=da[con_signo], gb=db[con_signo])
+    if (~con_signo).any():
+        x_refinados[~con_signo] = _refinar_por_subdivision(objetivo, a[~con_signo], b[~con_signo],
+                                                           tolerancia)
+
+    y_refinados = objetivo.evaluar(x_refinados)
+    mejor = np.argmax(y_refinados)
+    x_max, f_max = x_refinados[mejor], y_refinados[mejor]
+
+    print(f"   🎯 Resultado:")
+    print(f"      x* = {x_max:.12f}")
+    print(f"      f(x*) = {f_max:.12f}")
+    print(f"      Picos refinados: {len(candidatos)} de {int(es_maximo.sum())}")
+    print(f"      Evaluaciones: {objetivo.evaluaciones - evaluaciones_previas} "
+          f"(+{objetivo.evaluaciones_derivada - derivadas_previas} de f')")
+
+    return x_max, f_max
+
+METODOS = {
+    "Fuerza Bruta": metodo_fuerza_bruta,
+    "SciPy Brute": metodo_scipy_brute,
+    "Sección Dorada": metodo_golden_section,
+    "Evolución Diferencial": metodo_diferencial_evolution,
+    "Búsqueda Aleatoria": metodo_busqueda_aleatoria,
+    "Análisis Derivada": metodo_analisis_derivada,
+    "Multirresolución": metodo_multirresolucion,
+}
+
+METODOS_MULTIDIMENSIONALES = (metodo_fuerza_bruta, metodo_scipy_brute,
+                              metodo_diferencial_evolution, metodo_busqueda_aleatoria)
+
+def metodos_aplicables(objetivo):
+    """
+    Métodos de `METODOS` que admiten la dimensión del objetivo
+
+    Returns:
+        Lista de pares (nombre, método)
+    """
+    return [(nombre, metodo) for nombre, metodo in METODOS.items()
+            if objetivo.dimension == 1 or metodo in METODOS_MULTIDIMENSIONALES]
+
+def comparar_metodos(objetivo=None):
     """
     Compara todos los métodos y encuentra el mejor resultado
+
+    Args:
+        objetivo: Objetivo (nombre o instancia, por defecto f(x)); con más de
+            una variable solo se ejecutan los métodos multidimensionales
     """
     print("\n📊 COMPARACIÓN DE MÉTODOS")
     print("=" * 60)
-    
-    metodos = [
-        ("Fuerza Bruta", metodo_fuerza_bruta),
-        ("SciPy Brute", metodo_scipy_brute),
-        ("Sección Dorada", metodo_golden_section),
-        ("Evolución Diferencial", metodo_diferencial_evolution),
-        ("Búsqueda Aleatoria", metodo_busqueda_aleatoria),
-        ("Análisis Derivada", metodo_analisis_derivada)
-    ]
+
+    objetivo = obtener_objetivo(objetivo)
+    metodos = metodos_aplicables(objetivo)
     
     resultados = []
     
     for nombre, metodo in metodos:
         try:
-            x_opt, f_opt = metodo()
+            x_opt, f_opt = metodo(objetivo)
             if x_opt is not None and f_opt is not None:
                 resultados.append((nombre, x_opt, f_opt))
         except Exception as e:
@@ -298,19 +1120,20 @@ def comparar_metodos():
     print("-" * 50)
     
     for nombre, x, f in resultados:
-        print(f"{nombre:<20} {x:<12.8f} {f:<12.8f}")
+        print(f"{nombre:<20} {str(np.round(x, 8)):<12} {f:<12.8f}")
     
     # Encontrar el mejor resultado
     if resultados:
         mejor = max(resultados, key=lambda item: item[2])
         print(f"\n🏆 MEJOR RESULTADO:")
         print(f"   Método: {mejor[0]}")
-        print(f"   x* = {mejor[1]:.8f}")
+        print(f"   x* = {np.round(mejor[1], 8)}")
         print(f"   f(x*) = {mejor[2]:.8f}")
         
         # Verificar que está en el dominio
-        if 0 <= mejor[1] <= 1:
-            print(f"   ✅ Solución válida en el dominio [0,1]")
+        x_mejor = np.atleast_1d(mejor[1])
+        if np.all((objetivo.limites[:, 0] <= x_mejor) & (x_mejor <= objetivo.limites[:, 1])):
+            print(f"   ✅ Solución válida en el dominio")
         else:
             print(f"   ⚠️  Solución fuera del dominio")
         
@@ -318,71 +1141,130 @@ def comparar_metodos():
     
     return None
 
-def visualizar_resultado_final(mejor_resultado):
+def _dibujar_resultado_final(fig, descripcion, nombre, x, y, x_zoom, y_zoom, x_opt, f_opt, delta):
+    """Dibuja la función con el máximo encontrado y un zoom a su alrededor"""
+    ax1, ax2 = fig.subplots(2, 1)
+    
+    # Gráfico principal
+    ax1.plot(x, y, 'b-', linewidth=2, label=descripcion)
+    ax1.plot(x_opt, f_opt, 'ro', markersize=10, label=f'Máximo global\n({x_opt:.6f}, {f_opt:.6f})')
+    ax1.set_xlabel('x')
+    ax1.set_ylabel('f(x)')
+    ax1.set_title(f'Maximización de {descripcion}\nMétodo ganador: {nombre}')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend()
+    
+    # Zoom alrededor del máximo
+    ax2.plot(x_zoom, y_zoom, 'b-', linewidth=2)
+    ax2.plot(x_opt, f_opt, 'ro', markersize=10)
+    ax2.set_xlabel('x')
+    ax2.set_ylabel('f(x)')
+    ax2.set_title(f'Zoom alrededor del máximo (±{delta:g})')
+    ax2.grid(True, alpha=0.3)
+
+def visualizar_resultado_final(mejor_resultado, objetivo=None, graficos=None):
     """
     Crea una visualización final con el mejor resultado
+
+    Args:
+        mejor_resultado: Tupla (método, x*, f(x*)) de `comparar_metodos`
+        objetivo: Objetivo de una variable (nombre o instancia, por defecto f(x))
+        graficos: `EscritorGraficos` para `resultado_final.png` (None = sin gráfico)
     """
-    if mejor_resultado is None:
+    if mejor_resultado is None or graficos is None:
         return
+
+    objetivo = obtener_objetivo(objetivo)
+    if objetivo.dimension != 1:
+        return
+    x_min, x_max = objetivo.limites[0]
     
     nombre, x_opt, f_opt = mejor_resultado
     
-    # Generar puntos para el gráfico
-    x = np.linspace(0, 1, 1000)
-    y = funcion_objetivo(x)
-    
-    # Crear gráfico final
-    plt.figure(figsize=(12, 8))
+    # Generar puntos para el gráfico y para el zoom alrededor del máximo
+    x = np.linspace(x_min, x_max, 1000)
+    y = objetivo.evaluar(x)
+    delta = 0.05 * (x_max - x_min)
+    x_zoom = np.linspace(max(x_min, x_opt-delta), min(x_max, x_opt+delta), 200)
+    y_zoom = objetivo.evaluar(x_zoom)
     
-    # Gráfico principal
-    plt.subplot(2, 1, 1)
-    plt.plot(x, y, 'b-', linewidth=2, label='f(x) = x·sin(10πx) + 1')
-    plt.plot(x_opt, f_opt, 'ro', markersize=10, label=f'Máximo global\n({x_opt:.6f}, {f_opt:.6f})')
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.title(f'Maximización de f(x) = x·sin(10πx) + 1\nMétodo ganador: {nombre}')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    
-    # Zoom alrededor del máximo
-    plt.subplot(2, 1, 2)
-    delta = 0.05
-    x_zoom = np.linspace(max(0, x_opt-delta), min(1, x_opt+delta), 200)
-    y_zoom = funcion_objetivo(x_zoom)
-    plt.plot(x_zoom, y_zoom, 'b-', linewidth=2)
-    plt.plot(x_opt, f_opt, 'ro', markersize=10)
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.title(f'Zoom alrededor del máximo (±{delta})')
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('c:/Users/santi/OneDrive/Documentos/Tareas IA y mini robots/3/3.1/resultado_final.png', 
-                dpi=300, bbox_inches='tight')
-    plt.show()
-
-def main():
+    graficos.guardar('resultado_final.png', _dibujar_resultado_final, objetivo.descripcion,
+                     nombre, x, y, x_zoom, y_zoom, x_opt, f_opt, delta)
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Maximización de funciones con varios métodos")
+    parser.add_argument("--objetivo", default=OBJETIVO_POR_DEFECTO,
+                        help="Nombre del objetivo registrado a maximizar")
+    parser.add_argument("--modulo", action="append", default=[],
+                        help="Archivo .py con una lista OBJETIVOS a registrar (repetible)")
+    parser.add_argument("--listar", action="store_true", help="Listar los objetivos y salir")
+    parser.add_argument("--salida", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="Directorio de los gráficos (por defecto, el del script)")
+    parser.add_argument("--dpi", type=int, default=300, help="Resolución de los gráficos")
+    parser.add_argument("--sin-graficos", action="store_true",
+                        help="Solo resultados numéricos, sin generar figuras")
+    parser.add_argument("--cache", action="store_true",
+                        help="Compartir una caché de evaluaciones entre todos los métodos")
+    parser.add_argument("--cache-tolerancia", type=float, default=1e-12,
+                        help="Paso de cuantización de x para la caché")
+    parser.add_argument("--cache-capacidad", type=int, default=10 ** 6,
+                        help="Entradas máximas de la caché (LRU)")
+    parser.add_argument("--cache-archivo", help="Archivo .npz para persistir la caché entre corridas")
+    return parser
+
+def main(argv=None):
     """
     Función principal que ejecuta todos los métodos
     """
-    print("🎯 MAXIMIZACIÓN DE f(x) = x·sin(10πx) + 1 EN [0,1]")
+    args = build_parser().parse_args(argv)
+    for ruta in args.modulo:
+        cargar_objetivos(ruta)
+    if args.listar:
+        for nombre, registrado in OBJETIVOS.items():
+            print(f"   • {nombre}: {registrado.descripcion} (dimensión {registrado.dimension})")
+        return
+
+    objetivo = obtener_objetivo(args.objetivo)
+    print(f"🎯 MAXIMIZACIÓN DE {objetivo.descripcion}")
     print("=" * 60)
-    
-    # 1. Analizar la función
-    maximos_locales = analizar_funcion()
-    
-    # 2. Aplicar diferentes métodos
-    mejor_resultado = comparar_metodos()
-    
-    # 3. Visualizar resultado final
-    visualizar_resultado_final(mejor_resultado)
+
+    if args.cache or args.cache_archivo:
+        objetivo.usar_cache(CacheEvaluaciones(args.cache_tolerancia, args.cache_capacidad,
+                                              ruta=args.cache_archivo))
+
+    graficos = None if args.sin_graficos else EscritorGraficos(args.salida, dpi=args.dpi)
+    try:
+        # 1. Analizar la función
+        if objetivo.dimension == 1:
+            maximos_locales = analizar_funcion(objetivo, graficos)
+        
+        # 2. Aplicar diferentes métodos (las figuras se escriben mientras tanto)
+        mejor_resultado = comparar_metodos(objetivo)
+        
+        # 3. Visualizar resultado final
+        visualizar_resultado_final(mejor_resultado, objetivo, graficos)
+    finally:
+        if graficos is not None:
+            graficos.cerrar()
+
+    if objetivo.cache is not None:
+        estadisticas = objetivo.cache.estadisticas()
+        print(f"\n🗄️  Caché de evaluaciones: {estadisticas['aciertos']} aciertos, "
+              f"{estadisticas['fallos']} fallos ({estadisticas['tasa_aciertos']:.1%} de aciertos), "
+              f"{estadisticas['entradas']} entradas")
+        print(f"   Evaluaciones reales de la función: {objetivo.evaluaciones}")
+        if args.cache_archivo:
+            objetivo.cache.guardar()
+            print(f"💾 Caché guardada en {args.cache_archivo}")
     
     # 4. Análisis final
-    print(f"\n🔬 ANÁLISIS FINAL:")
-    print(f"   • La función tiene múltiples máximos locales debido al término sin(10πx)")
-    print(f"   • El factor x hace que los máximos cerca de x=1 sean más altos")
-    print(f"   • Los métodos globales (evolución diferencial, fuerza bruta) son más confiables")
-    print(f"   • El máximo global teórico está cerca de x ≈ 0.95-0.98")
+    if objetivo.nombre == OBJETIVO_POR_DEFECTO:
+        print(f"\n🔬 ANÁLISIS FINAL:")
+        print(f"   • La función tiene múltiples máximos locales debido al término sin(10πx)")
+        print(f"   • El factor x hace que los máximos cerca de x=1 sean más altos")
+        print(f"   • Los métodos globales (evolución diferencial, fuerza bruta) son más confiables")
+        print(f"   • El máximo global teórico está cerca de x ≈ 0.95-0.98")
 
 if __name__ == "__main__":
     main()
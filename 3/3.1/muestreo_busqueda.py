@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluaciones Necesarias por Muestreador en la Búsqueda Aleatoria
+================================================================
+
+Para cada muestreador de `maximizacion_funcion.MUESTREADORES` (uniforme,
+Sobol, Halton, hipercubo latino) mide cuántas evaluaciones necesita la
+búsqueda por muestreo para que el error f* - f(x*) baje de cada objetivo,
+repitiendo con varias semillas.
+
+Uso:
+    python muestreo_busqueda.py --errores 1e-4,1e-6,1e-8 --semillas 20
+
+Autor: Estudiante IA
+Fecha: Julio 2025
+"""
+
+import argparse
+
+import numpy as np
+
+import maximizacion_funcion as mf
+
+def evaluaciones_hasta_error(objetivo, modo, error, semillas=range(10), n_max=10 ** 6,
+                             tamano_bloque=4096):
+    """
+    Evaluaciones que necesita un muestreador para alcanzar un error
+
+    Args:
+        objetivo: Objetivo con `valor_optimo` conocido
+        modo: Muestreador
+        error: Error máximo f* - f(x*) buscado
+        semillas: Semillas a repetir
+        n_max: Presupuesto máximo por corrida
+        tamano_bloque: Puntos por lote
+
+    Returns:
+        Arreglo con las evaluaciones de cada semilla (np.nan si no se alcanzó)
+    """
+    objetivo = mf.obtener_objetivo(objetivo)
+    if objetivo.valor_optimo is None:
+        raise ValueError(f"El objetivo {objetivo.nombre} no declara valor_optimo")
+
+    necesarias = []
+    for semilla in semillas:
+        resultado = mf.busqueda_por_muestreo(objetivo, modo, semilla, n_max, tamano_bloque,
+                                             valor_objetivo=objetivo.valor_optimo - error)
+        alcanzado = resultado["motivo"] == "objetivo"
+        necesarias.append(resultado["evaluaciones"] if alcanzado else np.nan)
+    return np.array(necesarias, dtype=float)
+
+def comparar_muestreadores(objetivo=None, errores=(1e-4, 1e-6, 1e-8), modos=mf.MUESTREADORES,
+                           semillas=range(10), n_max=10 ** 6):
+    """
+    Tabla de evaluaciones necesarias por muestreador y error
+
+    Returns:
+        Lista de filas (diccionarios) con la mediana, el percentil 90 y la
+        fracción de corridas que alcanzaron el error
+    """
+    filas = []
+    for error in errores:
+        for modo in modos:
+            necesarias = evaluaciones_hasta_error(objetivo, modo, error, semillas, n_max)
+            alcanzadas = necesarias[~np.isnan(necesarias)]
+            filas.append({
+                "modo": modo,
+                "error": error,
+                "mediana": float(np.median(alcanzadas)) if len(alcanzadas) else np.nan,
+                "p90": float(np.percentile(alcanzadas, 90)) if len(alcanzadas) else np.nan,
+                "alcanzado": len(alcanzadas) / len(necesarias),
+            })
+    return filas
+
+def imprimir_tabla(filas, n_max):
+    """Imprime la tabla de evaluaciones necesarias"""
+    print(f"\n📈 EVALUACIONES HASTA ALCANZAR EL ERROR (máximo {n_max} por corrida):")
+    print(f"{'Error':>8} {'Muestreador':<12} {'Mediana':>10} {'P90':>10} {'Alcanzado':>10}")
+    print("-" * 54)
+    for fila in filas:
+        print(f"{fila['error']:>8.0e} {fila['modo']:<12} {fila['mediana']:>10.0f} "
+              f"{fila['p90']:>10.0f} {fila['alcanzado']:>10.0%}")
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Evaluaciones necesarias por muestreador")
+    parser.add_argument("--objetivo", default=mf.OBJETIVO_POR_DEFECTO)
+    parser.add_argument("--errores", default="1e-4,1e-6,1e-8")
+    parser.add_argument("--modos", default=",".join(mf.MUESTREADORES))
+    parser.add_argument("--semillas", type=int, default=10)
+    parser.add_argument("--max-puntos", type=int, default=10 ** 6)
+    return parser
+
+def main(argv=None):
+    """Función principal"""
+    args = build_parser().parse_args(argv)
+    objetivo = mf.obtener_objetivo(args.objetivo)
+
+    print("=" * 60)
+    print(f"🎲 MUESTREADORES DE LA BÚSQUEDA ALEATORIA - {objetivo.descripcion}")
+    print("=" * 60)
+
+    filas = comparar_muestreadores(objetivo, [float(e) for e in args.errores.split(",")],
+                                   args.modos.split(","), range(args.semillas), args.max_puntos)
+    imprimir_tabla(filas, args.max_puntos)
+
+if __name__ == "__main__":
+    main()
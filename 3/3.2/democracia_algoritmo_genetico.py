@@ -17,11 +17,14 @@ Autor: Estudiante IA
 Fecha: Julio 2025
 """
 
+import argparse
+import heapq
+import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
-import random
-from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Optional
 import seaborn as sns
 
 # Configurar estilo de gráficos
@@ -43,23 +46,331 @@ class Entidad:
     peso_poder: int
     categoria: str
 
+@dataclass
+class ProblemaCompilado:
+    """
+    Representación numérica del problema, construida una sola vez
+    
+    Guarda los pesos de poder y las proporciones ideales como arreglos
+    contiguos para que la fitness no recorra los dataclasses en cada
+    evaluación.
+    """
+    pesos: np.ndarray             # Peso de poder de cada entidad
+    proporcion_ideal: np.ndarray  # Proporción parlamentaria de cada partido
+    poder_total: float            # Suma de los pesos
+    
+    @classmethod
+    def desde(cls, partidos: List[Partido], entidades: List[Entidad]) -> "ProblemaCompilado":
+        """
+        Compila la lista de partidos y entidades
+        
+        Args:
+            partidos: Partidos con su porcentaje de representación
+            entidades: Entidades con su peso de poder
+            
+        Returns:
+            Problema compilado
+        """
+        pesos = np.ascontiguousarray([e.peso_poder for e in entidades], dtype=float)
+        proporcion_ideal = np.ascontiguousarray([p.porcentaje_representacion / 100 for p in partidos],
+                                                dtype=float)
+        return cls(pesos, proporcion_ideal, float(pesos.sum()))
+    
+    @property
+    def num_partidos(self) -> int:
+        return len(self.proporcion_ideal)
+    
+    @property
+    def num_entidades(self) -> int:
+        return len(self.pesos)
+    
+    def poder_por_partido(self, individuo: np.ndarray) -> np.ndarray:
+        """Poder acumulado por cada partido en una asignación"""
+        return np.bincount(individuo, weights=self.pesos, minlength=self.num_partidos)
+    
+    def poder_poblacion(self, poblacion: np.ndarray) -> np.ndarray:
+        """
+        Matriz de poder (individuos x partidos) con un único `bincount` ponderado
+        
+        Cada fila se desplaza a su propio bloque de `num_partidos` casillas.
+        """
+        num_individuos = len(poblacion)
+        casillas = poblacion + self.num_partidos * np.arange(num_individuos)[:, None]
+        poder = np.bincount(casillas.ravel(), weights=np.broadcast_to(self.pesos, poblacion.shape).ravel(),
+                            minlength=num_individuos * self.num_partidos)
+        return poder.reshape(num_individuos, self.num_partidos)
+    
+    def fitness_desde_poder(self, poder: np.ndarray) -> np.ndarray:
+        """
+        Fitness 1 / (1 + Σ|proporción real - proporción ideal|) a partir del poder por partido
+        
+        Acepta un vector de poder o una matriz (individuos x partidos).
+        """
+        desviacion = np.abs(poder / self.poder_total - self.proporcion_ideal).sum(axis=-1)
+        return 1 / (1 + desviacion)
+    
+    def fitness(self, individuo: np.ndarray) -> float:
+        """Fitness de una asignación"""
+        return float(self.fitness_desde_poder(self.poder_por_partido(individuo)))
+    
+    def fitness_poblacion(self, poblacion: np.ndarray) -> np.ndarray:
+        """Fitness de todas las filas de una matriz de asignaciones"""
+        return self.fitness_desde_poder(self.poder_poblacion(poblacion))
+
+class EvaluadorIncremental:
+    """
+    Evaluación incremental de un individuo bajo cambios de pocos genes
+    
+    Mantiene el vector de poder por partido y la desviación L1 del individuo.
+    Mover una entidad de partido solo cambia el poder de dos partidos, así que
+    el cambio de desviación se calcula en O(1) con los dos términos afectados
+    del valor absoluto; lo mismo vale para intercambiar dos entidades. Los
+    métodos `delta_*` aceptan arreglos y evalúan muchos movimientos a la vez.
+    """
+    
+    def __init__(self, problema: ProblemaCompilado, individuo: np.ndarray):
+        """
+        Args:
+            problema: Problema compilado
+            individuo: Asignación inicial (se copia)
+        """
+        self.problema = problema
+        self.individuo = np.array(individuo, dtype=np.intp)
+        self.movimientos_evaluados = 0
+        self.recalcular()
+    
+    def recalcular(self):
+        """Recalcula desde cero el poder por partido y la desviación"""
+        self.poder = self.problema.poder_por_partido(self.individuo)
+        self.desviacion = float(np.abs(self.poder / self.problema.poder_total
+                                       - self.problema.proporcion_ideal).sum())
+    
+    @property
+    def fitness(self) -> float:
+        return 1 / (1 + self.desviacion)
+    
+    def _exceso(self, partidos):
+        """Proporción de poder menos proporción ideal de los partidos indicados"""
+        return self.poder[partidos] / self.problema.poder_total - self.problema.proporcion_ideal[partidos]
+    
+    def _delta_transferencia(self, origen, destino, cantidad):
+        """Cambio de desviación al pasar `cantidad` de poder (proporción) de origen a destino"""
+        exceso_origen = self._exceso(origen)
+        exceso_destino = self._exceso(destino)
+        delta = (np.abs(exceso_origen - cantidad) - np.abs(exceso_origen)
+                 + np.abs(exceso_destino + cantidad) - np.abs(exceso_destino))
+        return np.where(origen == destino, 0.0, delta)
+    
+    def delta_mover(self, entidades, partidos):
+        """
+        Cambio de desviación si cada entidad pasara al partido indicado
+        
+        Args:
+            entidades: Índice o arreglo de índices de entidades
+            partidos: Partido destino de cada entidad
+            
+        Returns:
+            Cambio de desviación (negativo = mejora)
+        """
+        self.movimientos_evaluados += np.size(entidades)
+        return self._delta_transferencia(self.individuo[entidades], partidos,
+                                         self.problema.pesos[entidades] / self.problema.poder_total)
+    
+    def delta_intercambio(self, entidades_i, entidades_j):
+        """
+        Cambio de desviación si se intercambiaran los partidos de dos entidades
+        
+        Returns:
+            Cambio de desviación (negativo = mejora)
+        """
+        self.movimientos_evaluados += np.size(entidades_i)
+        pesos = self.problema.pesos
+        return self._delta_transferencia(self.individuo[entidades_i], self.individuo[entidades_j],
+                                         (pesos[entidades_i] - pesos[entidades_j]) / self.problema.poder_total)
+    
+    def mover(self, entidad: int, partido: int):
+        """Pasa una entidad a otro partido actualizando poder y desviación en O(1)"""
+        self.desviacion += float(self._delta_transferencia(
+            self.individuo[entidad], partido, self.problema.pesos[entidad] / self.problema.poder_total))
+        self.poder[self.individuo[entidad]] -= self.problema.pesos[entidad]
+        self.poder[partido] += self.problema.pesos[entidad]
+        self.individuo[entidad] = partido
+    
+    def intercambiar(self, entidad_i: int, entidad_j: int):
+        """Intercambia los partidos de dos entidades en O(1)"""
+        partido_i, partido_j = self.individuo[entidad_i], self.individuo[entidad_j]
+        self.mover(entidad_i, partido_j)
+        self.mover(entidad_j, partido_i)
+
+def solucion_voraz(problema: ProblemaCompilado) -> np.ndarray:
+    """
+    Heurística voraz: la entidad de mayor peso va al partido más sub-representado
+    
+    Recorre las entidades de mayor a menor peso y asigna cada una al partido
+    con mayor déficit (poder ideal - poder asignado). O(E log E + E log K).
+    
+    Args:
+        problema: Problema compilado
+        
+    Returns:
+        Asignación de entidades a partidos
+    """
+    asignacion = np.empty(problema.num_entidades, dtype=np.intp)
+    deficits = [(-ideal * problema.poder_total, k) for k, ideal in enumerate(problema.proporcion_ideal)]
+    heapq.heapify(deficits)
+    
+    for entidad in np.argsort(-problema.pesos, kind="stable"):
+        deficit_negativo, partido = heapq.heappop(deficits)
+        asignacion[entidad] = partido
+        heapq.heappush(deficits, (deficit_negativo + problema.pesos[entidad], partido))
+    
+    return asignacion
+
+def solucion_karmarkar_karp(problema: ProblemaCompilado) -> np.ndarray:
+    """
+    Diferenciación de Karmarkar-Karp para K partes con metas desiguales
+    
+    KK mantiene soluciones parciales de K subconjuntos y en cada paso combina
+    las dos con mayor diferencia entre su subconjunto más pesado y el más
+    liviano, uniendo el más pesado de una con el más liviano de la otra.
+    Para metas desiguales se agrega una solución parcial "fantasma" con una
+    carga fija (p_max - p_k) * T en el subconjunto de cada partido k: así
+    todos los partidos tienen la misma meta p_max * T y los subconjuntos
+    quedan etiquetados con su partido al final.
+    
+    Args:
+        problema: Problema compilado
+        
+    Returns:
+        Asignación de entidades a partidos
+    """
+    num_partidos = problema.num_partidos
+    cargas_fantasma = (problema.proporcion_ideal.max() - problema.proporcion_ideal) * problema.poder_total
+    
+    # Cada solución parcial: lista de subconjuntos [suma, entidades, partido (o -1)]
+    parciales = [[[cargas_fantasma[k], [], k] for k in range(num_partidos)]]
+    for entidad, peso in enumerate(problema.pesos):
+        parciales.append([[peso, [entidad], -1]] + [[0.0, [], -1] for _ in range(num_partidos - 1)])
+    
+    def diferencia(parcial):
+        sumas = [subconjunto[0] for subconjunto in parcial]
+        return max(sumas) - min(sumas)
+    
+    monticulo = [(-diferencia(parcial), i, parcial) for i, parcial in enumerate(parciales)]
+    heapq.heapify(monticulo)
+    contador = len(monticulo)
+    
+    while len(monticulo) > 1:
+        _, _, a = heapq.heappop(monticulo)
+        _, _, b = heapq.heappop(monticulo)
+        a.sort(key=lambda subconjunto: subconjunto[0], reverse=True)
+        b.sort(key=lambda subconjunto: subconjunto[0])
+        
+        for subconjunto_a, subconjunto_b in zip(a, b):
+            subconjunto_a[0] += subconjunto_b[0]
+            subconjunto_a[1].extend(subconjunto_b[1])
+            subconjunto_a[2] = max(subconjunto_a[2], subconjunto_b[2])
+        
+        # Normalizar: solo importan las diferencias entre subconjuntos
+        minimo = min(subconjunto[0] for subconjunto in a)
+        for subconjunto in a:
+            subconjunto[0] -= minimo
+        
+        heapq.heappush(monticulo, (-diferencia(a), contador, a))
+        contador += 1
+    
+    asignacion = np.empty(problema.num_entidades, dtype=np.intp)
+    for _, entidades, partido in monticulo[0][2]:
+        asignacion[entidades] = partido
+    return asignacion
+
+# Soluciones constructivas disponibles (línea base y siembra de la población inicial)
+CONSTRUCTIVOS = {
+    "voraz": solucion_voraz,
+    "kk": solucion_karmarkar_karp,
+}
+
+@dataclass
+class HistoriaEvolucion:
+    """
+    Historia de una corrida del AG
+    
+    Guarda por generación el mejor fitness, el fitness promedio y la
+    diversidad de la población, además de las evaluaciones, el tiempo y el
+    motivo de parada. Se desempaqueta como (mejor_fitness, fitness_promedio).
+    """
+    mejor_fitness: List[float] = field(default_factory=list)
+    fitness_promedio: List[float] = field(default_factory=list)
+    diversidad: List[float] = field(default_factory=list)
+    evaluaciones: int = 0
+    segundos: float = 0.0
+    motivo_parada: str = "generaciones"
+    
+    def __iter__(self):
+        return iter((self.mejor_fitness, self.fitness_promedio))
+    
+    @property
+    def generaciones(self) -> int:
+        return len(self.mejor_fitness)
+    
+    def registrar(self, fitness: np.ndarray, diversidad: float):
+        """Agrega las estadísticas de una generación evaluada"""
+        self.mejor_fitness.append(float(np.max(fitness)))
+        self.fitness_promedio.append(float(np.mean(fitness)))
+        self.diversidad.append(diversidad)
+        self.evaluaciones += len(fitness)
+    
+    @classmethod
+    def combinar(cls, historias: List["HistoriaEvolucion"]) -> "HistoriaEvolucion":
+        """
+        Combina historias paralelas de igual largo (islas)
+        
+        Por generación: mejor fitness global, promedio de los promedios y
+        diversidad promedio dentro de cada isla.
+        """
+        return cls(list(np.max([h.mejor_fitness for h in historias], axis=0)),
+                   list(np.mean([h.fitness_promedio for h in historias], axis=0)),
+                   list(np.mean([h.diversidad for h in historias], axis=0)),
+                   sum(h.evaluaciones for h in historias))
+    
+    def extender(self, otra: "HistoriaEvolucion"):
+        """Agrega al final las generaciones de otra historia"""
+        self.mejor_fitness.extend(otra.mejor_fitness)
+        self.fitness_promedio.extend(otra.fitness_promedio)
+        self.diversidad.extend(otra.diversidad)
+        self.evaluaciones += otra.evaluaciones
+
+# Topologías de migración: islas de origen de los migrantes que recibe la isla i
+TOPOLOGIAS_MIGRACION = {
+    "anillo": lambda i, num_islas: [(i - 1) % num_islas],
+    "completa": lambda i, num_islas: [j for j in range(num_islas) if j != i],
+}
+
 class SistemaDemocraticoAG:
     """
     Sistema de distribución democrática del poder usando Algoritmos Genéticos
     """
     
-    def __init__(self, semilla=42):
+    def __init__(self, semilla=42, num_partidos=5, num_entidades=50, num_curules=50):
         """
         Inicializa el sistema democrático
         
         Args:
-            semilla: Semilla para reproducibilidad
+            semilla: Semilla para reproducibilidad (genera la `SeedSequence` de la instancia)
+            num_partidos: Número de partidos (5 en el escenario original)
+            num_entidades: Número de entidades (50 en el escenario original)
+            num_curules: Curules del congreso
         """
-        np.random.seed(semilla)
-        random.seed(semilla)
+        # Generador propio de la instancia: no se toca el estado global de
+        # np.random ni de random, así que varias instancias pueden correr en
+        # paralelo (hilos o procesos) de forma reproducible
+        self.secuencia_semillas = np.random.SeedSequence(semilla)
+        self.rng = np.random.default_rng(self.secuencia_semillas)
         
-        self.partidos = self._crear_partidos()
-        self.entidades = self._crear_entidades()
+        self.partidos = self._crear_partidos(num_partidos, num_curules)
+        self.entidades = self._crear_entidades(num_entidades)
+        self.problema = None
+        self.compilar()
         self.matriz_poder = None
         
         # Parámetros del Algoritmo Genético
@@ -68,10 +379,61 @@ class SistemaDemocraticoAG:
         self.tasa_mutacion = 0.1
         self.tasa_cruce = 0.8
         self.elite_size = 10
+        self.motor = "matricial"  # "matricial" (población como matriz) o "lista" (referencia)
+        self.movimientos_busqueda_local = 0  # Movimientos evaluados por individuo élite (0 = sin refinar)
+        
+        # Modelo de islas (num_islas = 1 ejecuta una sola población)
+        self.num_islas = 1
+        self.intervalo_migracion = 20     # Generaciones entre migraciones
+        self.num_migrantes = 2            # Mejores individuos que envía cada isla
+        self.topologia_migracion = "anillo"
+        self.workers = None               # Procesos trabajadores (None = todos los núcleos)
+        
+        # Siembra de la población inicial con una solución constructiva
+        self.siembra = None               # None, "voraz" o "kk" (ver CONSTRUCTIVOS)
+        self.fraccion_siembra = 0.1       # Fracción de la población sembrada
         
-    def _crear_partidos(self) -> List[Partido]:
+        # Criterios de parada adicionales (None = desactivado)
+        self.paciencia_estancamiento = None   # Generaciones sin mejora del mejor fitness
+        self.tolerancia_estancamiento = 0.0   # Mejora mínima que cuenta como mejora
+        self.fitness_objetivo = None          # Detener al alcanzar este fitness
+        self.tiempo_maximo = None             # Segundos de reloj
+        self.max_evaluaciones = None          # Evaluaciones de fitness
+    
+    def generadores_hijos(self, n: int) -> List[np.random.Generator]:
         """
-        Crea los 5 partidos políticos con distribución aleatoria de curules
+        Crea flujos aleatorios hijos independientes de la instancia
+        
+        Cada llamada deriva nuevos hijos de la `SeedSequence` de la instancia,
+        así que son reproducibles para una misma semilla y no se solapan entre
+        sí ni con `self.rng`.
+        
+        Args:
+            n: Número de generadores
+            
+        Returns:
+            Lista de `np.random.Generator`
+        """
+        return [np.random.default_rng(hija) for hija in self.secuencia_semillas.spawn(n)]
+    
+    def compilar(self) -> ProblemaCompilado:
+        """
+        Construye los arreglos de pesos y proporciones ideales
+        
+        Debe llamarse de nuevo si se modifican `partidos` o `entidades`.
+        
+        Returns:
+            El problema compilado (también queda en `self.problema`)
+        """
+        self.problema = ProblemaCompilado.desde(self.partidos, self.entidades)
+        return self.problema
+        
+    def _crear_partidos(self, num_partidos=5, num_curules=50) -> List[Partido]:
+        """
+        Crea los partidos políticos con distribución aleatoria de curules
+        
+        Los 5 primeros son los del escenario original; los siguientes se
+        numeran y toman su color de una paleta.
         """
         nombres_partidos = [
             "Partido Progresista",
@@ -83,27 +445,41 @@ class SistemaDemocraticoAG:
         
         colores = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
         
+        if num_partidos > len(nombres_partidos):
+            paleta = sns.color_palette("husl", num_partidos).as_hex()
+            for i in range(len(nombres_partidos), num_partidos):
+                nombres_partidos.append(f"Partido {i + 1}")
+                colores.append(paleta[i])
+        
         # Generar distribución aleatoria no uniforme de curules
-        # Usar distribución Dirichlet para garantizar que sumen 50
-        alpha = [1, 2, 3, 2, 1]  # Parámetros para sesgar la distribución
-        proporciones = np.random.dirichlet(alpha)
-        curules_distribucion = np.round(proporciones * 50).astype(int)
+        # Usar distribución Dirichlet para garantizar que sumen el total
+        if num_partidos == 5:
+            alpha = [1, 2, 3, 2, 1]  # Parámetros para sesgar la distribución
+        else:
+            alpha = self.rng.uniform(1, 3, num_partidos)
+        proporciones = self.rng.dirichlet(alpha)
+        curules_distribucion = np.round(proporciones * num_curules).astype(int)
         
-        # Ajustar para que sumen exactamente 50
-        diferencia = 50 - curules_distribucion.sum()
-        curules_distribucion[0] += diferencia
+        # Ajustar para que sumen exactamente el total (en el partido más grande
+        # si el primero quedaría con curules negativas)
+        diferencia = num_curules - curules_distribucion.sum()
+        ajustado = 0 if curules_distribucion[0] + diferencia >= 0 else np.argmax(curules_distribucion)
+        curules_distribucion[ajustado] += diferencia
         
         partidos = []
-        for i, (nombre, color) in enumerate(zip(nombres_partidos, colores)):
+        for i, (nombre, color) in enumerate(zip(nombres_partidos[:num_partidos], colores)):
             curules = curules_distribucion[i]
-            porcentaje = (curules / 50) * 100
+            porcentaje = (curules / num_curules) * 100
             partidos.append(Partido(nombre, color, curules, porcentaje))
         
         return partidos
     
-    def _crear_entidades(self) -> List[Entidad]:
+    def _crear_entidades(self, num_entidades=50) -> List[Entidad]:
         """
-        Crea 50 entidades estatales con pesos de poder aleatorios
+        Crea las entidades estatales con pesos de poder aleatorios
+        
+        Las 50 primeras son las del escenario original (ministerios, agencias e
+        institutos); las siguientes son entidades regionales de poder bajo.
         """
         nombres_ministerios = [
             "Ministerio del Interior", "Ministerio de Relaciones Exteriores",
@@ -137,20 +513,25 @@ class SistemaDemocraticoAG:
         
         # Ministerios (alto poder: 70-100 puntos)
         for nombre in nombres_ministerios:
-            peso = np.random.randint(70, 101)
+            peso = int(self.rng.integers(70, 101))
             entidades.append(Entidad(nombre, peso, "Ministerio"))
         
         # Agencias importantes (poder medio: 40-80 puntos)
         for nombre in agencias_importantes:
-            peso = np.random.randint(40, 81)
+            peso = int(self.rng.integers(40, 81))
             entidades.append(Entidad(nombre, peso, "Agencia"))
         
         # Entidades menores (poder bajo: 1-50 puntos)
         for nombre in entidades_menores:
-            peso = np.random.randint(1, 51)
+            peso = int(self.rng.integers(1, 51))
             entidades.append(Entidad(nombre, peso, "Instituto"))
         
-        return entidades
+        # Entidades regionales adicionales (poder bajo: 1-50 puntos)
+        for k in range(len(entidades), num_entidades):
+            peso = int(self.rng.integers(1, 51))
+            entidades.append(Entidad(f"Entidad Regional {k - 49}", peso, "Entidad Regional"))
+        
+        return entidades[:num_entidades]
     
     def mostrar_congreso(self):
         """
@@ -203,7 +584,7 @@ class SistemaDemocraticoAG:
         Returns:
             Array de asignaciones de entidades a partidos
         """
-        return np.random.randint(0, len(self.partidos), len(self.entidades))
+        return self.rng.integers(0, len(self.partidos), len(self.entidades))
     
     def calcular_fitness(self, individuo: np.ndarray) -> float:
         """
@@ -215,26 +596,9 @@ class SistemaDemocraticoAG:
         Returns:
             Valor de fitness (mayor es mejor)
         """
-        # Calcular poder acumulado por cada partido
-        poder_por_partido = np.zeros(len(self.partidos))
-        
-        for i, partido_asignado in enumerate(individuo):
-            poder_por_partido[partido_asignado] += self.entidades[i].peso_poder
-        
-        poder_total = poder_por_partido.sum()
-        proporcion_poder = poder_por_partido / poder_total
-        
-        # Proporción ideal basada en representación parlamentaria
-        proporcion_ideal = np.array([p.porcentaje_representacion / 100 for p in self.partidos])
-        
-        # Calcular diferencia entre proporción real e ideal
-        diferencia = np.abs(proporcion_poder - proporcion_ideal)
-        
-        # Fitness es inversamente proporcional a la diferencia
-        # Usar 1 / (1 + suma_diferencias) para que esté entre 0 y 1
-        fitness = 1 / (1 + diferencia.sum())
-        
-        return fitness
+        # Fitness es inversamente proporcional a la diferencia entre la proporción
+        # de poder real y la parlamentaria: 1 / (1 + suma_diferencias), entre 0 y 1
+        return self.problema.fitness(individuo)
     
     def seleccion_torneo(self, poblacion: List[np.ndarray], fitness_scores: List[float], 
                         tamaño_torneo: int = 3) -> np.ndarray:
@@ -249,7 +613,8 @@ class SistemaDemocraticoAG:
         Returns:
             Individuo seleccionado
         """
-        participantes = random.sample(list(zip(poblacion, fitness_scores)), tamaño_torneo)
+        participantes = [(poblacion[i], fitness_scores[i])
+                         for i in self.rng.choice(len(poblacion), tamaño_torneo, replace=False)]
         ganador = max(participantes, key=lambda x: x[1])
         return ganador[0].copy()
     
@@ -263,10 +628,10 @@ class SistemaDemocraticoAG:
         Returns:
             Dos individuos hijo
         """
-        if random.random() > self.tasa_cruce:
+        if self.rng.random() > self.tasa_cruce:
             return padre1.copy(), padre2.copy()
         
-        punto_cruce = random.randint(1, len(padre1) - 1)
+        punto_cruce = self.rng.integers(1, len(padre1))
         
         hijo1 = np.concatenate([padre1[:punto_cruce], padre2[punto_cruce:]])
         hijo2 = np.concatenate([padre2[:punto_cruce], padre1[punto_cruce:]])
@@ -285,46 +650,457 @@ class SistemaDemocraticoAG:
         """
         individuo_mutado = individuo.copy()
         
-        for i in range(len(individuo_mutado)):
-            if random.random() < self.tasa_mutacion:
-                individuo_mutado[i] = random.randint(0, len(self.partidos) - 1)
+        # Un solo sorteo para todos los genes
+        mutan = self.rng.random(len(individuo_mutado)) < self.tasa_mutacion
+        individuo_mutado[mutan] = self.rng.integers(0, len(self.partidos), mutan.sum())
         
         return individuo_mutado
     
-    def algoritmo_genetico(self):
+    def crear_poblacion(self, tamaño: int) -> np.ndarray:
         """
-        Ejecuta el algoritmo genético para optimizar la distribución del poder
+        Crea una población aleatoria como una sola matriz
+        
+        Args:
+            tamaño: Número de individuos
+            
+        Returns:
+            Matriz (tamaño, num_entidades) con el partido asignado a cada entidad
         """
-        print("🧬 EJECUTANDO ALGORITMO GENÉTICO")
+        dtype = np.min_scalar_type(len(self.partidos) - 1)
+        return self.rng.integers(0, len(self.partidos), (tamaño, len(self.entidades)), dtype=dtype)
+    
+    def fitness_poblacion(self, poblacion: np.ndarray) -> np.ndarray:
+        """
+        Calcula la fitness de toda la población con un único `bincount` ponderado
+        
+        Equivale a `calcular_fitness` fila por fila.
+        
+        Args:
+            poblacion: Matriz (individuos, entidades) de asignaciones
+            
+        Returns:
+            Arreglo con la fitness de cada individuo
+        """
+        return self.problema.fitness_poblacion(poblacion)
+    
+    def poblacion_inicial(self, tamaño: int) -> np.ndarray:
+        """
+        Población inicial, opcionalmente sembrada con una solución constructiva
+        
+        Con `siembra` definida, una fracción `fraccion_siembra` de la población
+        son copias mutadas de la solución de `CONSTRUCTIVOS[siembra]` (la
+        primera copia se conserva intacta); el resto es aleatorio.
+        
+        Args:
+            tamaño: Número de individuos
+            
+        Returns:
+            Matriz (tamaño, num_entidades) de asignaciones
+        """
+        poblacion = self.crear_poblacion(tamaño)
+        if self.siembra is None:
+            return poblacion
+        
+        solucion = CONSTRUCTIVOS[self.siembra](self.problema)
+        num_sembrados = max(1, int(self.fraccion_siembra * tamaño))
+        poblacion[:num_sembrados] = solucion
+        self.mutacion_matricial(poblacion[1:num_sembrados])
+        return poblacion
+    
+    def resolver_constructivo(self, nombre: str) -> float:
+        """
+        Resuelve con una heurística constructiva como línea base
+        
+        La solución queda en `matriz_poder`, así que `analizar_distribucion`
+        y `visualizar_resultados` la pueden mostrar.
+        
+        Args:
+            nombre: Clave de `CONSTRUCTIVOS`
+            
+        Returns:
+            Fitness de la solución
+        """
+        self.matriz_poder = CONSTRUCTIVOS[nombre](self.problema)
+        return self.calcular_fitness(self.matriz_poder)
+    
+    def comparar_constructivos(self):
+        """
+        Muestra fitness y tiempo de cada solución constructiva
+        
+        Returns:
+            Diccionario nombre -> (fitness, segundos)
+        """
+        print("📐 LÍNEAS BASE CONSTRUCTIVAS")
         print("=" * 50)
-        print(f"Parámetros:")
-        print(f"• Tamaño población: {self.tamaño_poblacion}")
-        print(f"• Generaciones: {self.num_generaciones}")
-        print(f"• Tasa mutación: {self.tasa_mutacion}")
-        print(f"• Tasa cruce: {self.tasa_cruce}")
+        resultados = {}
+        for nombre, constructivo in CONSTRUCTIVOS.items():
+            inicio = time.perf_counter()
+            solucion = constructivo(self.problema)
+            segundos = time.perf_counter() - inicio
+            resultados[nombre] = (self.calcular_fitness(solucion), segundos)
+            print(f"{nombre:<8} fitness = {resultados[nombre][0]:.6f}  ({segundos * 1000:.1f} ms)")
         print()
+        return resultados
+    
+    def seleccion_torneo_matricial(self, poblacion: np.ndarray, fitness: np.ndarray,
+                                   num_seleccionados: int, tamaño_torneo: int = 3) -> np.ndarray:
+        """
+        Selección por torneo de muchos individuos a la vez
+        
+        Como en `seleccion_torneo`, los participantes de cada torneo son distintos:
+        el j-ésimo se sortea entre los `len(poblacion) - j` restantes y se desplaza
+        sobre los ya elegidos (en orden creciente), todo en lotes por columna.
+        
+        Args:
+            poblacion: Matriz de individuos
+            fitness: Fitness de cada individuo
+            num_seleccionados: Número de torneos
+            tamaño_torneo: Participantes por torneo
+            
+        Returns:
+            Matriz (num_seleccionados, entidades) con los ganadores
+        """
+        if tamaño_torneo > len(poblacion):
+            raise ValueError("El torneo no puede tener más participantes que la población")
+        participantes = np.empty((num_seleccionados, tamaño_torneo), dtype=np.int64)
+        for j in range(tamaño_torneo):
+            sorteo = self.rng.integers(0, len(poblacion) - j, num_seleccionados)
+            for elegido in np.sort(participantes[:, :j], axis=1).T:
+                sorteo += sorteo >= elegido
+            participantes[:, j] = sorteo
+        ganadores = participantes[np.arange(num_seleccionados),
+                                  np.argmax(fitness[participantes], axis=1)]
+        return poblacion[ganadores]
+    
+    def cruzamiento_matricial(self, padres1: np.ndarray, padres2: np.ndarray) -> np.ndarray:
+        """
+        Cruzamiento de un punto aplicado a todas las parejas a la vez
+        
+        Args:
+            padres1, padres2: Matrices de padres emparejados por fila
+            
+        Returns:
+            Matriz con los hijos (2 por pareja)
+        """
+        num_parejas, num_entidades = padres1.shape
+        puntos_cruce = self.rng.integers(1, num_entidades, num_parejas)
+        se_cruzan = self.rng.random(num_parejas) < self.tasa_cruce
+        
+        # Antes del punto de cruce (o si la pareja no se cruza) cada hijo copia a su padre
+        del_primero = (np.arange(num_entidades) < puntos_cruce[:, None]) | ~se_cruzan[:, None]
+        hijos1 = np.where(del_primero, padres1, padres2)
+        hijos2 = np.where(del_primero, padres2, padres1)
+        return np.concatenate([hijos1, hijos2])
+    
+    def mutacion_matricial(self, poblacion: np.ndarray) -> np.ndarray:
+        """
+        Mutación de toda la matriz con un solo sorteo de genes a mutar
         
+        Args:
+            poblacion: Matriz de individuos (se modifica en el lugar)
+            
+        Returns:
+            La misma matriz mutada
+        """
+        mutan = self.rng.random(poblacion.shape) < self.tasa_mutacion
+        poblacion[mutan] = self.rng.integers(0, len(self.partidos), mutan.sum())
+        return poblacion
+    
+    def busqueda_local(self, individuo: np.ndarray, max_movimientos: int = 10**6,
+                       tamaño_lote: int = 4096, paciencia: int = 50) -> EvaluadorIncremental:
+        """
+        Ascenso de colina con evaluación incremental
+        
+        En cada paso se evalúa en lote un conjunto aleatorio de movimientos
+        (mitad cambios de partido de una entidad, mitad intercambios entre dos
+        entidades) y se aplica el que más reduce la desviación. Cada movimiento
+        cuesta O(1) gracias a `EvaluadorIncremental`, así que la etapa puede
+        evaluar millones de movimientos.
+        
+        Args:
+            individuo: Asignación inicial
+            max_movimientos: Presupuesto de movimientos evaluados
+            tamaño_lote: Movimientos evaluados por paso
+            paciencia: Lotes seguidos sin mejora antes de detenerse
+            
+        Returns:
+            El evaluador con el individuo refinado
+        """
+        evaluador = EvaluadorIncremental(self.problema, individuo)
+        num_entidades, num_partidos = self.problema.num_entidades, self.problema.num_partidos
+        mitad = max(tamaño_lote // 2, 1)
+        sin_mejora = 0
+        
+        while evaluador.movimientos_evaluados < max_movimientos and sin_mejora < paciencia:
+            entidades = self.rng.integers(0, num_entidades, mitad)
+            destinos = self.rng.integers(0, num_partidos, mitad)
+            delta_mover = evaluador.delta_mover(entidades, destinos)
+            
+            entidades_i = self.rng.integers(0, num_entidades, mitad)
+            entidades_j = self.rng.integers(0, num_entidades, mitad)
+            delta_intercambio = evaluador.delta_intercambio(entidades_i, entidades_j)
+            
+            k_mover, k_intercambio = np.argmin(delta_mover), np.argmin(delta_intercambio)
+            if min(delta_mover[k_mover], delta_intercambio[k_intercambio]) >= -1e-12:
+                sin_mejora += 1
+                continue
+            
+            sin_mejora = 0
+            if delta_mover[k_mover] <= delta_intercambio[k_intercambio]:
+                evaluador.mover(entidades[k_mover], destinos[k_mover])
+            else:
+                evaluador.intercambiar(entidades_i[k_intercambio], entidades_j[k_intercambio])
+        
+        # Eliminar el error de redondeo acumulado en la desviación
+        evaluador.recalcular()
+        return evaluador
+    
+    def refinar_elite(self, poblacion: np.ndarray, fitness: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Refina con búsqueda local a los `elite_size` mejores individuos
+        (solo al mejor si `elite_size` es 0)
+        
+        Args:
+            poblacion: Matriz de individuos
+            fitness: Fitness de cada individuo
+            
+        Returns:
+            (mejor individuo refinado, su fitness)
+        """
+        indices_elite = np.argsort(fitness)[-max(self.elite_size, 1):]
+        refinados = [self.busqueda_local(poblacion[i], self.movimientos_busqueda_local)
+                     for i in indices_elite]
+        mejor = max(refinados, key=lambda evaluador: evaluador.fitness)
+        
+        total_movimientos = sum(evaluador.movimientos_evaluados for evaluador in refinados)
+        print(f"🔎 Búsqueda local sobre la élite: fitness {fitness.max():.6f} → {mejor.fitness:.6f} "
+              f"({total_movimientos:,} movimientos evaluados)")
+        return mejor.individuo, mejor.fitness
+    
+    def diversidad_poblacion(self, poblacion: np.ndarray) -> float:
+        """
+        Diversidad genética de la población, entre 0 (todos iguales) y 1
+        
+        Para cada entidad se calcula el índice de Gini-Simpson de los partidos
+        asignados (probabilidad de que dos individuos al azar difieran en ese
+        gen), normalizado por su máximo 1 - 1/K, y se promedia sobre las
+        entidades. Equivale a la distancia de Hamming media entre pares.
+        
+        Args:
+            poblacion: Matriz de individuos
+            
+        Returns:
+            Diversidad promedio
+        """
+        num_individuos, num_entidades = poblacion.shape
+        num_partidos = self.problema.num_partidos
+        casillas = poblacion + num_partidos * np.arange(num_entidades)
+        frecuencias = np.bincount(casillas.ravel(), minlength=num_entidades * num_partidos) / num_individuos
+        gini_simpson = 1 - (frecuencias.reshape(num_entidades, num_partidos) ** 2).sum(axis=1)
+        return float(gini_simpson.mean() / (1 - 1 / num_partidos))
+    
+    def criterio_parada(self, historia: HistoriaEvolucion, inicio: float,
+                        evaluaciones_por_generacion: int) -> Optional[str]:
+        """
+        Revisa los criterios de parada después de evaluar una generación
+        
+        Args:
+            historia: Historia de la corrida hasta ahora
+            inicio: Instante de inicio (`time.perf_counter()`)
+            evaluaciones_por_generacion: Evaluaciones que costaría otra generación
+            
+        Returns:
+            Motivo de parada ("objetivo", "estancamiento", "tiempo",
+            "evaluaciones") o None para continuar
+        """
+        if self.fitness_objetivo is not None and historia.mejor_fitness[-1] >= self.fitness_objetivo:
+            return "objetivo"
+        paciencia = self.paciencia_estancamiento
+        if paciencia is not None and historia.generaciones > paciencia:
+            mejora = historia.mejor_fitness[-1] - historia.mejor_fitness[-1 - paciencia]
+            if mejora <= self.tolerancia_estancamiento:
+                return "estancamiento"
+        if self.tiempo_maximo is not None and time.perf_counter() - inicio >= self.tiempo_maximo:
+            return "tiempo"
+        if (self.max_evaluaciones is not None
+                and historia.evaluaciones + evaluaciones_por_generacion > self.max_evaluaciones):
+            return "evaluaciones"
+        return None
+    
+    def evolucionar(self, poblacion: np.ndarray, num_generaciones: int, verboso: bool = True,
+                    inicio: Optional[float] = None):
+        """
+        Evoluciona una población matricial durante varias generaciones
+        
+        Args:
+            poblacion: Matriz de individuos inicial
+            num_generaciones: Generaciones a ejecutar
+            verboso: Mostrar el progreso cada 25 generaciones
+            inicio: Instante de inicio de la corrida; si se indica se aplican los
+                criterios de parada (`criterio_parada`)
+            
+        Returns:
+            (población final, su fitness, historia de la evolución)
+        """
+        num_hijos = len(poblacion) - self.elite_size
+        historia = HistoriaEvolucion()
+        
+        for generacion in range(num_generaciones):
+            # Evaluar fitness de toda la población
+            fitness = self.fitness_poblacion(poblacion)
+            historia.registrar(fitness, self.diversidad_poblacion(poblacion))
+            
+            if verboso and generacion % 25 == 0:
+                print(f"Generación {generacion:3d}: Mejor fitness = {fitness.max():.6f}, "
+                      f"Promedio = {fitness.mean():.6f}, Diversidad = {historia.diversidad[-1]:.3f}")
+            
+            if inicio is not None:
+                motivo = self.criterio_parada(historia, inicio, len(poblacion))
+                if motivo is not None:
+                    historia.motivo_parada = motivo
+                    return poblacion, fitness, historia
+            
+            # Elitismo
+            if self.elite_size:
+                elite = poblacion[np.argpartition(fitness, -self.elite_size)[-self.elite_size:]]
+            else:
+                elite = poblacion[:0]
+            
+            # Selección, cruzamiento y mutación de todos los hijos en lote
+            num_parejas = (num_hijos + 1) // 2
+            padres1 = self.seleccion_torneo_matricial(poblacion, fitness, num_parejas)
+            padres2 = self.seleccion_torneo_matricial(poblacion, fitness, num_parejas)
+            hijos = self.mutacion_matricial(self.cruzamiento_matricial(padres1, padres2)[:num_hijos])
+            
+            poblacion = np.concatenate([elite, hijos])
+        
+        fitness = self.fitness_poblacion(poblacion)
+        historia.evaluaciones += len(poblacion)
+        return poblacion, fitness, historia
+    
+    def _algoritmo_genetico_matricial(self, inicio: float):
+        """
+        Motor del AG con la población completa en una matriz de enteros
+        
+        Returns:
+            (historia de la evolución, población final, su fitness)
+        """
+        poblacion, fitness, historia = self.evolucionar(self.poblacion_inicial(self.tamaño_poblacion),
+                                                        self.num_generaciones, inicio=inicio)
+        return historia, poblacion, fitness
+    
+    def migrar(self, poblaciones: List[np.ndarray], fitness: List[np.ndarray]):
+        """
+        Envía los mejores individuos de cada isla a sus vecinas
+        
+        Los migrantes reemplazan a los peores individuos de la isla que los
+        recibe. Las islas se modifican en el lugar.
+        
+        Args:
+            poblaciones: Matriz de individuos de cada isla
+            fitness: Fitness de cada isla
+        """
+        origenes = TOPOLOGIAS_MIGRACION[self.topologia_migracion]
+        mejores = [np.argsort(fit)[-self.num_migrantes:] for fit in fitness]
+        migrantes = [(pob[idx].copy(), fit[idx].copy()) for pob, fit, idx in zip(poblaciones, fitness, mejores)]
+        
+        for destino in range(len(poblaciones)):
+            entrantes = [migrantes[origen] for origen in origenes(destino, len(poblaciones))]
+            individuos = np.concatenate([individuos for individuos, _ in entrantes])
+            fitness_entrantes = np.concatenate([fit for _, fit in entrantes])
+            peores = np.argsort(fitness[destino])[:len(individuos)]
+            poblaciones[destino][peores] = individuos
+            fitness[destino][peores] = fitness_entrantes
+    
+    def _algoritmo_genetico_islas(self, inicio: float):
+        """
+        Modelo de islas: `num_islas` poblaciones evolucionan en procesos trabajadores
+        
+        Cada época evoluciona todas las islas `intervalo_migracion` generaciones
+        en paralelo y luego migran los mejores individuos según la topología.
+        La historia combinada registra, por generación, el mejor fitness de
+        todas las islas y el promedio de todas las poblaciones. Los criterios
+        de parada se revisan al final de cada época. Una época de g generaciones
+        cuesta `num_islas * tamaño_poblacion * (g + 1)` evaluaciones (cada isla
+        evalúa además su población final), así que con `max_evaluaciones` la
+        época se acorta para caber en el presupuesto restante.
+        
+        Returns:
+            (historia de la evolución, población final de todas las islas, su fitness)
+        """
+        poblaciones = [self.poblacion_inicial(self.tamaño_poblacion) for _ in range(self.num_islas)]
+        historia = HistoriaEvolucion()
+        
+        # Cada isla tiene su propio flujo aleatorio, que viaja con ella entre
+        # épocas: el resultado no depende de qué trabajador ejecute cada isla
+        generadores = self.generadores_hijos(self.num_islas)
+        
+        evaluaciones_generacion = self.num_islas * self.tamaño_poblacion
+        
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_iniciar_trabajador_isla,
+                                 initargs=(self,)) as executor:
+            generacion = 0
+            while generacion < self.num_generaciones:
+                generaciones_epoca = min(self.intervalo_migracion, self.num_generaciones - generacion)
+                if self.max_evaluaciones is not None:
+                    # La primera época corre al menos una generación, como los demás motores
+                    restantes = self.max_evaluaciones - historia.evaluaciones
+                    generaciones_epoca = max(1, min(generaciones_epoca,
+                                                    restantes // evaluaciones_generacion - 1))
+                resultados = list(executor.map(_evolucionar_isla, poblaciones,
+                                               [generaciones_epoca] * self.num_islas, generadores))
+                
+                generadores = [resultado[3] for resultado in resultados]
+                poblaciones = [resultado[0] for resultado in resultados]
+                fitness = [resultado[1] for resultado in resultados]
+                historia.extender(HistoriaEvolucion.combinar([resultado[2] for resultado in resultados]))
+                generacion += generaciones_epoca
+                
+                print(f"Generación {generacion:3d}: Mejor fitness por isla = "
+                      f"{' '.join(f'{fit.max():.6f}' for fit in fitness)}, "
+                      f"Diversidad = {historia.diversidad[-1]:.3f}")
+                
+                # La época más corta posible (una generación) cuesta dos evaluaciones por individuo
+                motivo = self.criterio_parada(historia, inicio, 2 * evaluaciones_generacion)
+                if motivo is not None:
+                    historia.motivo_parada = motivo
+                    break
+                
+                if generacion < self.num_generaciones and self.num_islas > 1:
+                    self.migrar(poblaciones, fitness)
+        
+        return historia, np.concatenate(poblaciones), np.concatenate(fitness)
+    
+    def _algoritmo_genetico_lista(self, inicio: float):
+        """
+        Motor de referencia: población como lista, individuo por individuo
+        
+        Returns:
+            (historia de la evolución, población final, su fitness)
+        """
         # Crear población inicial
-        poblacion = [self.crear_individuo() for _ in range(self.tamaño_poblacion)]
+        if self.siembra is None:
+            poblacion = [self.crear_individuo() for _ in range(self.tamaño_poblacion)]
+        else:
+            poblacion = [individuo.astype(int) for individuo in self.poblacion_inicial(self.tamaño_poblacion)]
         
-        mejor_fitness_historia = []
-        fitness_promedio_historia = []
+        historia = HistoriaEvolucion()
         
         for generacion in range(self.num_generaciones):
             # Evaluar fitness
             fitness_scores = [self.calcular_fitness(individuo) for individuo in poblacion]
-            
-            # Estadísticas
-            mejor_fitness = max(fitness_scores)
-            fitness_promedio = np.mean(fitness_scores)
-            
-            mejor_fitness_historia.append(mejor_fitness)
-            fitness_promedio_historia.append(fitness_promedio)
+            historia.registrar(fitness_scores, self.diversidad_poblacion(np.array(poblacion)))
             
             # Mostrar progreso cada 25 generaciones
             if generacion % 25 == 0:
-                print(f"Generación {generacion:3d}: Mejor fitness = {mejor_fitness:.6f}, "
-                      f"Promedio = {fitness_promedio:.6f}")
+                print(f"Generación {generacion:3d}: Mejor fitness = {historia.mejor_fitness[-1]:.6f}, "
+                      f"Promedio = {historia.fitness_promedio[-1]:.6f}, "
+                      f"Diversidad = {historia.diversidad[-1]:.3f}")
+            
+            motivo = self.criterio_parada(historia, inicio, len(poblacion))
+            if motivo is not None:
+                historia.motivo_parada = motivo
+                return historia, np.array(poblacion), np.array(fitness_scores)
             
             # Elitismo: conservar los mejores individuos
             indices_elite = np.argsort(fitness_scores)[-self.elite_size:]
@@ -350,18 +1126,68 @@ class SistemaDemocraticoAG:
             # Mantener tamaño de población
             poblacion = nueva_poblacion[:self.tamaño_poblacion]
         
-        # Encontrar la mejor solución final
         fitness_final = [self.calcular_fitness(individuo) for individuo in poblacion]
-        mejor_individuo = poblacion[np.argmax(fitness_final)]
-        mejor_fitness_final = max(fitness_final)
+        historia.evaluaciones += len(poblacion)
+        return historia, np.array(poblacion), np.array(fitness_final)
+    
+    def algoritmo_genetico(self):
+        """
+        Ejecuta el algoritmo genético para optimizar la distribución del poder
+        
+        Usa el motor indicado en `self.motor`: "matricial" (toda la población
+        en una matriz, operadores por lotes) o "lista" (implementación de
+        referencia, individuo por individuo). Con `num_islas > 1` se ejecuta el
+        modelo de islas en procesos trabajadores (siempre con el motor matricial).
+        
+        La corrida termina al completar `num_generaciones` o antes si se cumple
+        algún criterio de parada (estancamiento, fitness objetivo, tiempo o
+        evaluaciones).
+        
+        Returns:
+            HistoriaEvolucion con el motivo de parada; se desempaqueta como
+            (historia del mejor fitness, historia del fitness promedio)
+        """
+        print("🧬 EJECUTANDO ALGORITMO GENÉTICO")
+        print("=" * 50)
+        print(f"Parámetros:")
+        print(f"• Tamaño población: {self.tamaño_poblacion}")
+        print(f"• Generaciones: {self.num_generaciones}")
+        print(f"• Tasa mutación: {self.tasa_mutacion}")
+        print(f"• Tasa cruce: {self.tasa_cruce}")
+        print(f"• Motor: {self.motor}")
+        if self.siembra is not None:
+            print(f"• Siembra: {self.siembra} ({self.fraccion_siembra:.0%} de la población)")
+        if self.num_islas > 1:
+            print(f"• Islas: {self.num_islas} (topología {self.topologia_migracion}, "
+                  f"{self.num_migrantes} migrantes cada {self.intervalo_migracion} generaciones)")
+        print()
+        
+        inicio = time.perf_counter()
+        if self.num_islas > 1:
+            historia, poblacion, fitness_final = self._algoritmo_genetico_islas(inicio)
+        elif self.motor == "matricial":
+            historia, poblacion, fitness_final = self._algoritmo_genetico_matricial(inicio)
+        elif self.motor == "lista":
+            historia, poblacion, fitness_final = self._algoritmo_genetico_lista(inicio)
+        else:
+            raise ValueError(f"Motor desconocido: {self.motor!r} (use 'matricial' o 'lista')")
+        historia.segundos = time.perf_counter() - inicio
+        
+        # Encontrar la mejor solución final
+        mejor_individuo = poblacion[np.argmax(fitness_final)].astype(int)
+        mejor_fitness_final = fitness_final.max()
+        if self.movimientos_busqueda_local > 0:
+            mejor_individuo, mejor_fitness_final = self.refinar_elite(poblacion, fitness_final)
         
         print(f"\n✅ Algoritmo completado!")
         print(f"Mejor fitness final: {mejor_fitness_final:.6f}")
+        print(f"Parada: {historia.motivo_parada} ({historia.generaciones} generaciones, "
+              f"{historia.evaluaciones:,} evaluaciones, {historia.segundos:.2f} s)")
         
         # Guardar matriz de poder
         self.matriz_poder = mejor_individuo
         
-        return mejor_fitness_historia, fitness_promedio_historia
+        return historia
     
     def analizar_distribucion(self):
         """
@@ -375,15 +1201,9 @@ class SistemaDemocraticoAG:
         print("=" * 60)
         
         # Calcular poder por partido
-        poder_por_partido = np.zeros(len(self.partidos))
-        entidades_por_partido = [[] for _ in range(len(self.partidos))]
-        
-        for i, partido_asignado in enumerate(self.matriz_poder):
-            entidad = self.entidades[i]
-            poder_por_partido[partido_asignado] += entidad.peso_poder
-            entidades_por_partido[partido_asignado].append(entidad)
-        
-        poder_total = poder_por_partido.sum()
+        poder_por_partido = self.problema.poder_por_partido(self.matriz_poder)
+        num_entidades_por_partido = np.bincount(self.matriz_poder, minlength=self.problema.num_partidos)
+        poder_total = self.problema.poder_total
         
         print("🏆 DISTRIBUCIÓN DEL PODER POR PARTIDO:")
         print(f"{'Partido':<20} {'Curules':<8} {'%Parl':<6} {'Poder':<8} {'%Poder':<7} {'Diferencia':<10} {'Entidades':<10}")
@@ -392,7 +1212,7 @@ class SistemaDemocraticoAG:
         for i, partido in enumerate(self.partidos):
             porcentaje_poder = (poder_por_partido[i] / poder_total) * 100
             diferencia = porcentaje_poder - partido.porcentaje_representacion
-            num_entidades = len(entidades_por_partido[i])
+            num_entidades = num_entidades_por_partido[i]
             
             print(f"{partido.nombre:<20} {partido.curules:<8} {partido.porcentaje_representacion:<6.1f} "
                   f"{poder_por_partido[i]:<8.0f} {porcentaje_poder:<7.1f} {diferencia:<+10.1f} {num_entidades:<10}")
@@ -402,15 +1222,16 @@ class SistemaDemocraticoAG:
         # Mostrar entidades por partido
         print(f"\n🏢 ENTIDADES ASIGNADAS POR PARTIDO:")
         for i, partido in enumerate(self.partidos):
-            print(f"\n{partido.nombre} ({len(entidades_por_partido[i])} entidades):")
-            entidades_ordenadas = sorted(entidades_por_partido[i], 
-                                       key=lambda x: x.peso_poder, reverse=True)
+            print(f"\n{partido.nombre} ({num_entidades_por_partido[i]} entidades):")
+            indices = np.flatnonzero(self.matriz_poder == i)
+            indices_ordenados = indices[np.argsort(-self.problema.pesos[indices], kind="stable")]
             
-            for entidad in entidades_ordenadas[:10]:  # Mostrar top 10
+            for j in indices_ordenados[:10]:  # Mostrar top 10
+                entidad = self.entidades[j]
                 print(f"  • {entidad.nombre:<35} {entidad.peso_poder:3d} puntos ({entidad.categoria})")
             
-            if len(entidades_ordenadas) > 10:
-                print(f"  ... y {len(entidades_ordenadas) - 10} entidades más")
+            if len(indices_ordenados) > 10:
+                print(f"  ... y {len(indices_ordenados) - 10} entidades más")
     
     def visualizar_resultados(self, historia_fitness):
         """
@@ -424,7 +1245,7 @@ class SistemaDemocraticoAG:
         colores = [p.color for p in self.partidos]
         
         ax1.pie(curules, labels=nombres, colors=colores, autopct='%1.1f%%', startangle=90)
-        ax1.set_title('Composición del Congreso\n(50 curules)', fontsize=12, fontweight='bold')
+        ax1.set_title(f'Composición del Congreso\n({sum(curules)} curules)', fontsize=12, fontweight='bold')
         
         # 2. Evolución del fitness
         mejor_fitness, fitness_promedio = historia_fitness
@@ -435,18 +1256,24 @@ class SistemaDemocraticoAG:
         ax2.set_xlabel('Generación')
         ax2.set_ylabel('Fitness')
         ax2.set_title('Evolución del Algoritmo Genético', fontweight='bold')
-        ax2.legend()
+        diversidad = getattr(historia_fitness, "diversidad", None)
+        if diversidad:
+            ax2b = ax2.twinx()
+            ax2b.plot(generations, diversidad, 'g:', linewidth=1, label='Diversidad')
+            ax2b.set_ylabel('Diversidad')
+            ax2b.set_ylim(0, 1)
+            lineas, etiquetas = ax2.get_legend_handles_labels()
+            lineas_b, etiquetas_b = ax2b.get_legend_handles_labels()
+            ax2.legend(lineas + lineas_b, etiquetas + etiquetas_b)
+        else:
+            ax2.legend()
         ax2.grid(True, alpha=0.3)
         
         # 3. Distribución del poder
         if self.matriz_poder is not None:
-            poder_por_partido = np.zeros(len(self.partidos))
-            for i, partido_asignado in enumerate(self.matriz_poder):
-                poder_por_partido[partido_asignado] += self.entidades[i].peso_poder
-            
-            poder_total = poder_por_partido.sum()
-            porcentaje_poder = (poder_por_partido / poder_total) * 100
-            porcentaje_parlamento = [p.porcentaje_representacion for p in self.partidos]
+            poder_por_partido = self.problema.poder_por_partido(self.matriz_poder)
+            porcentaje_poder = (poder_por_partido / self.problema.poder_total) * 100
+            porcentaje_parlamento = self.problema.proporcion_ideal * 100
             
             x = np.arange(len(self.partidos))
             width = 0.35
@@ -466,7 +1293,7 @@ class SistemaDemocraticoAG:
             ax3.grid(True, alpha=0.3, axis='y')
             
             # 4. Diferencias (proporcionalidad)
-            diferencias = porcentaje_poder - np.array(porcentaje_parlamento)
+            diferencias = porcentaje_poder - porcentaje_parlamento
             colors = ['green' if d >= 0 else 'red' for d in diferencias]
             
             bars = ax4.bar(range(len(diferencias)), diferencias, color=colors, alpha=0.7)
@@ -490,22 +1317,97 @@ class SistemaDemocraticoAG:
                    dpi=300, bbox_inches='tight')
         plt.show()
 
-def main():
+# Sistema del proceso trabajador (se recibe una vez al crear el pool)
+_SISTEMA_TRABAJADOR = None
+
+def _iniciar_trabajador_isla(sistema):
+    """Guarda el sistema en el proceso trabajador"""
+    global _SISTEMA_TRABAJADOR
+    _SISTEMA_TRABAJADOR = sistema
+
+def _evolucionar_isla(poblacion, num_generaciones, rng):
+    """
+    Evoluciona una isla durante una época en el proceso trabajador
+    
+    Los criterios de parada los revisa el proceso principal entre épocas.
+    
+    Args:
+        poblacion: Matriz de individuos de la isla
+        num_generaciones: Generaciones de la época
+        rng: Generador de la isla
+    
+    Returns:
+        Lo mismo que `SistemaDemocraticoAG.evolucionar`, más el generador de
+        la isla con su estado avanzado
+    """
+    _SISTEMA_TRABAJADOR.rng = rng
+    return _SISTEMA_TRABAJADOR.evolucionar(poblacion, num_generaciones, verboso=False) + (rng,)
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Distribución democrática del poder con AG")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--motor", choices=["matricial", "lista"], default="matricial")
+    parser.add_argument("--poblacion", type=int, default=100, help="Tamaño de la población")
+    parser.add_argument("--generaciones", type=int, default=200)
+    parser.add_argument("--busqueda-local", type=int, default=0,
+                        help="Movimientos de búsqueda local por individuo élite (0 = sin refinar)")
+    parser.add_argument("--islas", type=int, default=1, help="Número de islas (1 = sin islas)")
+    parser.add_argument("--migracion-cada", type=int, default=20,
+                        help="Generaciones entre migraciones")
+    parser.add_argument("--migrantes", type=int, default=2, help="Migrantes que envía cada isla")
+    parser.add_argument("--topologia", choices=list(TOPOLOGIAS_MIGRACION), default="anillo")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--siembra", choices=list(CONSTRUCTIVOS),
+                        help="Sembrar la población inicial con una solución constructiva")
+    parser.add_argument("--lineas-base", action="store_true",
+                        help="Mostrar las soluciones constructivas antes del AG")
+    parser.add_argument("--paciencia", type=int,
+                        help="Detener tras N generaciones sin mejora del mejor fitness")
+    parser.add_argument("--fitness-objetivo", type=float, help="Detener al alcanzar este fitness")
+    parser.add_argument("--tiempo-maximo", type=float, help="Presupuesto de tiempo en segundos")
+    parser.add_argument("--max-evaluaciones", type=int, help="Presupuesto de evaluaciones de fitness")
+    parser.add_argument("--partidos", type=int, default=5, help="Número de partidos")
+    parser.add_argument("--entidades", type=int, default=50, help="Número de entidades")
+    parser.add_argument("--curules", type=int, default=50)
+    return parser
+
+def main(argv=None):
     """
     Función principal del sistema democrático
     """
+    args = build_parser().parse_args(argv)
+    
     print("🗳️ SISTEMA DE DISTRIBUCIÓN DEMOCRÁTICA DEL PODER")
     print("=" * 60)
     print("Simulación de reparto de poder político usando Algoritmos Genéticos")
     print("=" * 60)
     
     # Crear sistema
-    sistema = SistemaDemocraticoAG(semilla=42)
+    sistema = SistemaDemocraticoAG(semilla=args.semilla, num_partidos=args.partidos,
+                                   num_entidades=args.entidades, num_curules=args.curules)
+    sistema.motor = args.motor
+    sistema.tamaño_poblacion = args.poblacion
+    sistema.num_generaciones = args.generaciones
+    sistema.movimientos_busqueda_local = args.busqueda_local
+    sistema.num_islas = args.islas
+    sistema.intervalo_migracion = args.migracion_cada
+    sistema.num_migrantes = args.migrantes
+    sistema.topologia_migracion = args.topologia
+    sistema.workers = args.workers
+    sistema.siembra = args.siembra
+    sistema.paciencia_estancamiento = args.paciencia
+    sistema.fitness_objetivo = args.fitness_objetivo
+    sistema.tiempo_maximo = args.tiempo_maximo
+    sistema.max_evaluaciones = args.max_evaluaciones
     
     # Mostrar configuración inicial
     sistema.mostrar_congreso()
     sistema.mostrar_entidades()
     
+    if args.lineas_base:
+        sistema.comparar_constructivos()
+    
     # Ejecutar algoritmo genético
     historia_fitness = sistema.algoritmo_genetico()
     
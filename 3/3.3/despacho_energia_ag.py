@@ -15,15 +15,21 @@ Fecha: Julio 2025
 
 import numpy as np
 import matplotlib.pyplot as plt
-import random
 
 class DespachoEnergiaAG:
     """
     Sistema de despacho óptimo de energía usando Algoritmos Genéticos
     """
     
-    def __init__(self):
-        """Inicializa el sistema de despacho de energía"""
+    def __init__(self, semilla=None):
+        """
+        Inicializa el sistema de despacho de energía
+        
+        Args:
+            semilla: Semilla del generador aleatorio de la instancia (None = no reproducible)
+        """
+        # Generador propio de la instancia (no usa el estado global de random)
+        self.rng = np.random.default_rng(semilla)
         
         # Configuración del problema
         self.plantas = ['Planta C', 'Planta B', 'Planta M', 'Planta B2']
@@ -98,7 +104,7 @@ class DespachoEnergiaAG:
                     # Asignar la menor cantidad entre capacidad disponible y demanda pendiente
                     cantidad = min(cap_disponible[planta], dem_pendiente[ciudad])
                     # Agregar aleatoriedad (0% a 100% de la cantidad posible)
-                    cantidad = random.uniform(0, cantidad)
+                    cantidad = self.rng.uniform(0, cantidad)
                     
                     distribucion[planta, ciudad] = cantidad
                     cap_disponible[planta] -= cantidad
@@ -174,7 +180,8 @@ class DespachoEnergiaAG:
     
     def seleccion_torneo(self, poblacion, fitness_scores, tamaño_torneo=3):
         """Selección por torneo"""
-        participantes = random.sample(list(zip(poblacion, fitness_scores)), tamaño_torneo)
+        participantes = [(poblacion[i], fitness_scores[i])
+                         for i in self.rng.choice(len(poblacion), tamaño_torneo, replace=False)]
         ganador = max(participantes, key=lambda x: x[1])
         return ganador[0].copy()
     
@@ -185,11 +192,11 @@ class DespachoEnergiaAG:
         Returns:
             Dos hijos como combinación de los padres
         """
-        if random.random() > self.tasa_cruce:
+        if self.rng.random() > self.tasa_cruce:
             return padre1.copy(), padre2.copy()
         
         # Cruzamiento aritmético con peso aleatorio
-        alpha = random.uniform(0, 1)
+        alpha = self.rng.uniform(0, 1)
         hijo1 = alpha * padre1 + (1 - alpha) * padre2
         hijo2 = (1 - alpha) * padre1 + alpha * padre2
         
@@ -209,12 +216,12 @@ class DespachoEnergiaAG:
         individuo_mutado = individuo.copy()
         
         # Aplicar mutación con cierta probabilidad
-        if random.random() < self.tasa_mutacion:
+        if self.rng.random() < self.tasa_mutacion:
             # Seleccionar posiciones aleatorias para mutar
-            for _ in range(random.randint(1, 3)):
-                i, j = random.randint(0, 3), random.randint(0, 3)
+            for _ in range(self.rng.integers(1, 4)):
+                i, j = self.rng.integers(0, 4, 2)
                 # Pequeña variación aleatoria
-                variacion = random.uniform(-0.5, 0.5)
+                variacion = self.rng.uniform(-0.5, 0.5)
                 individuo_mutado[i, j] += variacion
                 
                 # Asegurar no negativos